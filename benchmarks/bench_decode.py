@@ -0,0 +1,53 @@
+"""Compare the cost of decoding large game pages.
+
+Run with ``python -m benchmarks.bench_decode``.
+"""
+import json
+import timeit
+from typing import Any, Callable
+
+from pybomb.decoder import get_default_decoder
+from .stub_server import make_result
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+
+def make_page() -> bytes:
+    """Create the body of a full page of games, with descriptions."""
+    return json.dumps(
+        {
+            "error": "OK",
+            "number_of_page_results": PAGE_SIZE,
+            "number_of_total_results": 10000,
+            "status_code": 1,
+            "results": [make_result(id_) for id_ in range(PAGE_SIZE)],
+        }
+    ).encode()
+
+
+def time_decode(decode: Callable[[], Any]) -> float:
+    """Return the mean time taken to decode the page, in milliseconds."""
+    return timeit.timeit(decode, number=ROUNDS) / ROUNDS * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    body = make_page()
+    decoder = get_default_decoder()
+    print(f"page size: {len(body) / 1024:.0f}KB")
+
+    def decode_twice() -> None:
+        json.loads(body)
+        json.loads(body)
+
+    print(f"json, decoded twice: {time_decode(decode_twice):.2f}ms")
+    print(f"json, decoded once: {time_decode(lambda: json.loads(body)):.2f}ms")
+    print(
+        f"{decoder.__module__}, decoded once: "
+        f"{time_decode(lambda: decoder(body)):.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
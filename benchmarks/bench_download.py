@@ -0,0 +1,51 @@
+"""Measure the throughput of mirroring images concurrently.
+
+Downloads the cover art of a page of games one by one, as a script would,
+and with an `ImageDownloader`.
+
+Run with ``python -m benchmarks.bench_download``.
+"""
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from pybomb.download import ImageDownloader
+from pybomb.session import create_session
+from .stub_server import StubServer
+
+IMAGES = 200
+
+
+def sequential(server: StubServer, directory: str) -> None:
+    """Download each image in turn, reading it whole before writing it."""
+    session = create_session()
+    for id_ in range(IMAGES):
+        with open(f"{directory}/{id_}.jpg", "wb") as file:
+            file.write(session.get(server.image_url(id_)).content)
+
+
+def concurrent(server: StubServer, directory: str) -> None:
+    """Download the images with a downloader, printing its stats."""
+    results: List[Dict[str, Any]] = [
+        {"image": {"original_url": server.image_url(id_)}} for id_ in range(IMAGES)
+    ]
+    stats = ImageDownloader(directory, workers=16).download(results)
+    print(
+        f"  {stats.downloaded} files, {stats.files_per_second:.0f} files/s, "
+        f"{stats.bytes_per_second / 1024 ** 2:.1f}MiB/s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(latency=0.02) as server:
+        for name, download in (("sequential", sequential), ("downloader", concurrent)):
+            with tempfile.TemporaryDirectory() as directory:
+                start = time.perf_counter()
+                download(server, directory)
+                elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed:.2f}s for {IMAGES} images")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measure the overhead of event hooks on each call.
+
+Calls are answered from a warm cache, so the time measured is the client's
+own work rather than the network.
+
+Run with ``python -m benchmarks.bench_events``.
+"""
+import timeit
+from typing import Optional
+
+from pybomb.cache import MemoryCache
+from pybomb.clients.games_client import GamesClient
+from pybomb.events import CallEvent, EventHooks
+from pybomb.response import Response
+
+CALLS = 50_000
+
+
+def time_calls(events: Optional[EventHooks]) -> float:
+    """Return the mean time of a cached search, in microseconds."""
+    client = GamesClient("key", cache=MemoryCache(), events=events)
+    client.URI_BASE = "http://127.0.0.1:1/api/"
+    key = client._cache_key({"filter": "name:game", "api_key": "key", "format": "json"})
+    if key is None:
+        raise RuntimeError("The search cannot be cached")
+    client._cache.set("games", key, Response("uri", 0, 0, [], None), 0)  # type: ignore
+
+    def search() -> None:
+        client._query({"filter": "name:game"})
+
+    return timeit.timeit(search, number=CALLS) / CALLS * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    def listener(event: CallEvent) -> None:
+        pass
+
+    print(f"no hooks: {time_calls(None):.2f}us")
+    print(f"hooks without listeners: {time_calls(EventHooks()):.2f}us")
+    print(f"hooks with a listener: {time_calls(EventHooks([listener])):.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure the calls and time saved by expanding references in batches.
+
+A page showing a game lists its similar games, with their decks. Without
+expansion, each similar game is fetched on its own.
+
+Run with ``python -m benchmarks.bench_expand``.
+"""
+import time
+from typing import Any, List
+
+from pybomb.clients.game_client import GameClient
+from pybomb.events import CallEvent, EventHooks
+from .stub_server import StubServer
+
+PAGES = 50
+
+
+def similar_decks(client: GameClient, id_: int, expand: bool) -> List[Any]:
+    """Fetch a game, and the decks of its similar games."""
+    if expand:
+        game = client.fetch(id_, expand=["similar_games"]).results[0]
+        return [similar["deck"] for similar in game["similar_games"]]
+
+    game = client.fetch(id_).results[0]
+    return [
+        client.fetch(similar["id"]).results[0]["deck"]
+        for similar in game["similar_games"]
+    ]
+
+
+def run(server: StubServer, expand: bool) -> None:
+    """Show the pages, and print the calls made and the time taken."""
+    calls = []
+
+    def listener(event: CallEvent) -> None:
+        calls.append(event)
+
+    client = GameClient("key", events=EventHooks([listener]))
+    client.URI_BASE = server.uri_base
+
+    start = time.perf_counter()
+    for id_ in range(PAGES):
+        similar_decks(client, id_, expand)
+    elapsed = time.perf_counter() - start
+
+    name = "expanded" if expand else "fetched one by one"
+    print(
+        f"{name}: {len(calls) / PAGES:.0f} calls per page, "
+        f"{elapsed / PAGES * 1e3:.2f}ms per page"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(latency=0.005) as server:
+        run(server, False)
+        run(server, True)
+
+
+if __name__ == "__main__":
+    main()
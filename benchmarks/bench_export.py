@@ -0,0 +1,72 @@
+"""Compare the peak memory of dumping a catalog of games to Parquet.
+
+Run with ``python -m benchmarks.bench_export``.
+"""
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+import pyarrow
+import pyarrow.parquet
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.decoder import get_default_decoder
+from pybomb.export import ParquetSink, schema_for, to_record_batch
+from .stub_server import make_result
+
+GAMES = 50_000
+PAGE_SIZE = 100
+
+
+def measure(dump: Callable[[str], None]) -> None:
+    """Dump the catalog, printing the peak MB traced and the seconds taken."""
+    with tempfile.TemporaryDirectory() as directory:
+        where = os.path.join(directory, "games.parquet")
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        dump(where)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(where)
+
+    print(
+        f"{dump.__name__}: peak {peak / 1024 / 1024:.1f}MB, "
+        f"{size / 1024 / 1024:.1f}MB file, written in {elapsed:.2f}s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    pages = [
+        json.dumps(
+            {"results": [make_result(id_) for id_ in range(start, start + PAGE_SIZE)]}
+        ).encode()
+        for start in range(0, GAMES, PAGE_SIZE)
+    ]
+    decoder = get_default_decoder()
+    schema = schema_for(GamesClient("key"), list(make_result(0)))
+
+    def all_rows(where: str) -> None:
+        results: List[dict] = [
+            result for page in pages for result in decoder(page)["results"]
+        ]
+        table = pyarrow.Table.from_batches([to_record_batch(results, schema)])
+        pyarrow.parquet.write_table(table, where)
+
+    def streamed(where: str) -> None:
+        with ParquetSink(where, schema) as sink:
+            for page in pages:
+                sink.write_page(decoder(page)["results"])
+
+    measure(all_rows)
+    measure(streamed)
+
+
+if __name__ == "__main__":
+    main()
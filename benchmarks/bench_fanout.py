@@ -0,0 +1,44 @@
+"""Measure how a full crawl scales with the number of concurrent page fetches.
+
+Run with ``python -m benchmarks.bench_fanout``.
+"""
+import time
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.session import create_session
+from .stub_server import StubServer
+
+LATENCY = 0.05
+TOTAL_RESULTS = 2000
+PAGE_SIZE = 100
+
+
+def run(server: StubServer, workers: int) -> float:
+    """Walk every page of a search and return the wall-clock time taken."""
+    client = GamesClient("key", session=create_session(pool_maxsize=workers))
+    client.URI_BASE = server.uri_base
+
+    start = time.perf_counter()
+    count = sum(
+        1
+        for _ in client.iter_search(
+            {"name": "game"}, page_size=PAGE_SIZE, workers=workers
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    if count != TOTAL_RESULTS:
+        raise RuntimeError(f"Found {count} of {TOTAL_RESULTS} results")
+
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(latency=LATENCY, total_results=TOTAL_RESULTS) as server:
+        for workers in (1, 2, 4, 8, 16):
+            print(f"workers={workers}: {run(server, workers):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
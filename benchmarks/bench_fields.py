@@ -0,0 +1,61 @@
+"""Measure the payload and time saved by requesting only the fields read.
+
+A page showing a game reads four of its fields. Without a profiler, every
+fetch downloads and decodes all of them.
+
+Run with ``python -m benchmarks.bench_fields``.
+"""
+import time
+from typing import List, Optional
+
+from pybomb.clients.game_client import GameClient
+from pybomb.events import CallEvent, EventHooks
+from pybomb.fields import FieldProfiler
+from .stub_server import StubServer
+
+FETCHES = 500
+
+
+def show_game(client: GameClient, id_: int) -> None:
+    """Fetch a game and read the fields a page showing it would."""
+    game = client.fetch(id_).results[0]
+    for field in ("name", "deck", "image", "platforms"):
+        game[field]
+
+
+def run(server: StubServer, profiler: Optional[FieldProfiler]) -> None:
+    """Show the games, and print the bytes received and the times taken."""
+    received: List[int] = []
+    decoding: List[float] = []
+
+    def listener(event: CallEvent) -> None:
+        received.append(event.bytes_received)
+        decoding.extend(
+            phase.duration for phase in event.phases if phase.name == "decode"
+        )
+
+    client = GameClient("key", events=EventHooks([listener]), field_profiler=profiler)
+    client.URI_BASE = server.uri_base
+
+    start = time.perf_counter()
+    for id_ in range(FETCHES):
+        show_game(client, id_)
+    elapsed = time.perf_counter() - start
+
+    name = "with profiler" if profiler is not None else "without profiler"
+    print(
+        f"{name}: {sum(received) / len(received) / 1024:.1f}KiB per fetch, "
+        f"decoded in {sum(decoding) / len(decoding) * 1e6:.0f}us, "
+        f"{elapsed / FETCHES * 1e3:.2f}ms per fetch"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer() as server:
+        run(server, None)
+        run(server, FieldProfiler())
+
+
+if __name__ == "__main__":
+    main()
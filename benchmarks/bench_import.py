@@ -0,0 +1,69 @@
+"""Measure the cost of importing PyBomb and of creating clients.
+
+Exits with an error if importing PyBomb imports any of the libraries only
+needed once a client is used, as that would undo the lazy imports.
+
+Run with ``python -m benchmarks.bench_import``.
+"""
+import statistics
+import subprocess  # noqa: S404
+import sys
+import timeit
+from typing import List
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.session import create_session
+
+IMPORT_ROUNDS = 10
+CLIENTS = 1000
+# Libraries only imported once a client is used
+LAZY_MODULES = ("requests", "aiohttp", "orjson", "pyarrow", "opentelemetry")
+
+
+def time_import(statement: str) -> float:
+    """Return the median time to run the statement in a new interpreter, in ms."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; "
+        "print(time.perf_counter() - start)"
+    )
+    times = [
+        float(subprocess.check_output([sys.executable, "-c", code]))  # noqa: S603
+        for _ in range(IMPORT_ROUNDS)
+    ]
+
+    return statistics.median(times) * 1000
+
+
+def eager_modules() -> List[str]:
+    """Return the lazy modules imported by importing PyBomb in a new interpreter."""
+    code = (
+        "import sys; import pybomb; "
+        f"print(*(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])  # noqa: S603
+
+    return output.decode().split()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    eager = eager_modules()
+    if eager:
+        sys.exit(f"import pybomb imported {', '.join(eager)}")
+
+    print(f"import pybomb: {time_import('import pybomb'):.1f}ms")
+    print(
+        "import pybomb and a sync client: "
+        f"{time_import('import pybomb; pybomb.GamesClient'):.1f}ms"
+    )
+
+    session = create_session()
+    per_client = timeit.timeit(
+        lambda: GamesClient("key", session=session), number=CLIENTS
+    )
+    print(f"create a client: {per_client / CLIENTS * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure searches answered from a local catalog against the network.
+
+The store holds a mirror of 50,000 games. Searches of the live API are made
+against the stub server, with the latency of a GB API call.
+
+Run with ``python -m benchmarks.bench_local``.
+"""
+import os
+import tempfile
+import time
+import timeit
+from functools import partial
+from typing import Any, Dict
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.local import LocalCatalog
+from pybomb.store import SyncCursor, SyncStore
+from .stub_server import make_result, StubServer
+
+GAMES = 50_000
+CALLS = 1000
+LATENCY = 0.05
+
+SEARCHES: Dict[str, Dict[str, Any]] = {
+    "by id": {"filter_by": {"id": "4242|4243"}},
+    "by platform": {"filter_by": {"platforms": 42}, "limit": 10},
+    "by date": {
+        "filter_by": {"date_last_updated": "2020-01-01 00:00:00|2020-12-31 00:00:00"},
+        "sort_by": "date_last_updated",
+        "limit": 10,
+    },
+    "by name": {"filter_by": {"name": "Game 4242"}, "return_fields": ["id", "name"]},
+}
+
+
+def make_game(id_: int) -> Dict[str, Any]:
+    """Create a game on one of 50 platforms, updated on one of 1000 days."""
+    game = make_result(id_)
+    game["platforms"] = [{"id": id_ % 50, "name": f"Platform {id_ % 50}"}]
+    game["date_last_updated"] = time.strftime(
+        "%Y-%m-%d 00:00:00", time.gmtime(1514764800 + id_ % 1000 * 86400)
+    )
+
+    return game
+
+
+def build_store(path: str) -> SyncStore:
+    """Store the mirror of every game, as a sync would."""
+    store = SyncStore(path)
+    games = [make_game(id_) for id_ in range(GAMES)]
+    for start in range(0, GAMES, 1000):
+        store.save_page("games", games[start : start + 1000], SyncCursor())
+    store.mark_synced("games", None, time.time())
+
+    return store
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = build_store(os.path.join(directory, "mirror.db"))
+        local_client = GamesClient("key", catalog=LocalCatalog(store))
+
+        with StubServer(latency=LATENCY) as server:
+            live_client = GamesClient("key")
+            live_client.URI_BASE = server.uri_base
+
+            for name, search in SEARCHES.items():
+                local = timeit.timeit(
+                    partial(local_client.search, **search), number=CALLS
+                )
+                live = timeit.timeit(partial(live_client.search, **search), number=10)
+                print(
+                    f"{name}: local {local / CALLS * 1e6:.0f}us, "
+                    f"live {live / 10 * 1e3:.1f}ms"
+                )
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare the per-call overhead of searches and executions of prepared plans.
+
+Calls are answered from a warm cache, so the time measured is the client's
+own work rather than the network.
+
+Run with ``python -m benchmarks.bench_prepare``.
+"""
+import timeit
+
+import pybomb
+from pybomb.cache import MemoryCache
+from pybomb.clients.games_client import GamesClient
+from pybomb.response import Response
+
+CALLS = 50_000
+NAMES = [f"game {index}" for index in range(100)]
+RETURN_FIELDS = ["id", "name", "platforms", "date_added"]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    cache = MemoryCache(max_entries=len(NAMES))
+    client = GamesClient("key", cache=cache)
+    plan = client.prepare(
+        {"platforms": pybomb.PS4},
+        bind=["name"],
+        return_fields=RETURN_FIELDS,
+        sort_by="name",
+        limit=100,
+    )
+    for name in NAMES:
+        params = plan.bind({"name": name})
+        cache.set("games", plan.cache_key(params), Response("", 0, 0, [], None), 0)
+
+    def search() -> None:
+        for name in NAMES:
+            client.search(
+                {"platforms": pybomb.PS4, "name": name},
+                RETURN_FIELDS,
+                sort_by="name",
+                limit=100,
+            )
+
+    def execute() -> None:
+        for name in NAMES:
+            client.execute(plan, name=name)
+
+    rounds = CALLS // len(NAMES)
+    for label, calls in (("search", search), ("prepared", execute)):
+        per_call = timeit.timeit(calls, number=rounds) / CALLS * 1e6
+        print(f"{label}: {per_call:.2f}us per call")
+
+    if cache.misses:
+        raise RuntimeError(f"{cache.misses} calls missed the cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare the memory held by a catalog of games as dicts and as records.
+
+Run with ``python -m benchmarks.bench_records``.
+"""
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.decoder import get_default_decoder
+from pybomb.records import record_type
+from .stub_server import make_result
+
+GAMES = 50_000
+PAGE_SIZE = 100
+
+
+def make_pages() -> List[bytes]:
+    """Create the bodies of every page of the catalog."""
+    return [
+        json.dumps(
+            {"results": [make_result(id_) for id_ in range(start, start + PAGE_SIZE)]}
+        ).encode()
+        for start in range(0, GAMES, PAGE_SIZE)
+    ]
+
+
+def measure(load: Callable[[], List[Any]]) -> Tuple[float, float]:
+    """Load the catalog, returning the MB held by it and the seconds taken.
+
+    The load is timed separately, as tracing memory slows allocations down.
+
+    Args:
+        load: Function loading the catalog
+
+    Returns:
+        The MB held by the catalog, and the seconds taken to load it
+    """
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    catalog = load()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+
+    return size / 1024 / 1024, elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    pages = make_pages()
+    decoder = get_default_decoder()
+    fields = tuple(make_result(0))
+    unknown = set(fields) - set(GamesClient.RESPONSE_FIELD_MAP)
+    if unknown:
+        raise ValueError(f"Fields unknown to the client: {sorted(unknown)}")
+    record_class = record_type(GamesClient.RESOURCE_NAME, fields)
+
+    def load_dicts() -> List[Any]:
+        return [result for page in pages for result in decoder(page)["results"]]
+
+    def load_records() -> List[Any]:
+        return [
+            record_class(result)
+            for page in pages
+            for result in decoder(page)["results"]
+        ]
+
+    for name, load in (("dicts", load_dicts), ("records", load_records)):
+        size, elapsed = measure(load)
+        print(
+            f"{name}: {size:.1f}MB, {size * 1024 * 1024 / GAMES:.0f} bytes per game, "
+            f"loaded in {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare archiving pages of games as JSON files and in a segment store.
+
+Writes 20,000 games in pages of 100, scans every game back, and looks up
+2,000 games by ID.
+
+Run with ``python -m benchmarks.bench_segment``.
+"""
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from pybomb.segment import SegmentStore
+from .stub_server import make_result
+
+GAMES = 20_000
+PAGE_SIZE = 100
+LOOKUPS = 2_000
+
+
+def timed(name: str, run: Callable[[], Any]) -> None:
+    """Run a step, printing the time taken."""
+    start = time.perf_counter()
+    run()
+    print(f"  {name}: {(time.perf_counter() - start) * 1e3:.0f}ms")
+
+
+def json_files(pages: List[List[Dict[str, Any]]], ids: List[int]) -> None:
+    """Archive each page as a JSON file, finding games by the page holding them."""
+    with tempfile.TemporaryDirectory() as directory:
+        files: Dict[int, Path] = {}
+
+        def write() -> None:
+            for number, page in enumerate(pages):
+                path = Path(directory) / f"{number}.json"
+                path.write_text(json.dumps(page))
+                files.update((result["id"], path) for result in page)
+
+        def scan() -> None:
+            for path in sorted(Path(directory).iterdir()):
+                for _ in json.loads(path.read_text()):
+                    pass
+
+        def lookup() -> None:
+            for id_ in ids:
+                page = json.loads(files[id_].read_text())
+                next(result for result in page if result["id"] == id_)
+
+        print("json files:")
+        timed("write", write)
+        timed("scan", scan)
+        timed("lookups", lookup)
+
+
+def segment_store(pages: List[List[Dict[str, Any]]], ids: List[int]) -> None:
+    """Archive the pages in a segment store."""
+    with tempfile.TemporaryDirectory() as directory:
+        with SegmentStore(directory) as store:
+
+            def write() -> None:
+                for page in pages:
+                    store.append_page("games", page)
+
+            def scan() -> None:
+                for _ in store.iter_results("games"):
+                    pass
+
+            def lookup() -> None:
+                for id_ in ids:
+                    store.get("games", id_)
+
+            print("segment store:")
+            timed("write", write)
+            timed("scan", scan)
+            timed("lookups", lookup)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    pages = [
+        [make_result(id_) for id_ in range(start, start + PAGE_SIZE)]
+        for start in range(0, GAMES, PAGE_SIZE)
+    ]
+    ids = random.Random(0).sample(range(GAMES), LOOKUPS)  # noqa: S311
+
+    json_files(pages, ids)
+    segment_store(pages, ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare requests/sec with and without a pooled keep-alive session.
+
+Run with ``python -m benchmarks.bench_session``.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pybomb.clients.game_client import GameClient
+from pybomb.session import create_session
+from .stub_server import StubServer
+
+REQUESTS = 2000
+THREADS = 8
+
+
+def run(server: StubServer, keep_alive: bool) -> float:
+    """Fetch games from the stub server and return the requests per second."""
+    client = GameClient(
+        "key", session=create_session(pool_maxsize=THREADS, keep_alive=keep_alive)
+    )
+    client.URI_BASE = server.uri_base
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(client.fetch, range(REQUESTS)))
+
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer() as server:
+        for keep_alive in (False, True):
+            print(f"keep_alive={keep_alive}: {run(server, keep_alive):.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
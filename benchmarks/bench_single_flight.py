@@ -0,0 +1,50 @@
+"""Measure the calls saved by coalescing a stampede of identical fetches.
+
+Many threads fetch the same few games at once, as happens when a popular page
+is requested while the cache is cold.
+
+Run with ``python -m benchmarks.bench_single_flight``.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from pybomb.clients.game_client import GameClient
+from pybomb.session import create_session
+from pybomb.single_flight import SingleFlight
+from .stub_server import StubServer
+
+LATENCY = 0.05
+THREADS = 32
+FETCHES = 256
+GAMES = 4
+
+
+def run(server: StubServer, single_flight: Optional[SingleFlight]) -> float:
+    """Fetch the games from every thread and return the wall-clock time taken."""
+    client = GameClient(
+        "key", session=create_session(pool_maxsize=THREADS), single_flight=single_flight
+    )
+    client.URI_BASE = server.uri_base
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(lambda fetch: client.fetch(fetch % GAMES), range(FETCHES)))
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(latency=LATENCY) as server:
+        elapsed = run(server, None)
+        print(f"without single flight: {FETCHES} calls in {elapsed:.2f}s")
+
+        single_flight = SingleFlight()
+        elapsed = run(server, single_flight)
+        calls = FETCHES - single_flight.saved
+        print(f"with single flight: {calls} calls in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare the time to first result and peak memory of paged and streamed searches.
+
+Each page holds 100 games with their description HTML.
+
+Run with ``python -m benchmarks.bench_stream``.
+"""
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, Mapping
+
+from pybomb.clients.games_client import GamesClient
+from .stub_server import StubServer
+
+PAGES = 5
+
+
+def measure(name: str, search: Callable[[], Iterator[Mapping[str, Any]]]) -> None:
+    """Consume a search, printing the time to its first result and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = search()
+    next(results)
+    first = time.perf_counter() - start
+    count = 1 + sum(1 for _ in results)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name}: first result in {first * 1e3:.1f}ms, {count} results in "
+        f"{elapsed * 1e3:.0f}ms, peak {peak / 1024:.0f}KiB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(total_results=PAGES * 100) as server:
+        client = GamesClient("key")
+        client.URI_BASE = server.uri_base
+
+        measure("iter_search", lambda: client.iter_search({}))
+        measure("stream_search", lambda: client.stream_search({}))
+
+
+if __name__ == "__main__":
+    main()
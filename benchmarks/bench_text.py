@@ -0,0 +1,45 @@
+"""Compare extracting the text of descriptions inline and over a process pool.
+
+Searches 2,000 games, in pages of 100 served with 50ms of latency, and
+extracts the text and links of the description of each.
+
+Run with ``python -m benchmarks.bench_text``.
+"""
+import os
+import time
+from typing import Any, Callable, Iterable
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.text import extract_text, TextExtractor
+from .stub_server import StubServer
+
+GAMES = 2_000
+
+
+def measure(name: str, run: Callable[[], Iterable[Any]]) -> None:
+    """Consume the extracted results, printing the time taken."""
+    start = time.perf_counter()
+    count = sum(1 for _ in run())
+    print(f"{name}: {count} results in {(time.perf_counter() - start) * 1e3:.0f}ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(latency=0.05, total_results=GAMES) as server:
+        client = GamesClient("key")
+        client.URI_BASE = server.uri_base
+
+        measure(
+            "inline",
+            lambda: (
+                extract_text(result["description"]) for result in client.iter_search({})
+            ),
+        )
+        measure(
+            f"TextExtractor, {os.cpu_count()} workers",
+            lambda: TextExtractor().extract(client.iter_search({})),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""A local stub of the GiantBomb API to benchmark clients against."""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+from urllib.parse import parse_qs, urlparse
+
+DETAIL_PATTERN = re.compile(r"^/api/(?P<resource>\w+)/(?P<id>\d+)/?$")
+LIST_PATTERN = re.compile(r"^/api/(?P<resource>\w+)/?$")
+IMAGE_PATTERN = re.compile(r"^/images/(?P<id>\d+)\.jpg$")
+IMAGE_SIZE = 256 * 1024
+
+
+def make_result(id_: int) -> Dict[str, Any]:
+    """Create a result resembling a GB game."""
+    return {
+        "id": id_,
+        "name": f"Game {id_}",
+        "api_detail_url": f"https://www.giantbomb.com/api/game/3030-{id_}/",
+        "date_added": "2008-04-01 12:00:00",
+        "date_last_updated": "2020-01-01 12:00:00",
+        "deck": "A game about things.",
+        "description": "<p>A long description.</p>" * 20,
+        "image": {"original_url": f"https://giantbomb.com/{id_}.jpg"},
+        "platforms": [{"id": 146, "name": "PlayStation 4", "abbreviation": "PS4"}],
+    }
+
+
+def _references(resource: str, type_id: int, count: int) -> List[Dict[str, Any]]:
+    """Create nested references to other resources, as returned by GB."""
+    return [
+        {
+            "api_detail_url": (
+                f"https://www.giantbomb.com/api/{resource}/{type_id}-{id_}/"
+            ),
+            "id": id_,
+            "name": f"{resource.title()} {id_}",
+            "site_detail_url": f"https://www.giantbomb.com/{resource}/{id_}/",
+        }
+        for id_ in range(count)
+    ]
+
+
+def make_game(id_: int) -> Dict[str, Any]:
+    """Create a detail result resembling a GB game, with its references."""
+    game = make_result(id_)
+    game.update(
+        {
+            "characters": _references("character", 3005, 20),
+            "concepts": _references("concept", 3015, 30),
+            "developers": _references("company", 3010, 2),
+            "genres": _references("genre", 3060, 2),
+            "images": [
+                {"original": f"https://giantbomb.com/{id_}-{image}.jpg", "tags": ""}
+                for image in range(10)
+            ],
+            "publishers": _references("company", 3010, 1),
+            "releases": _references("release", 3050, 5),
+            "similar_games": _references("game", 3030, 10),
+            "themes": _references("theme", 3032, 2),
+        }
+    )
+
+    return game
+
+
+def make_platform(id_: int) -> Dict[str, Any]:
+    """Create a result resembling a GB platform."""
+    return {
+        "abbreviation": f"P{id_}",
+        "api_detail_url": f"https://www.giantbomb.com/api/platform/3045-{id_}/",
+        "company": _references("company", 3010, 1)[0],
+        "date_added": "2008-04-01 12:00:00",
+        "date_last_updated": "2020-01-01 12:00:00",
+        "deck": "A platform for games.",
+        "description": "<p>A long description.</p>" * 10,
+        "id": id_,
+        "image": {"original_url": f"https://giantbomb.com/p{id_}.jpg"},
+        "install_base": "1000000",
+        "name": f"Platform {id_}",
+        "online_support": True,
+        "original_price": "299.00",
+        "release_date": "2013-11-15 00:00:00",
+    }
+
+
+DETAIL_MAKERS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "game": make_game,
+    "platform": make_platform,
+}
+LIST_MAKERS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "games": make_result,
+    "platforms": make_platform,
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve GB shaped responses for detail and list resources."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Respond to a GET request."""
+        server: "StubServer" = self.server  # type: ignore
+        if server.latency:
+            time.sleep(server.latency)
+
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        image = IMAGE_PATTERN.match(url.path)
+        if image:
+            self._send(image["id"].encode().ljust(IMAGE_SIZE, b"\0"), "image/jpeg")
+            return
+
+        detail = DETAIL_PATTERN.match(url.path)
+        listing = LIST_PATTERN.match(url.path)
+        if detail and detail["resource"] in DETAIL_MAKERS:
+            make = DETAIL_MAKERS[detail["resource"]]
+            body: Dict[str, Any] = self._envelope(make(int(detail["id"])), 1, 1)
+        elif listing and listing["resource"] in LIST_MAKERS:
+            make = LIST_MAKERS[listing["resource"]]
+            limit = min(int(params.get("limit", 100)), server.max_page_size)
+            offset = int(params.get("offset", 0))
+            filter_by = dict(
+                field.split(":", 1)
+                for field in params.get("filter", "").split(",")
+                if field
+            )
+            if "id" in filter_by:
+                matched = [int(id_) for id_ in filter_by["id"].split("|")]
+                ids: Sequence[int] = matched[offset : offset + limit]
+                total = len(matched)
+            else:
+                ids = range(offset, min(offset + limit, server.total_results))
+                total = server.total_results
+            body = self._envelope([make(id_) for id_ in ids], len(ids), total)
+        else:
+            self.send_error(404)
+            return
+
+        if "field_list" in params:
+            fields = params["field_list"].split(",")
+            results = body["results"]
+            for result in results if isinstance(results, list) else [results]:
+                for field in list(result):
+                    if field not in fields:
+                        del result[field]
+
+        self._send(json.dumps(body).encode(), "application/json")
+
+    def _send(self, payload: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    @staticmethod
+    def _envelope(results: Any, page_results: int, total: int) -> Dict[str, Any]:
+        return {
+            "error": "OK",
+            "number_of_page_results": page_results,
+            "number_of_total_results": total,
+            "status_code": 1,
+            "results": results,
+            "version": "1.0",
+        }
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silence request logging."""
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server, run in the background as a context manager."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        total_results: int = 1000,
+        max_page_size: int = 100,
+    ) -> None:
+        """Bind the server to a free local port.
+
+        Args:
+            latency: Seconds to wait before answering each request
+            total_results: The size of the result set served by list resources
+            max_page_size: The most results served per page, whatever the limit
+        """
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.total_results = total_results
+        self.max_page_size = max_page_size
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def uri_base(self) -> str:
+        """The base URI for clients to use in place of the GB API."""
+        return f"http://127.0.0.1:{self.server_port}/api/"
+
+    def image_url(self, id_: int) -> str:
+        """The URL of an image served by the server."""
+        return f"http://127.0.0.1:{self.server_port}/images/{id_}.jpg"
+
+    def __enter__(self) -> "StubServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.shutdown()
+        self.server_close()
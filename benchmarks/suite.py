@@ -0,0 +1,231 @@
+"""Run the benchmark suite against the local stub server, recording JSON results.
+
+Run with ``python -m benchmarks.suite``, or ``nox -s benchmarks``. Results are
+written with ``--output results.json`` and can be compared to the results of an
+earlier release with ``--compare baseline.json``.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from requests.models import Response as RequestsResponse
+
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.decoder import get_default_decoder
+from pybomb.records import record_type
+from pybomb.response import Response
+from pybomb.session import create_session
+from pybomb.version import get_version
+from .stub_server import make_result, StubServer
+
+Results = Dict[str, Dict[str, float]]
+
+
+def percentile(times: List[float], fraction: float) -> float:
+    """Get the value below which the fraction of the sorted times fall."""
+    ordered = sorted(times)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def latency(call: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    """Time each round of a call, returning the mean, p50 and p95 in ms."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        call()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "mean_ms": sum(times) / len(times),
+        "p50_ms": percentile(times, 0.5),
+        "p95_ms": percentile(times, 0.95),
+    }
+
+
+def bench_latency(server: StubServer, args: argparse.Namespace) -> Results:
+    """Measure the latency of single fetches and searches."""
+    session = create_session()
+    game_client = GameClient("key", session=session)
+    games_client = GamesClient("key", session=session)
+    platforms_client = PlatformsClient("key", session=session)
+    for client in (game_client, games_client, platforms_client):
+        client.URI_BASE = server.uri_base
+
+    return {
+        "fetch_game": latency(lambda: game_client.fetch(1), args.rounds),
+        "search_games": latency(
+            lambda: games_client.search({"name": "game"}, limit=args.page_size),
+            args.rounds,
+        ),
+        "search_platforms": latency(
+            lambda: platforms_client.search({"name": "p"}, limit=args.page_size),
+            args.rounds,
+        ),
+    }
+
+
+def bench_crawl(server: StubServer, args: argparse.Namespace) -> Results:
+    """Measure the throughput of walking every page of a search."""
+    results = {}
+    for workers in (1, 4):
+        client = GamesClient("key", session=create_session(pool_maxsize=workers))
+        client.URI_BASE = server.uri_base
+
+        start = time.perf_counter()
+        count = sum(
+            1
+            for _ in client.iter_search(
+                {"name": "game"}, page_size=args.page_size, workers=workers
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        results[f"crawl_games_workers_{workers}"] = {
+            "results_per_s": count / elapsed,
+            "seconds": elapsed,
+        }
+
+    return results
+
+
+def make_page(page_size: int) -> bytes:
+    """Create the body of a page of games."""
+    return json.dumps(
+        {
+            "error": "OK",
+            "number_of_page_results": page_size,
+            "number_of_total_results": page_size,
+            "status_code": 1,
+            "results": [make_result(id_) for id_ in range(page_size)],
+        }
+    ).encode()
+
+
+def bench_decode(server: StubServer, args: argparse.Namespace) -> Results:
+    """Measure the cost of building a Response from a page body."""
+    body = make_page(args.page_size)
+    decoder = get_default_decoder()
+
+    def from_response_data() -> None:
+        raw = RequestsResponse()
+        raw._content = body
+        raw.url = server.uri_base
+        Response.from_response_data(raw)
+
+    def from_decoded_body() -> None:
+        Response.from_response_json(server.uri_base, decoder(body))
+
+    return {
+        "decode_from_response_data": latency(from_response_data, args.rounds),
+        "decode_from_decoded_body": latency(from_decoded_body, args.rounds),
+    }
+
+
+def bench_memory(server: StubServer, args: argparse.Namespace) -> Results:
+    """Measure the memory held per result, as dicts and as records."""
+    pages = [make_page(args.page_size) for _ in range(args.pages)]
+    decoder = get_default_decoder()
+    record_class = record_type(GamesClient.RESOURCE_NAME, tuple(make_result(0)))
+
+    def load_dicts() -> List[Any]:
+        return [result for page in pages for result in decoder(page)["results"]]
+
+    def load_records() -> List[Any]:
+        return [record_class(result) for result in load_dicts()]
+
+    results = {}
+    for name, load in (("dicts", load_dicts), ("records", load_records)):
+        gc.collect()
+        tracemalloc.start()
+        catalog = load()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[f"memory_{name}"] = {"bytes_per_result": size / len(catalog)}
+        del catalog
+
+    return results
+
+
+BENCHMARKS: Dict[str, Callable[[StubServer, argparse.Namespace], Results]] = {
+    "latency": bench_latency,
+    "crawl": bench_crawl,
+    "decode": bench_decode,
+    "memory": bench_memory,
+}
+
+
+def compare(results: Results, baseline: Results) -> None:
+    """Print the change of each metric from the baseline results."""
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            before = baseline.get(name, {}).get(metric)
+            if before:
+                change = (value - before) / before * 100
+                print(f"{name}.{metric}: {before:.2f} -> {value:.2f} ({change:+.1f}%)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.0, help="stub delay in s")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--total-results", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=100, help="pages held in memory")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append")
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--compare", help="JSON results to compare against")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark suite."""
+    args = parse_args(argv)
+    results: Results = {}
+
+    with StubServer(
+        latency=args.latency,
+        total_results=args.total_results,
+        max_page_size=args.page_size,
+    ) as server:
+        for name in args.only or BENCHMARKS:
+            results.update(BENCHMARKS[name](server, args))
+
+    for name, metrics in results.items():
+        values = ", ".join(f"{metric}={value:.2f}" for metric, value in metrics.items())
+        print(f"{name}: {values}")
+
+    report = {
+        "pybomb": get_version(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("output", "compare")
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fp:
+            compare(results, json.load(fp)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ import nox
 from nox.sessions import Session
 
 nox.options.sessions = "lint", "mypy", "safety", "tests"
-locations = "src", "tests", "noxfile.py", "docs/conf.py"
+locations = "src", "tests", "benchmarks", "noxfile.py", "docs/conf.py"
 package = "pybomb"
 
 
@@ -37,9 +37,28 @@ def black(session: Session) -> None:
 def tests(session: Session) -> None:
     """Run test suite."""
     args = session.posargs or ["--cov"]
-    session.run("poetry", "install", "--no-dev", external=True)
+    session.run(
+        "poetry",
+        "install",
+        "--no-dev",
+        "-E",
+        "arrow",
+        "-E",
+        "async",
+        "-E",
+        "speedups",
+        "-E",
+        "tracing",
+        external=True,
+    )
     install_with_constraints(
-        session, "coverage[toml]", "pytest", "pytest-cov", "typeguard", "pyyaml"
+        session,
+        "coverage[toml]",
+        "opentelemetry-sdk",
+        "pytest",
+        "pytest-cov",
+        "typeguard",
+        "pyyaml",
     )
 
     # Currently typeguard explodes when it reflects NamedTuple objects
@@ -50,6 +69,14 @@ def tests(session: Session) -> None:
         session.run("pytest", f"--typeguard-packages={package}", *args)
 
 
+@nox.session(python="3.8")
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite, writing the results as JSON."""
+    args = session.posargs or ["--output", "benchmark-results.json"]
+    session.run("poetry", "install", "--no-dev", "-E", "speedups", external=True)
+    session.run("python", "-m", "benchmarks.suite", *args)
+
+
 @nox.session(python=["3.6", "3.7", "3.8", "3.9"])
 def lint(session: Session) -> None:
     """Lint using flake8."""
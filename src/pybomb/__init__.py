@@ -2,29 +2,88 @@
 
 http://www.giantbomb.com/api/documentation#toc-0-1
 """
-try:
-    from importlib.metadata import PackageNotFoundError, version  # type: ignore
-except ImportError:  # pragma: no cover
-    from importlib_metadata import version, PackageNotFoundError  # type: ignore
-
-from pybomb.clients.game_client import GameClient
-from pybomb.clients.games_client import GamesClient
-from pybomb.clients.platforms_client import PlatformsClient
+import sys
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
 from pybomb.exceptions import (
     BadRequestException,
+    CircuitOpenException,
     ClientException,
+    InvalidExpandFieldException,
     InvalidFilterFieldException,
+    InvalidPlanException,
     InvalidResponseException,
     InvalidReturnFieldException,
     InvalidSortFieldException,
     PybombException,
 )
-from pybomb.factory import ClientFactory
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
+if TYPE_CHECKING:  # pragma: no cover
+    from pybomb.async_factory import AsyncClientFactory
+    from pybomb.clients.async_game_client import AsyncGameClient
+    from pybomb.clients.async_games_client import AsyncGamesClient
+    from pybomb.clients.async_platforms_client import AsyncPlatformsClient
+    from pybomb.clients.game_client import GameClient
+    from pybomb.clients.games_client import GamesClient
+    from pybomb.clients.platforms_client import PlatformsClient
+    from pybomb.factory import ClientFactory
+
+    __version__: str
+
+# Clients and factories are imported on first use, so importing PyBomb does not
+# import the HTTP libraries
+_LAZY_ATTRIBUTES = {
+    "AsyncGameClient": "pybomb.clients.async_game_client",
+    "AsyncGamesClient": "pybomb.clients.async_games_client",
+    "AsyncPlatformsClient": "pybomb.clients.async_platforms_client",
+    "GameClient": "pybomb.clients.game_client",
+    "GamesClient": "pybomb.clients.games_client",
+    "PlatformsClient": "pybomb.clients.platforms_client",
+    "AsyncClientFactory": "pybomb.async_factory",
+    "ClientFactory": "pybomb.factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import clients, factories and the version on first access.
+
+    Args:
+        name: The name of the attribute
+
+    Returns:
+        The attribute
+
+    Raises:
+        AttributeError: The attribute does not exist
+    """
+    if name == "__version__":
+        from pybomb.version import get_version
+
+        value = get_version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the module, including those not yet imported.
+
+    Returns:
+        The names of the attributes
+    """
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "__version__"})
+
+
+# Module __getattr__ is only supported from Python 3.7
+if sys.version_info < (3, 7):  # pragma: no cover
+    for _name in (*_LAZY_ATTRIBUTES, "__version__"):
+        __getattr__(_name)
 
 # Platform ID's
 PS1 = 22
@@ -0,0 +1,139 @@
+"""Factory for creating async Clients.
+
+Requires the ``async`` extra to be installed (``pip install pybomb[async]``).
+"""
+from types import TracebackType
+from typing import Optional, Type
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+from pybomb.async_session import create_async_session
+from pybomb.cache import Cache
+from pybomb.clients.base.async_client import AsyncClient
+from pybomb.decoder import Decoder
+from pybomb.events import EventHooks
+from pybomb.factory import _import_client_class
+from pybomb.local import LocalCatalog
+from pybomb.rate_limit import RateLimiter
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.single_flight import SingleFlight
+
+
+class AsyncClientFactory:
+    """Factory for creating all async clients with the same API key and session.
+
+    Requires the ``async`` extra to be installed (``pip install pybomb[async]``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional["aiohttp.ClientSession"] = None,
+        cache: Optional[Cache] = None,
+        decoder: Optional[Decoder] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        records: bool = False,
+        events: Optional[EventHooks] = None,
+        single_flight: Optional[SingleFlight] = None,
+        catalog: Optional[LocalCatalog] = None,
+    ) -> None:
+        """Init Factory with the API key to use when creating clients.
+
+        Args:
+            api_key: The API key to use when instantiating all clients
+            session: The aiohttp session to share between all clients. When None,
+                a session is created using the default pool settings when the
+                first client is built, and closed by :meth:`close`.
+                See :func:`pybomb.async_session.create_async_session`
+            cache: The response cache to share between all clients. When None,
+                responses are not cached. See :mod:`pybomb.cache`
+            decoder: The function used by all clients to decode response bodies.
+                When None, the fastest installed JSON decoder is used
+            rate_limiter: The limiter shared by all clients, pacing calls to
+                keep within the GB API quota. When None, calls are not limited.
+                See :class:`pybomb.rate_limit.RateLimiter`
+            retry_policy: The policy controlling how all clients retry failed
+                calls. When None, failed calls are not retried.
+                See :class:`pybomb.retry.RetryPolicy`
+            circuit_breaker: The breaker shared by all clients, failing calls
+                fast while a resource is down. When None, every call is sent.
+                See :class:`pybomb.retry.CircuitBreaker`
+            records: If all clients should return results as compact records,
+                rather than dicts. See :mod:`pybomb.records`
+            events: The hooks told about each call made by all clients. When
+                None, calls are not traced. See :mod:`pybomb.events`
+            single_flight: The coalescer shared by all clients, sharing one
+                call between identical calls made at the same time. When None,
+                every call is made. See :class:`pybomb.single_flight.SingleFlight`
+            catalog: The local catalog answering the searches of all clients
+                from a mirror, before calling the GB API. When None, every
+                search is sent. See :mod:`pybomb.local`
+        """
+        self.api_key = api_key
+        self.session = session
+        self.cache = cache
+        self.decoder = decoder
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.records = records
+        self.events = events
+        self.single_flight = single_flight
+        self.catalog = catalog
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "AsyncClientFactory":
+        """Use the factory as an async context manager, closing it on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the factory."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared session, if it was created by this factory."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def build(self, client_name: str) -> AsyncClient:
+        """Import and instantiate the required async class.
+
+        This must be called from within a running event loop.
+
+        Args:
+            client_name: The name of the client to create. Should match the
+                name of the module, minus the "async_" and "_client" parts.
+
+        Returns:
+            An instance of the async client, created with the API key and
+            session held on the class.
+        """
+        client_class = _import_client_class(client_name, "async")
+
+        if self.session is None:
+            self.session = create_async_session()
+
+        return client_class(
+            self.api_key,
+            session=self.session,
+            cache=self.cache,
+            decoder=self.decoder,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            records=self.records,
+            events=self.events,
+            single_flight=self.single_flight,
+            catalog=self.catalog,
+        )
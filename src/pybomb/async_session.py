@@ -0,0 +1,48 @@
+"""HTTP session management for PyBomb async clients.
+
+Requires the ``async`` extra to be installed (``pip install pybomb[async]``).
+"""
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+DEFAULT_ASYNC_POOL_LIMIT = 100
+
+
+def create_async_session(
+    limit: int = DEFAULT_ASYNC_POOL_LIMIT,
+    limit_per_host: int = 0,
+    keep_alive: bool = True,
+    gzip: bool = True,
+) -> "aiohttp.ClientSession":
+    """Create a pooled aiohttp session to be shared between async clients.
+
+    This must be called from within a running event loop. Requires the
+    ``async`` extra to be installed (``pip install pybomb[async]``).
+
+    Args:
+        limit: The max number of connections open at once
+        limit_per_host: The max number of connections open at once to a single
+            host. 0 means no limit other than `limit`
+        keep_alive: If connections should be kept open between requests.
+            Defaults to True
+        gzip: If compressed responses should be requested. Defaults to True
+
+    Returns:
+        An aiohttp ClientSession configured with the requested pool
+
+    Raises:
+        ImportError: aiohttp is not installed
+    """
+    if aiohttp is None:  # pragma: no cover
+        raise ImportError(
+            'aiohttp is required for async clients, use "pip install pybomb[async]"'
+        )
+
+    connector = aiohttp.TCPConnector(
+        limit=limit, limit_per_host=limit_per_host, force_close=not keep_alive
+    )
+    headers = {"Accept-Encoding": "gzip, deflate" if gzip else "identity"}
+
+    return aiohttp.ClientSession(connector=connector, headers=headers)
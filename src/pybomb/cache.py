@@ -0,0 +1,389 @@
+"""Response caches that can be shared between clients."""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from typing import Callable, Dict, NamedTuple, Optional, Union
+
+from pybomb.response import Response
+
+DEFAULT_TTL = 3600.0
+
+
+class Cache(ABC):
+    """Base class for response caches.
+
+    Responses are keyed on the resource and the params of the call. The API
+    key is ignored, as is the order of the params.
+    """
+
+    IGNORED_PARAMS = ("api_key",)
+
+    def __init__(
+        self, ttl: float = DEFAULT_TTL, resource_ttls: Optional[Dict[str, float]] = None
+    ) -> None:
+        """Init the cache with the expiry times of responses.
+
+        Args:
+            ttl: The number of seconds responses are cached for
+            resource_ttls: The number of seconds responses are cached for, per
+                resource name. Resources not in the map use `ttl`
+        """
+        self.ttl = ttl
+        self.resource_ttls = resource_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    @classmethod
+    def make_key(cls, resource: str, params: Dict[str, Union[str, int]]) -> str:
+        """Create the cache key for a call.
+
+        Args:
+            resource: The name of the resource called
+            params: All of the params of the call
+
+        Returns:
+            A key that is the same for any call with the same resource and params
+        """
+        canonical_params = "&".join(
+            f"{name}={params[name]}"
+            for name in sorted(params)
+            if name not in cls.IGNORED_PARAMS
+        )
+
+        return f"{resource}?{canonical_params}"
+
+    def ttl_for(self, resource: str) -> float:
+        """Get the number of seconds to cache the responses of a resource for.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The TTL of the resource in seconds
+        """
+        return self.resource_ttls.get(resource, self.ttl)
+
+    def get(self, key: str) -> Optional[Response]:
+        """Get a cached response, counting the hit or miss.
+
+        Args:
+            key: The cache key of the call
+
+        Returns:
+            The cached response, or None if there is no unexpired response
+        """
+        response = self._get(key)
+
+        with self._counter_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return response
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Response]:
+        """Get a cached response.
+
+        Args:
+            key: The cache key of the call
+
+        Returns:
+            The cached response, or None if there is no unexpired response
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def set(self, resource: str, key: str, response: Response, size: int) -> None:
+        """Cache a response.
+
+        Args:
+            resource: The name of the resource called
+            key: The cache key of the call
+            response: The response to cache
+            size: The size of the response body in bytes
+        """
+        ...  # pragma: no cover
+
+
+class _MemoryEntry(NamedTuple):
+    """A response held in the memory cache."""
+
+    response: Response
+    size: int
+    expires_at: float
+
+
+class MemoryCache(Cache):
+    """A thread safe, in-memory LRU cache with per-resource TTLs.
+
+    The cache is bounded by both the number of responses and their total size.
+    When either bound is exceeded, the least recently used responses are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = DEFAULT_TTL,
+        resource_ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init the cache with its bounds.
+
+        Args:
+            max_entries: The max number of responses to hold
+            max_bytes: The max total size of the responses to hold, in bytes
+            ttl: The number of seconds responses are cached for
+            resource_ttls: The number of seconds responses are cached for, per
+                resource name. Resources not in the map use `ttl`
+            clock: Function returning the current time in seconds
+        """
+        super().__init__(ttl, resource_ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """The number of responses held."""
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[Response]:
+        """Get a cached response, marking it as recently used.
+
+        Args:
+            key: The cache key of the call
+
+        Returns:
+            The cached response, or None if there is no unexpired response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def set(self, resource: str, key: str, response: Response, size: int) -> None:
+        """Cache a response, evicting the least recently used if full.
+
+        Responses larger than `max_bytes` are not cached.
+
+        Args:
+            resource: The name of the resource called
+            key: The cache key of the call
+            response: The response to cache
+            size: The size of the response body in bytes
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _MemoryEntry(
+                response, size, self._clock() + self.ttl_for(resource)
+            )
+            self.size += size
+
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove a response. The lock must be held.
+
+        Args:
+            key: The cache key of the response
+        """
+        self.size -= self._entries.pop(key).size
+
+
+class SQLiteCache(Cache):
+    """A persistent cache, storing responses in a local SQLite file.
+
+    Cached responses survive restarts, and the file can be shared by several
+    threads and processes at once. The cache is bounded by both the number of
+    responses and their total encoded size. When either bound is exceeded, the
+    least recently used responses are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl: float = DEFAULT_TTL,
+        resource_ttls: Optional[Dict[str, float]] = None,
+        timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init the cache, creating the database file if needed.
+
+        Args:
+            path: The path of the SQLite database file
+            max_entries: The max number of responses to hold
+            max_bytes: The max total size of the encoded responses to hold, in bytes
+            ttl: The number of seconds responses are cached for
+            resource_ttls: The number of seconds responses are cached for, per
+                resource name. Resources not in the map use `ttl`
+            timeout: Seconds to wait for another process to release a lock on
+                the database
+            clock: Function returning the current time as a UNIX timestamp
+        """
+        super().__init__(ttl, resource_ttls)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._clock = clock
+
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "resource TEXT NOT NULL, "
+                "response TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def __len__(self) -> int:
+        """The number of responses held."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """The total size of the encoded responses held, in bytes."""
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def _get(self, key: str) -> Optional[Response]:
+        """Get a cached response, marking it as recently used.
+
+        Args:
+            key: The cache key of the call
+
+        Returns:
+            The cached response, or None if there is no unexpired response
+        """
+        now = self._clock()
+
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT response FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+
+        return Response(**json.loads(row[0]))
+
+    def set(self, resource: str, key: str, response: Response, size: int) -> None:
+        """Cache a response, evicting expired and least recently used responses.
+
+        The size of the encoded response is used to bound the cache, rather
+        than the size of the response body. Responses larger than `max_bytes`
+        are not cached.
+
+        Args:
+            resource: The name of the resource called
+            key: The cache key of the call
+            response: The response to cache
+            size: The size of the response body in bytes
+        """
+        encoded_response = json.dumps(response._asdict())
+        encoded_size = len(encoded_response)
+        if encoded_size > self.max_bytes:
+            return
+
+        now = self._clock()
+
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    resource,
+                    encoded_response,
+                    encoded_size,
+                    now + self.ttl_for(resource),
+                    now,
+                ),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._evict(connection)
+            connection.execute("COMMIT")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with closing(self._connect()) as connection:
+            connection.execute("DELETE FROM responses")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict the least recently used responses until within the bounds.
+
+        Args:
+            connection: The connection holding the write transaction
+        """
+        count, total_size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        rows = connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        evicted_keys = []
+        for key, size in rows:
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+
+            evicted_keys.append((key,))
+            count -= 1
+            total_size -= size
+
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database, in autocommit mode.
+
+        Closing the connection rolls back any transaction that was not committed.
+
+        Returns:
+            The SQLite connection
+        """
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
@@ -0,0 +1,32 @@
+"""Async client for the Game resource of GiantBomb.
+
+https://www.giantbomb.com/api/documentation#toc-0-16
+"""
+from typing import List, Optional
+
+from pybomb.clients.base.async_fetch_client import AsyncFetchClient
+from pybomb.clients.game_client import GameClient
+from pybomb.response import Response
+
+
+class AsyncGameClient(AsyncFetchClient):
+    """Async client for the 'game' API resource."""
+
+    RESOURCE_NAME = GameClient.RESOURCE_NAME
+    RESPONSE_FIELD_MAP = GameClient.RESPONSE_FIELD_MAP
+
+    async def fetch(self, id_: int, return_fields: Optional[List] = None) -> Response:
+        """Fetch details of a game by ID.
+
+        Args:
+            id_: The ID of the game
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+
+        Returns:
+            A Pybomb Respose object containing the details of the requested game
+        """
+        game_params = self._build_fetch_params(id_, return_fields)
+
+        return await self._query(game_params)
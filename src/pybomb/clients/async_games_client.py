@@ -0,0 +1,49 @@
+"""Async client for the Games resource of GiantBomb.
+
+https://www.giantbomb.com/api/documentation#toc-0-17
+"""
+from typing import Any, Dict, Optional, Union
+
+from pybomb.clients.base.async_search_client import AsyncSearchClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.response import Response
+
+
+class AsyncGamesClient(AsyncSearchClient):
+    """Async client for the 'games' API resource."""
+
+    RESOURCE_NAME = GamesClient.RESOURCE_NAME
+    RESPONSE_FIELD_MAP = GamesClient.RESPONSE_FIELD_MAP
+
+    async def quick_search(
+        self,
+        name: str,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        platform: Optional[int] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Search with a simplier API.
+
+        This method allows you to search for a game using only the title and
+        the platform.
+
+        Args:
+            name: The name of the game to search for
+            platform: The platform ID that the game is required to have.
+                When set to None no platform filters will be added. Defaults to None
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            args: Additional arguments.
+            kwargs: Additional keyword arguments.
+
+        Returns:
+             A PyBomb Response containg the results of the search
+        """
+        filter_by: Dict[str, Union[str, int]] = {"name": name}
+        if platform is not None:
+            filter_by["platforms"] = platform
+
+        return await self.search(filter_by=filter_by, sort_by=sort_by, desc=desc)
@@ -0,0 +1,41 @@
+"""Async client for the Platforms resource of GiantBomb.
+
+https://www.giantbomb.com/api/documentation#toc-0-30
+"""
+from typing import Any, Optional
+
+from pybomb.clients.base.async_search_client import AsyncSearchClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.response import Response
+
+
+class AsyncPlatformsClient(AsyncSearchClient):
+    """Async client for the 'platforms' API resource."""
+
+    RESOURCE_NAME = PlatformsClient.RESOURCE_NAME
+    RESPONSE_FIELD_MAP = PlatformsClient.RESPONSE_FIELD_MAP
+
+    async def quick_search(
+        self,
+        name: str,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Search with a simplier API.
+
+        This method allows you to search for a platform using only the name.
+
+        Args:
+            name: The name of the platform to search for
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            args: Additional arguments.
+            kwargs: Additional keyword arguments.
+
+        Returns:
+             A PyBomb Response containg the results of the search
+        """
+        return await self.search(filter_by={"name": name}, sort_by=sort_by, desc=desc)
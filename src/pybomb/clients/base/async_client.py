@@ -0,0 +1,250 @@
+"""Base async client used by async fetch and search clients."""
+import asyncio
+from abc import abstractmethod
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+from pybomb.async_session import create_async_session
+from pybomb.cache import Cache
+from pybomb.clients.base.client import BaseClient
+from pybomb.decoder import Decoder
+from pybomb.events import CallTrace, EventHooks
+from pybomb.exceptions import BadRequestException
+from pybomb.local import LocalCatalog
+from pybomb.rate_limit import RateLimiter
+from pybomb.response import Response
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.single_flight import SingleFlight
+
+
+class AsyncClient(BaseClient):
+    """Base class for async GB API resource clients.
+
+    Requires the ``async`` extra to be installed (``pip install pybomb[async]``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional["aiohttp.ClientSession"] = None,
+        cache: Optional[Cache] = None,
+        decoder: Optional[Decoder] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        records: bool = False,
+        events: Optional[EventHooks] = None,
+        single_flight: Optional[SingleFlight] = None,
+        catalog: Optional[LocalCatalog] = None,
+    ) -> None:
+        """Init Client with GB API key and the session to make requests with.
+
+        Args:
+            api_key: The GB API key to use for each request
+            session: The aiohttp session used to call the GB API. Share a
+                session between clients to reuse pooled connections. When None,
+                a session is created on first use and closed by :meth:`close`
+            cache: The cache to store responses in. Share a cache between
+                clients to share responses. When None, responses are not cached
+            decoder: The function used to decode response bodies from bytes.
+                When None, the fastest installed JSON decoder is used
+            rate_limiter: The limiter pacing calls to keep within the GB API
+                quota. Share a limiter between clients using the same API key.
+                When None, calls are not limited
+            retry_policy: The policy controlling how failed calls are retried.
+                When None, failed calls are not retried
+            circuit_breaker: The breaker failing calls fast while a resource
+                is down. When None, every call is sent
+            records: If results should be returned as compact records, rather
+                than dicts. See :mod:`pybomb.records`
+            events: The hooks told about each call made. When None, calls
+                are not traced. See :mod:`pybomb.events`
+            single_flight: The coalescer sharing one call between identical
+                calls made at the same time. Share it between clients to
+                coalesce their calls. When None, every call is made
+            catalog: The local catalog answering searches from a mirror of
+                the resource, before calling the GB API. When None, every
+                search is sent. See :mod:`pybomb.local`
+        """
+        super().__init__(
+            api_key,
+            cache,
+            decoder,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker,
+            records,
+            events,
+            single_flight,
+            catalog,
+        )
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Use the client as an async context manager, closing it on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session, if it was created by this client."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _query(
+        self, params: Dict[str, Union[str, int]], cache_key: Optional[str] = None
+    ) -> Response:
+        """Add required params, call GB API and format the response.
+
+        Args:
+            params: All of the params requested for the call
+            cache_key: The cache key of the call, if already known
+
+        Returns:
+            A Response object containing the GB API response
+        """
+        trace = self._trace()
+        with trace:
+            trace.begin("prepare")
+            self._prepare_params(params)
+
+            if cache_key is None:
+                cache_key = self._cache_key(params)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is None:
+                cached_response = self._get_catalog_response(params)
+            if cached_response is not None:
+                trace.hit_cache()
+                trace.begin("build")
+                return self._to_records(cached_response, params)
+
+            if self._single_flight is None:
+                pybomb_response = await self._fetch(params, cache_key, trace)
+            else:
+                trace.begin("coalesce")
+                pybomb_response, coalesced = await self._single_flight.do_async(
+                    self._flight_key(params, cache_key),
+                    lambda: self._fetch(params, cache_key, trace),
+                )
+                if coalesced:
+                    trace.coalesce()
+                    trace.begin("build")
+
+            return self._to_records(pybomb_response, params)
+
+    async def _fetch(
+        self,
+        params: Dict[str, Union[str, int]],
+        cache_key: Optional[str],
+        trace: CallTrace,
+    ) -> Response:
+        """Call the GB API, and cache the response built from its body.
+
+        Args:
+            params: All of the params of the call
+            cache_key: The cache key of the call
+            trace: The trace of the call
+
+        Returns:
+            A Response object containing the GB API response, with dict results
+
+        Raises:
+            BadRequestException: The request to the GB API was invalid
+        """
+        response, body = await self._call_api(params, trace)
+        if response.status >= 400:
+            raise BadRequestException(
+                f"{response.status} Error: {response.reason} "
+                f"for url: {response.url}"
+            )
+
+        trace.begin("decode")
+        response_data = self._decoder(body)
+        trace.begin("validate")
+        self._validate_response_data(response_data)
+
+        trace.begin("build")
+        pybomb_response = Response.from_response_json(str(response.url), response_data)
+        self._cache_response(cache_key, pybomb_response, len(body))
+
+        return pybomb_response
+
+    async def _call_api(
+        self, params: Dict[str, Union[str, int]], trace: CallTrace
+    ) -> Tuple["aiohttp.ClientResponse", bytes]:
+        """Call the GB API, retrying failed calls as allowed by the retry policy.
+
+        Args:
+            params: All requests and required resource query parameters
+            trace: The trace of the call
+
+        Returns:
+            The aiohttp response from the last GB call made, and its body
+
+        Raises:
+            aiohttp.ClientError: The call failed, and may not be retried
+            asyncio.TimeoutError: The call timed out, and may not be retried
+        """
+        if self._session is None:
+            self._session = create_async_session()
+
+        uri = self._query_uri(params)
+        attempt = 0
+        while True:
+            self._before_call()
+            if self._rate_limiter is not None:
+                trace.begin("throttle")
+                await self._rate_limiter.acquire_async(self.RESOURCE_NAME)
+
+            trace.begin("request")
+            try:
+                async with self._session.get(
+                    uri, params=params, headers=self._headers
+                ) as response:
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                delay = self._record_failure(attempt)
+                if delay is None:
+                    raise
+            else:
+                trace.response(response.status, len(body))
+                if not self._is_retryable_status(response.status):
+                    self._record_success()
+                    return response, body
+
+                delay = self._record_failure(
+                    attempt, response.headers.get("Retry-After")
+                )
+                if delay is None:
+                    return response, body
+
+            trace.begin("backoff")
+            trace.retry()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @abstractmethod
+    def _query_uri(self, params: Dict[str, Union[str, int]]) -> str:
+        """Create the URI to call for the query.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The URI of the GB resource to call
+        """
+        return ""  # pragma: no cover
@@ -0,0 +1,27 @@
+"""Base client to extend to create async fetch clients for the GiantBomb API."""
+from abc import abstractmethod
+from typing import Dict, List, Optional, Union
+
+from pybomb.clients.base.async_client import AsyncClient
+from pybomb.clients.base.fetch_client import BaseFetchClient
+from pybomb.response import Response
+
+
+class AsyncFetchClient(BaseFetchClient, AsyncClient):
+    """Base class for async fetch GB API resource clients."""
+
+    @abstractmethod
+    async def fetch(self, id_: int, return_fields: Optional[List] = None) -> Response:
+        """Fetch details of an item by ID."""
+        ...  # pragma: no cover
+
+    def _query_uri(self, params: Dict[str, Union[str, int]]) -> str:
+        """Create the URI to call for the query.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The URI of the item to fetch
+        """
+        return self._fetch_uri(params)
@@ -0,0 +1,88 @@
+"""Base client to extend to create async search clients for the GiantBomb API."""
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+from pybomb.clients.base.async_client import AsyncClient
+from pybomb.clients.base.search_client import BaseSearchClient
+from pybomb.plan import SearchPlan
+from pybomb.response import Response
+
+
+class AsyncSearchClient(BaseSearchClient, AsyncClient):
+    """Base class for async search GB API resource clients."""
+
+    async def search(
+        self,
+        filter_by: Dict[str, Any],
+        return_fields: Optional[List] = None,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Response:
+        """Full search of resource.
+
+        See :meth:`pybomb.clients.base.search_client.SearchClient.search`.
+
+        Args:
+            filter_by: A map of fields to filter the search by. These will
+                be validated against the availiable search fields
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            limit: The max number of items to request
+            offset: The start offset for the return items, based on the given sort.
+
+        Returns:
+             A PyBomb Response containing the results of the search
+        """
+        search_params = self._build_search_params(
+            filter_by, return_fields, sort_by, desc, limit, offset
+        )
+
+        return await self._query(search_params)
+
+    async def execute(
+        self, plan: SearchPlan, offset: Optional[int] = None, **values: Any
+    ) -> Response:
+        """Execute a search prepared by :meth:`prepare`.
+
+        See :meth:`pybomb.clients.base.search_client.SearchClient.execute`.
+
+        Args:
+            plan: The plan of the search
+            offset: The start offset for the return items, based on the given sort.
+            values: The values of the filter fields bound by the plan
+
+        Returns:
+             A PyBomb Response containing the results of the search
+        """
+        params = self._bind_plan(plan, values, offset)
+
+        return await self._query(params, self._plan_cache_key(plan, params))
+
+    @abstractmethod
+    async def quick_search(
+        self,
+        name: str,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Search with a simplier API."""
+        ...  # pragma: no cover
+
+    def _query_uri(self, params: Dict[str, Union[str, int]]) -> str:
+        """Create the URI to call for the query.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The URI of the resource to search
+        """
+        return self.URI_BASE + self.RESOURCE_NAME
@@ -1,19 +1,48 @@
-"""Base client used by fetch and search clients."""
+"""Base clients used by fetch and search clients."""
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, NamedTuple, Union
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
-import pkg_resources
-from requests import Response as RequestsResponse
-from requests.exceptions import HTTPError
+from requests import Response as RequestsResponse, Session
+from requests.exceptions import HTTPError, RequestException
 
+from pybomb.cache import Cache
+from pybomb.decoder import Decoder, get_default_decoder
+from pybomb.events import CallTrace, EventHooks, NULL_TRACE
 from pybomb.exceptions import (
     BadRequestException,
+    InvalidExpandFieldException,
     InvalidFilterFieldException,
     InvalidResponseException,
     InvalidReturnFieldException,
     InvalidSortFieldException,
 )
+from pybomb.expand import Expander
+from pybomb.fields import FieldProfiler
+from pybomb.local import LocalCatalog
+from pybomb.rate_limit import RateLimiter
+from pybomb.records import Record, record_type, to_records
 from pybomb.response import Response
+from pybomb.retry import CircuitBreaker, DEFAULT_RETRY_STATUSES, RetryPolicy
+from pybomb.session import create_session
+from pybomb.single_flight import SingleFlight
+from pybomb.stream import ResultStream
+from pybomb.version import get_version
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pybomb.clients.base.search_client import SearchClient
 
 
 class ResponseParam(NamedTuple):
@@ -23,8 +52,8 @@ class ResponseParam(NamedTuple):
     is_sort: bool
 
 
-class Client(ABC):
-    """Base class for GB API resource clients."""
+class BaseClient(ABC):
+    """Base class for GB API resource clients, independent of the transport used."""
 
     URI_BASE = "http://www.giantbomb.com/api/"
 
@@ -37,16 +66,56 @@ class Client(ABC):
     SORT_ORDER_ASCENDING = "asc"
     SORT_ORDER_DESCENDING = "desc"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        cache: Optional[Cache] = None,
+        decoder: Optional[Decoder] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        records: bool = False,
+        events: Optional[EventHooks] = None,
+        single_flight: Optional[SingleFlight] = None,
+        catalog: Optional[LocalCatalog] = None,
+    ) -> None:
         """Init Client with GB API key and default_response_format.
 
         Args:
             api_key: The GB API key to use for each request
+            cache: The cache to store responses in. Share a cache between
+                clients to share responses. When None, responses are not cached
+            decoder: The function used to decode response bodies from bytes.
+                When None, the fastest installed JSON decoder is used
+            rate_limiter: The limiter pacing calls to keep within the GB API
+                quota. Share a limiter between clients using the same API key.
+                When None, calls are not limited
+            retry_policy: The policy controlling how failed calls are retried.
+                When None, failed calls are not retried
+            circuit_breaker: The breaker failing calls fast while a resource
+                is down. When None, every call is sent
+            records: If results should be returned as compact records, rather
+                than dicts. See :mod:`pybomb.records`
+            events: The hooks told about each call made. When None, calls
+                are not traced. See :mod:`pybomb.events`
+            single_flight: The coalescer sharing one call between identical
+                calls made at the same time. Share it between clients to
+                coalesce their calls. When None, every call is made
+            catalog: The local catalog answering searches from a mirror of
+                the resource, before calling the GB API. When None, every
+                search is sent. See :mod:`pybomb.local`
         """
         self.api_key = api_key
-        self._headers = {
-            "User-Agent": f'Pybomb {pkg_resources.require("pybomb")[0].version}'
-        }
+        self._cache = cache
+        self._decoder = decoder if decoder is not None else get_default_decoder()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._records = records
+        self._events = events
+        self._single_flight = single_flight
+        self._catalog = catalog
+        self._headers = {"User-Agent": f"Pybomb {get_version()}"}
 
     def _validate_return_fields(self, return_fields: List[str]) -> None:
         """Validate the given return fields against those allowed on the resource.
@@ -112,22 +181,606 @@ class Client(ABC):
             [f"{key}:{value}" for key, value in filter_by.items() if value is not None]
         )
 
-    def _query(self, params: Dict[str, Union[str, int]]) -> Response:
+    def _prepare_params(self, params: Dict[str, Union[str, int]]) -> None:
+        """Add the params required by every call to the GB API.
+
+        Args:
+            params: All of the params requested for the call
+        """
+        params["api_key"] = self.api_key
+        params["format"] = self.RESPONSE_FORMAT_JSON
+
+    def _cache_key(self, params: Dict[str, Union[str, int]]) -> Optional[str]:
+        """Create the cache key for a call, if caching is enabled.
+
+        Args:
+            params: All of the params requested for the call
+
+        Returns:
+            The cache key, or None if the client has no cache
+        """
+        if self._cache is None:
+            return None
+
+        return self._cache.make_key(self.RESOURCE_NAME, params)
+
+    def _flight_key(
+        self, params: Dict[str, Union[str, int]], cache_key: Optional[str]
+    ) -> str:
+        """Create the key identical calls are coalesced on.
+
+        Calls are identical when they would share a cached response.
+
+        Args:
+            params: All of the params requested for the call
+            cache_key: The cache key of the call, if known
+
+        Returns:
+            The key of the call
+        """
+        if cache_key is not None:
+            return cache_key
+
+        return Cache.make_key(self.RESOURCE_NAME, params)
+
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[Response]:
+        """Get the cached response for a call.
+
+        Args:
+            cache_key: The cache key of the call
+
+        Returns:
+            The cached response, or None if it has not been cached
+        """
+        if self._cache is None or cache_key is None:
+            return None
+
+        return self._cache.get(cache_key)
+
+    def _get_catalog_response(
+        self, params: Dict[str, Union[str, int]]
+    ) -> Optional[Response]:
+        """Answer a call from the local catalog.
+
+        Args:
+            params: All of the params requested for the call
+
+        Returns:
+            The response, or None if the catalog cannot answer the call
+        """
+        if self._catalog is None:
+            return None
+
+        return self._catalog.search(
+            self.RESOURCE_NAME, self.URI_BASE + self.RESOURCE_NAME, params
+        )
+
+    def _cache_response(
+        self, cache_key: Optional[str], response: Response, size: int
+    ) -> None:
+        """Cache the response of a call.
+
+        Args:
+            cache_key: The cache key of the call
+            response: The response to cache
+            size: The size of the response body in bytes
+        """
+        if self._cache is None or cache_key is None:
+            return
+
+        self._cache.set(self.RESOURCE_NAME, cache_key, response, size)
+
+    def _to_records(
+        self, response: Response, params: Dict[str, Union[str, int]]
+    ) -> Response:
+        """Convert the results of a response to records, if the client uses them.
+
+        Responses are cached with dict results, and converted as they are
+        returned, so clients with and without records can share a cache.
+
+        Args:
+            response: The response, with results as dicts
+            params: All of the params of the call
+
+        Returns:
+            The response, with results as records if the client uses them
+        """
+        record_class = self._record_class(params)
+        if record_class is None:
+            return response
+
+        return to_records(response, record_class)
+
+    def _record_class(
+        self, params: Dict[str, Union[str, int]]
+    ) -> Optional[Type[Record]]:
+        """Get the record class of the results of a call, if the client uses them.
+
+        Args:
+            params: All of the params of the call
+
+        Returns:
+            The record class, or None if the client returns dicts
+        """
+        if not self._records:
+            return None
+
+        field_list = params.get("field_list")
+        fields = (
+            tuple(str(field_list).split(","))
+            if field_list
+            else tuple(self.RESPONSE_FIELD_MAP)
+        )
+
+        return record_type(self.RESOURCE_NAME, fields)
+
+    def _trace(self) -> CallTrace:
+        """Start tracing a call, if the client has event hooks.
+
+        Returns:
+            The trace of the call, which does nothing without hooks
+        """
+        if self._events is None:
+            return NULL_TRACE
+
+        return self._events.trace(self.RESOURCE_NAME)
+
+    def _before_call(self) -> None:
+        """Check a call can be made to the resource, before it is sent."""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_call(self.RESOURCE_NAME)
+
+    def _is_retryable_status(self, status: int) -> bool:
+        """Check if a call failing with the HTTP status should be retried.
+
+        Args:
+            status: The HTTP status of the response
+
+        Returns:
+            True if the call failed and can be retried
+        """
+        if self._retry_policy is not None:
+            return self._retry_policy.is_retryable_status(status)
+
+        return status in DEFAULT_RETRY_STATUSES
+
+    def _record_success(self) -> None:
+        """Record a call was answered by the resource."""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success(self.RESOURCE_NAME)
+
+    def _record_failure(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Record a failed call, and decide if it should be retried.
+
+        Args:
+            attempt: The number of retries already made for the call
+            retry_after: The Retry-After header of the failed response, if any
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the call
+            should not be retried
+        """
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_failure(self.RESOURCE_NAME)
+
+        if self._retry_policy is None:
+            return None
+
+        return self._retry_policy.delay_for(attempt, retry_after)
+
+    def _validate_response_data(self, response_data: dict) -> None:
+        """Validate the decoded body of a response from the GB API.
+
+        Args:
+            response_data: The decoded JSON body of the GB response
+
+        Raises:
+            InvalidResponseException: The response was invalid
+        """
+        if response_data["status_code"] != self.RESPONSE_STATUS_OK:
+            raise InvalidResponseException(
+                f'Response code {response_data["status_code"]}: {response_data["error"]}'
+            )
+
+
+class Client(BaseClient):
+    """Base class for GB API resource clients."""
+
+    EXPAND_FIELD_MAP: Dict[str, Type["SearchClient"]] = {}
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[Session] = None,
+        cache: Optional[Cache] = None,
+        decoder: Optional[Decoder] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        records: bool = False,
+        events: Optional[EventHooks] = None,
+        single_flight: Optional[SingleFlight] = None,
+        catalog: Optional[LocalCatalog] = None,
+        field_profiler: Optional[FieldProfiler] = None,
+    ) -> None:
+        """Init Client with GB API key and the session to make requests with.
+
+        Args:
+            api_key: The GB API key to use for each request
+            session: The session used to call the GB API. Share a session
+                between clients to reuse pooled connections. When None, a new
+                session is created for the client
+            cache: The cache to store responses in. Share a cache between
+                clients to share responses. When None, responses are not cached
+            decoder: The function used to decode response bodies from bytes.
+                When None, the fastest installed JSON decoder is used
+            rate_limiter: The limiter pacing calls to keep within the GB API
+                quota. Share a limiter between clients using the same API key.
+                When None, calls are not limited
+            retry_policy: The policy controlling how failed calls are retried.
+                When None, failed calls are not retried
+            circuit_breaker: The breaker failing calls fast while a resource
+                is down. When None, every call is sent
+            records: If results should be returned as compact records, rather
+                than dicts. See :mod:`pybomb.records`
+            events: The hooks told about each call made. When None, calls
+                are not traced. See :mod:`pybomb.events`
+            single_flight: The coalescer sharing one call between identical
+                calls made at the same time. Share it between clients to
+                coalesce their calls. When None, every call is made
+            catalog: The local catalog answering searches from a mirror of
+                the resource, before calling the GB API. When None, every
+                search is sent. See :mod:`pybomb.local`
+            field_profiler: The profiler learning the fields read from results,
+                so calls made without return fields request only those. When
+                None, every field is requested. See :mod:`pybomb.fields`
+        """
+        super().__init__(
+            api_key,
+            cache,
+            decoder,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker,
+            records,
+            events,
+            single_flight,
+            catalog,
+        )
+        self._session = session if session is not None else create_session()
+        self._field_profiler = field_profiler
+
+    def uncached(self) -> "Client":
+        """Create a client of the resource that always calls the GB API.
+
+        The client shares the setup of this client, but not its cache or local
+        catalog, so every call is sent. It returns results as dicts, and is
+        not profiled.
+
+        Returns:
+            The client
+        """
+        return self._sibling(type(self), None, None)
+
+    def _sibling(
+        self,
+        client_class: Type["Client"],
+        cache: Optional[Cache],
+        catalog: Optional[LocalCatalog],
+    ) -> "Client":
+        """Create a client of another resource, sharing the setup of the client.
+
+        The client calls the same API, returns results as dicts, and is not
+        profiled.
+
+        Args:
+            client_class: The class of the client
+            cache: The cache of the client
+            catalog: The local catalog of the client
+
+        Returns:
+            The client
+        """
+        client = client_class(
+            self.api_key,
+            session=self._session,
+            cache=cache,
+            decoder=self._decoder,
+            rate_limiter=self._rate_limiter,
+            retry_policy=self._retry_policy,
+            circuit_breaker=self._circuit_breaker,
+            events=self._events,
+            single_flight=self._single_flight,
+            catalog=catalog,
+        )
+        client.URI_BASE = self.URI_BASE
+
+        return client
+
+    def _expander(self, expand: List[str]) -> Expander:
+        """Create the expander of the references held by the given fields.
+
+        Each batch of IDs is searched for on the resource of the field. Only
+        the expander caches the objects it resolves, by ID.
+
+        Args:
+            expand: The fields to expand
+
+        Returns:
+            The expander
+
+        Raises:
+            InvalidExpandFieldException: A field cannot be expanded
+        """
+        clients: Dict[type, "SearchClient"] = {}
+        resolvers = {}
+        for field in expand:
+            if field not in self.EXPAND_FIELD_MAP:
+                raise InvalidExpandFieldException(
+                    f'"{field}" is an invalid expand field'
+                )
+
+            client_class = self.EXPAND_FIELD_MAP[field]
+            if client_class not in clients:
+                clients[client_class] = cast(
+                    "SearchClient", self._sibling(client_class, None, self._catalog)
+                )
+            client = clients[client_class]
+            resolvers[field] = (client.RESOURCE_NAME, client._search_ids)
+
+        return Expander(resolvers, self._cache)
+
+    @staticmethod
+    def _expanded_return_fields(
+        return_fields: Optional[List], expand: Optional[List[str]]
+    ) -> Optional[List]:
+        """Add the expanded fields to the return fields, if any were supplied.
+
+        Args:
+            return_fields: The fields to be returned by the response
+            expand: The fields to expand
+
+        Returns:
+            The return fields, including the expanded fields
+        """
+        if return_fields is None or not expand:
+            return return_fields
+
+        return list(dict.fromkeys([*return_fields, *expand]))
+
+    def _query(
+        self, params: Dict[str, Union[str, int]], cache_key: Optional[str] = None
+    ) -> Response:
+        """Call GB API, requesting only the fields profiled for the call site.
+
+        Args:
+            params: All of the params requested for the call
+            cache_key: The cache key of the call, if already known
+
+        Returns:
+            A Response object containing the GB API response
+        """
+        if self._field_profiler is None or "field_list" in params:
+            return self._respond(params, cache_key)
+
+        site = self._field_profiler.site()
+        fields = self._field_profiler.field_list(self.RESOURCE_NAME, site)
+        if fields is None:
+            response = self._respond(params, cache_key)
+        else:
+            response = self._respond(dict(params, field_list=",".join(fields)))
+
+        return self._field_profiler.track(
+            response,
+            self.RESOURCE_NAME,
+            site,
+            fields,
+            self.RESPONSE_FIELD_MAP,
+            lambda: self._respond(params, cache_key),
+        )
+
+    def _respond(
+        self, params: Dict[str, Union[str, int]], cache_key: Optional[str] = None
+    ) -> Response:
         """Add required params, call GB API and format the response.
 
         Args:
             params: All of the params requested for the call
+            cache_key: The cache key of the call, if already known
 
         Returns:
             A Response object containing the GB API response
         """
-        params["api_key"] = self.api_key
-        params["format"] = self.RESPONSE_FORMAT_JSON
+        trace = self._trace()
+        with trace:
+            trace.begin("prepare")
+            self._prepare_params(params)
+
+            if cache_key is None:
+                cache_key = self._cache_key(params)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is None:
+                cached_response = self._get_catalog_response(params)
+            if cached_response is not None:
+                trace.hit_cache()
+                trace.begin("build")
+                return self._to_records(cached_response, params)
+
+            if self._single_flight is None:
+                pybomb_response = self._fetch(params, cache_key, trace)
+            else:
+                trace.begin("coalesce")
+                pybomb_response, coalesced = self._single_flight.do(
+                    self._flight_key(params, cache_key),
+                    lambda: self._fetch(params, cache_key, trace),
+                )
+                if coalesced:
+                    trace.coalesce()
+                    trace.begin("build")
+
+            return self._to_records(pybomb_response, params)
+
+    def _fetch(
+        self,
+        params: Dict[str, Union[str, int]],
+        cache_key: Optional[str],
+        trace: CallTrace,
+    ) -> Response:
+        """Call the GB API, and cache the response built from its body.
+
+        Args:
+            params: All of the params of the call
+            cache_key: The cache key of the call
+            trace: The trace of the call
 
-        response = self._query_api(params)
+        Returns:
+            A Response object containing the GB API response, with dict results
+        """
+        response = self._call_api(params, trace)
         self._validate_response(response)
 
-        return Response.from_response_data(response)
+        trace.begin("decode")
+        response_data = self._decoder(response.content)
+        trace.begin("validate")
+        self._validate_response_data(response_data)
+
+        trace.begin("build")
+        pybomb_response = Response.from_response_json(response.url, response_data)
+        self._cache_response(cache_key, pybomb_response, len(response.content))
+
+        return pybomb_response
+
+    def _stream(
+        self,
+        params: Dict[str, Union[str, int]],
+        cache_key: Optional[str] = None,
+    ) -> Generator[Mapping[str, Any], None, int]:
+        """Call the GB API, yielding each result as soon as it is decoded.
+
+        Responses already cached, or answered by the local catalog, are
+        yielded from there. Streamed responses are not cached, as that would
+        hold every result of the response at once, and are decoded by a
+        `ResultStream` rather than the decoder of the client.
+
+        Args:
+            params: All of the params requested for the call
+            cache_key: The cache key of the call, if already known
+
+        Yields:
+            Each result of the response, as a dict or record
+
+        Returns:
+            The total number of results of the call
+        """
+        trace = self._trace()
+        with trace:
+            trace.begin("prepare")
+            self._prepare_params(params)
+
+            if cache_key is None:
+                cache_key = self._cache_key(params)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is None:
+                cached_response = self._get_catalog_response(params)
+            if cached_response is not None:
+                trace.hit_cache()
+                trace.begin("build")
+                yield from self._to_records(cached_response, params).results
+                return cached_response.num_total_results
+
+            response = self._call_api(params, trace, stream=True)
+            with response:
+                self._validate_response(response)
+
+                trace.begin("decode")
+                record_class = self._record_class(params)
+                stream = ResultStream(
+                    response.iter_content(self.STREAM_CHUNK_SIZE),
+                    self._validate_stream_envelope,
+                )
+                try:
+                    for result in stream:
+                        yield record_class(result) if record_class else result
+                finally:
+                    trace.response(response.status_code, stream.bytes_received)
+
+            return stream.envelope["number_of_total_results"]
+
+    def _validate_stream_envelope(self, envelope: Dict[str, Any]) -> None:
+        """Validate the fields of a streamed body read before its results.
+
+        Args:
+            envelope: The fields of the body other than the results
+
+        Raises:
+            InvalidResponseException: The response was invalid
+        """
+        missing = {"status_code", "number_of_total_results"} - set(envelope)
+        if missing:
+            raise InvalidResponseException(
+                f'Response is missing {", ".join(sorted(missing))}'
+            )
+
+        self._validate_response_data(envelope)
+
+    def _call_api(
+        self,
+        params: Dict[str, Union[str, int]],
+        trace: CallTrace,
+        stream: bool = False,
+    ) -> RequestsResponse:
+        """Call the GB API, retrying failed calls as allowed by the retry policy.
+
+        Args:
+            params: All requests and required resource query parameters
+            trace: The trace of the call
+            stream: If the body of the response should be left to be streamed,
+                rather than read whole
+
+        Returns:
+            The raw requests Response from the last GB call made
+
+        Raises:
+            RequestException: The call failed, and may not be retried
+        """
+        attempt = 0
+        while True:
+            self._before_call()
+            if self._rate_limiter is not None:
+                trace.begin("throttle")
+                self._rate_limiter.acquire(self.RESOURCE_NAME)
+
+            trace.begin("request")
+            try:
+                if stream:
+                    response = self._stream_api(dict(params))
+                else:
+                    response = self._query_api(dict(params))
+            except RequestException:
+                delay = self._record_failure(attempt)
+                if delay is None:
+                    raise
+            else:
+                if not stream:
+                    trace.response(response.status_code, len(response.content))
+                if not self._is_retryable_status(response.status_code):
+                    self._record_success()
+                    return response
+
+                delay = self._record_failure(
+                    attempt, response.headers.get("Retry-After")
+                )
+                if delay is None:
+                    return response
+                response.close()
+
+            trace.begin("backoff")
+            trace.retry()
+            time.sleep(delay)
+            attempt += 1
 
     @abstractmethod
     def _query_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
@@ -141,23 +794,28 @@ class Client(ABC):
         """
         return RequestsResponse()  # pragma: no cover
 
+    @abstractmethod
+    def _stream_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
+        """Handle actual query to GB API, leaving the body to be streamed.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The raw requests Response from the GB call, with its body unread
+        """
+        return RequestsResponse()  # pragma: no cover
+
     def _validate_response(self, response: RequestsResponse) -> None:
-        """Validate the response from the GB API.
+        """Validate the HTTP status of the response from the GB API.
 
         Args:
             response: The raw requests response from the GB call
 
         Raises:
-            InvalidResponseException: The response was invalid
             BadRequestException: The request to the GB API was invalid
         """
         try:
             response.raise_for_status()
         except HTTPError as http_error:
             raise BadRequestException(str(http_error))
-
-        response_data = response.json()
-        if response_data["status_code"] != self.RESPONSE_STATUS_OK:
-            raise InvalidResponseException(
-                f'Response code {response_data["status_code"]}: {response_data["error"]}'
-            )
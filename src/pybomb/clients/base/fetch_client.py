@@ -1,14 +1,64 @@
 """Base client to extend to create fetch clients for endpoints of the GiantBomb API."""
 from abc import abstractmethod
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
-from requests import get, Response as RequestsResponse
+from requests import Response as RequestsResponse
 
-from pybomb.clients.base.client import Client
+from pybomb.clients.base.client import BaseClient, Client
 from pybomb.response import Response
 
 
-class FetchClient(Client):
+class BaseFetchClient(BaseClient):
+    """Fetch param handling shared by the sync and async fetch clients."""
+
+    def _build_fetch_params(
+        self, id_: int, return_fields: Optional[List]
+    ) -> Dict[str, Union[str, int]]:
+        """Validate the fetch arguments and build the params for the GB API call.
+
+        Args:
+            id_: The ID of the item to fetch
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields
+
+        Returns:
+            The fetch params for the GB API call
+        """
+        fetch_params: Dict[str, Union[str, int]] = {"id": id_}
+
+        if return_fields is not None:
+            self._validate_return_fields(return_fields)
+            fetch_params["field_list"] = ",".join(return_fields)
+
+        return fetch_params
+
+    def _fetch_uri(self, params: Dict[str, Union[str, int]]) -> str:
+        """Create the URI for the item, removing the ID from the params.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The URI of the item to fetch
+        """
+        id = params.pop("id")
+        return f"{self.URI_BASE}{self.RESOURCE_NAME}/{id}"
+
+    def _get_catalog_response(
+        self, params: Dict[str, Union[str, int]]
+    ) -> Optional[Response]:
+        """Skip the local catalog, which only answers searches.
+
+        Args:
+            params: All of the params requested for the call
+
+        Returns:
+            None, as fetches are always sent to the GB API
+        """
+        return None
+
+
+class FetchClient(BaseFetchClient, Client):
     """Base class for fetch GB API resource clients."""
 
     @abstractmethod
@@ -16,6 +66,29 @@ class FetchClient(Client):
         """Fetch details of a game by ID."""
         ...  # pragma: no cover
 
+    def stream_fetch(
+        self, id_: int, return_fields: Optional[List] = None
+    ) -> Mapping[str, Any]:
+        """Fetch details of an item by ID, decoding the body as it arrives.
+
+        The body is decoded incrementally, rather than being held whole and
+        then decoded, so large fields such as the description HTML are only
+        held in memory once. A response already cached is read from the
+        cache, but a streamed response is not cached, and is not profiled.
+
+        Args:
+            id_: The ID of the item
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+
+        Returns:
+            The details of the item, as a dict or record
+        """
+        (result,) = self._stream(self._build_fetch_params(id_, return_fields))
+
+        return result
+
     def _query_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
         """Handle actual query to GB API.
 
@@ -25,9 +98,24 @@ class FetchClient(Client):
         Returns:
             The raw requests Response from the GB call
         """
-        id = params.pop("id")
-        return get(
-            f"{self.URI_BASE}{self.RESOURCE_NAME}/{id}",
+        return self._session.get(
+            self._fetch_uri(params),
+            params=params,
+            headers=self._headers,
+        )
+
+    def _stream_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
+        """Handle actual query to GB API, leaving the body to be streamed.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The raw requests Response from the GB call, with its body unread
+        """
+        return self._session.get(
+            self._fetch_uri(params),
             params=params,
             headers=self._headers,
+            stream=True,
         )
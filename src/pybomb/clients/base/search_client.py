@@ -1,33 +1,78 @@
 """Base client to extend to create search clients for endpoints of the GiantBomb API."""
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Union
 
-from requests import get, Response as RequestsResponse
+from requests import Response as RequestsResponse
 
-from pybomb.clients.base.client import Client
+from pybomb.clients.base.client import BaseClient, Client
+from pybomb.exceptions import InvalidPlanException
+from pybomb.fields import NamedQuery
+from pybomb.plan import SearchPlan
 from pybomb.response import Response
 
 
-class SearchClient(Client):
-    """Base class for search GB API resource clients."""
+class BaseSearchClient(BaseClient):
+    """Search param handling shared by the sync and async search clients."""
 
-    def search(
+    MAX_PAGE_SIZE = 100
+
+    def _build_search_params(
         self,
         filter_by: Dict[str, Any],
-        return_fields: List = None,
+        return_fields: Optional[List],
+        sort_by: Optional[str],
+        desc: bool,
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Dict[str, Union[str, int]]:
+        """Validate the search arguments and build the params for the GB API call.
+
+        Args:
+            filter_by: A map of fields to filter the search by
+            return_fields: A list of fields to be returned by the response
+            sort_by: The field to sort the items in the reponse by
+            desc: If sort direction is DESC or not (ASC)
+            limit: The max number of items to request
+            offset: The start offset for the return items, based on the given sort
+
+        Returns:
+            The search params for the GB API call
+        """
+        self._validate_filter_fields(filter_by)
+        search_filter = self._create_search_filter(filter_by)
+
+        search_params: Dict[str, Union[str, int]] = {"filter": search_filter}
+        self._apply_return_fields(return_fields, search_params)
+        self._apply_sort_by(sort_by, desc, search_params)
+        self._apply_limit(limit, search_params)
+        self._apply_offset(offset, search_params)
+
+        return search_params
+
+    def prepare(
+        self,
+        filter_by: Optional[Dict[str, Any]] = None,
+        bind: Iterable[str] = (),
+        return_fields: Optional[List] = None,
         sort_by: Optional[str] = None,
         desc: bool = True,
         limit: Optional[int] = None,
-        offset: Optional[int] = None,
-    ) -> Response:
-        """Full search of resource.
+    ) -> SearchPlan:
+        """Validate and compile a search once, to be executed many times.
 
-        Supports all search fields available in API
-        http://www.giantbomb.com/api/documentation
+        Executing the plan with :meth:`execute` only binds the values of the
+        `bind` fields and the offset, skipping the validation and building of
+        the rest of the search. A plan executed with bound values makes the
+        same call, with the same cache key, as :meth:`search` called with the
+        fixed filters followed by the bound ones.
 
         Args:
-            filter_by: A map of fields to filter the search by. These will
+            filter_by: A map of fields to filter every execution by. These will
                 be validated against the availiable search fields
+            bind: The filter fields given a value on each execution. These
+                will be validated against the availiable search fields
             return_fields: A list of fields to be returned by the response.
                 These will be validated against the availiable return fields.
                 The default is to return everything
@@ -35,35 +80,68 @@ class SearchClient(Client):
                 These will be validated against the availiable sort fields.
             desc: If sort direction is DESC or not (ASC). Defaults to True
             limit: The max number of items to request
-            offset: The start offset for the return items, based on the given sort.
 
         Returns:
-             A PyBomb Response containing the results of the search
+            The immutable plan of the search
         """
+        filter_by = filter_by or {}
+        bound_fields = tuple(bind)
         self._validate_filter_fields(filter_by)
-        search_filter = self._create_search_filter(filter_by)
+        self._validate_filter_fields(dict.fromkeys(bound_fields, ""))
 
-        search_params: Dict[str, Union[str, int]] = {"filter": search_filter}
-        self._apply_return_fields(return_fields, search_params)
-        self._apply_sort_by(sort_by, desc, search_params)
-        self._apply_limit(limit, search_params)
-        self._apply_offset(offset, search_params)
+        params: Dict[str, Union[str, int]] = {}
+        self._apply_return_fields(return_fields, params)
+        self._apply_sort_by(sort_by, desc, params)
+        self._apply_limit(limit, params)
 
-        response = self._query(search_params)
+        return SearchPlan.compile(
+            self.RESOURCE_NAME,
+            params,
+            self._create_search_filter(filter_by),
+            bound_fields,
+            self.RESPONSE_FORMAT_JSON,
+        )
 
-        return response
+    def _bind_plan(
+        self, plan: SearchPlan, values: Dict[str, Any], offset: Optional[int]
+    ) -> Dict[str, Union[str, int]]:
+        """Build the params of an execution of a plan.
 
-    @abstractmethod
-    def quick_search(
-        self,
-        name: str,
-        sort_by: Optional[str] = None,
-        desc: bool = True,
-        *args: Any,
-        **kwargs: Any,
-    ) -> Response:
-        """Search with a simplier API."""
-        ...  # pragma: no cover
+        Args:
+            plan: The plan to execute
+            values: The values of the bound filter fields
+            offset: The start offset for the return items
+
+        Returns:
+            The search params for the GB API call
+
+        Raises:
+            InvalidPlanException: The plan is for another resource
+        """
+        if plan.resource != self.RESOURCE_NAME:
+            raise InvalidPlanException(
+                f'A plan for "{plan.resource}" cannot be executed on '
+                f'"{self.RESOURCE_NAME}"'
+            )
+
+        return plan.bind(values, offset)
+
+    def _plan_cache_key(
+        self, plan: SearchPlan, params: Dict[str, Union[str, int]]
+    ) -> Optional[str]:
+        """Get the cache key of an execution of a plan, if caching is enabled.
+
+        Args:
+            plan: The plan executed
+            params: The params of the execution
+
+        Returns:
+            The cache key, or None if the client has no cache
+        """
+        if self._cache is None:
+            return None
+
+        return plan.cache_key(params)
 
     def _apply_return_fields(
         self, return_fields: Optional[List], search_params: Dict[str, Union[str, int]],
@@ -139,6 +217,239 @@ class SearchClient(Client):
 
         search_params["offset"] = int(offset)
 
+
+class SearchClient(BaseSearchClient, Client):
+    """Base class for search GB API resource clients."""
+
+    def search(
+        self,
+        filter_by: Dict[str, Any],
+        return_fields: Optional[List] = None,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Response:
+        """Full search of resource.
+
+        Supports all search fields available in API
+        http://www.giantbomb.com/api/documentation
+
+        Args:
+            filter_by: A map of fields to filter the search by. These will
+                be validated against the availiable search fields
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            limit: The max number of items to request
+            offset: The start offset for the return items, based on the given sort.
+            expand: A list of fields holding references to replace with the
+                objects they refer to, resolved in batches across the results.
+                See :mod:`pybomb.expand`
+
+        Returns:
+             A PyBomb Response containing the results of the search
+        """
+        expander = self._expander(expand) if expand else None
+        search_params = self._build_search_params(
+            filter_by,
+            self._expanded_return_fields(return_fields, expand),
+            sort_by,
+            desc,
+            limit,
+            offset,
+        )
+
+        response = self._query(search_params)
+
+        return expander.expand(response) if expander else response
+
+    def execute(
+        self, plan: SearchPlan, offset: Optional[int] = None, **values: Any
+    ) -> Response:
+        """Execute a search prepared by :meth:`prepare`.
+
+        Args:
+            plan: The plan of the search
+            offset: The start offset for the return items, based on the given sort.
+            values: The values of the filter fields bound by the plan
+
+        Returns:
+             A PyBomb Response containing the results of the search
+        """
+        params = self._bind_plan(plan, values, offset)
+
+        return self._query(params, self._plan_cache_key(plan, params))
+
+    def iter_search(
+        self,
+        filter_by: Dict[str, Any],
+        return_fields: Optional[List] = None,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        page_size: int = BaseSearchClient.MAX_PAGE_SIZE,
+        workers: int = 1,
+        expand: Optional[List[str]] = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Lazily iterate over every result of a search, across all pages.
+
+        The first page is fetched straight away, and following pages are
+        fetched in the background while the results of the current page are
+        being consumed. Once the first page reports the total number of
+        results, up to `workers` of the remaining pages are fetched at once.
+        Results are always yielded in the order of the search. The search is
+        prepared once, and executed for each page.
+
+        At most `workers` pages ahead are requested, so stopping the
+        iteration early does not fetch the rest of the result set.
+
+        Args:
+            filter_by: A map of fields to filter the search by. These will
+                be validated against the availiable search fields
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            page_size: The number of results to request per page.
+                Defaults to the max allowed by the GB API
+            workers: The max number of pages to fetch concurrently. Defaults to 1
+            expand: A list of fields holding references to replace with the
+                objects they refer to. The references of each page are resolved
+                in batches, along with any not resolved for earlier pages
+
+        Yields:
+            Each result of the search, in order
+        """
+        expander = self._expander(expand) if expand else None
+        plan = self.prepare(
+            filter_by,
+            return_fields=self._expanded_return_fields(return_fields, expand),
+            sort_by=sort_by,
+            desc=desc,
+            limit=page_size,
+        )
+        # Pages fetched in the background are profiled as the first page.
+        site = self._field_profiler.site() if self._field_profiler else None
+
+        def execute(offset: int) -> Response:
+            with NamedQuery(site):
+                return self.execute(plan, offset)
+
+        def expand_page(page: Response) -> List[Mapping[str, Any]]:
+            return expander.expand(page).results if expander else page.results
+
+        first_page = execute(0)
+        offsets = iter(range(page_size, first_page.num_total_results, page_size))
+        pending: Deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def fetch_next_page() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append(executor.submit(execute, offset))
+
+            try:
+                for _ in range(workers):
+                    fetch_next_page()
+
+                yield from expand_page(first_page)
+
+                while pending:
+                    page = pending.popleft().result()
+                    fetch_next_page()
+                    yield from expand_page(page)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def stream_search(
+        self,
+        filter_by: Dict[str, Any],
+        return_fields: Optional[List] = None,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        page_size: int = BaseSearchClient.MAX_PAGE_SIZE,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Lazily iterate over every result of a search, decoding each as it arrives.
+
+        Each page is decoded incrementally, so its first result is yielded as
+        soon as it has been received, and only the result being decoded is
+        held in memory rather than the whole page. The envelope of each page
+        is validated before any of its results are yielded. Pages are fetched
+        one at a time, as the previous page is consumed.
+
+        Pages already cached are yielded from the cache, but streamed pages are
+        not cached, and are not profiled.
+
+        Args:
+            filter_by: A map of fields to filter the search by. These will
+                be validated against the availiable search fields
+            return_fields: A list of fields to be returned by the response.
+                These will be validated against the availiable return fields.
+                The default is to return everything
+            sort_by: The field to sort the items in the reponse by.
+                These will be validated against the availiable sort fields.
+            desc: If sort direction is DESC or not (ASC). Defaults to True
+            page_size: The number of results to request per page.
+                Defaults to the max allowed by the GB API
+
+        Yields:
+            Each result of the search, in order
+        """
+        plan = self.prepare(
+            filter_by,
+            return_fields=return_fields,
+            sort_by=sort_by,
+            desc=desc,
+            limit=page_size,
+        )
+
+        offset = 0
+        while True:
+            params = self._bind_plan(plan, {}, offset)
+            total = yield from self._stream(params, self._plan_cache_key(plan, params))
+            offset += page_size
+            if offset >= total:
+                return
+
+    @abstractmethod
+    def quick_search(
+        self,
+        name: str,
+        sort_by: Optional[str] = None,
+        desc: bool = True,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Search with a simplier API."""
+        ...  # pragma: no cover
+
+    def _search_ids(
+        self, ids: List[int], return_fields: Optional[List] = None
+    ) -> Response:
+        """Search for the items with the given IDs, in one call.
+
+        Args:
+            ids: The IDs of the items, up to `MAX_PAGE_SIZE` of them
+            return_fields: A list of fields to be returned for each item.
+                The default is to return everything
+
+        Returns:
+             A PyBomb Response containing the items found
+        """
+        return self.search(
+            {"id": "|".join(str(id_) for id_ in ids)},
+            return_fields,
+            limit=self.MAX_PAGE_SIZE,
+        )
+
     def _query_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
         """Handle actual query to GB API.
 
@@ -148,6 +459,22 @@ class SearchClient(Client):
         Returns:
             The raw requests Response from the GB call
         """
-        return get(
+        return self._session.get(
             self.URI_BASE + self.RESOURCE_NAME, params=params, headers=self._headers
         )
+
+    def _stream_api(self, params: Dict[str, Union[str, int]]) -> RequestsResponse:
+        """Handle actual query to GB API, leaving the body to be streamed.
+
+        Args:
+            params: All requests and required resource query parameters
+
+        Returns:
+            The raw requests Response from the GB call, with its body unread
+        """
+        return self._session.get(
+            self.URI_BASE + self.RESOURCE_NAME,
+            params=params,
+            headers=self._headers,
+            stream=True,
+        )
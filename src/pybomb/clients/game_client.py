@@ -2,11 +2,15 @@
 
 https://www.giantbomb.com/api/documentation#toc-0-16
 """
-from typing import Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast, Dict, Iterable, List, Optional
 
 from pybomb.clients.base.client import ResponseParam
 from pybomb.clients.base.fetch_client import FetchClient
-from pybomb.response import Response
+from pybomb.clients.games_client import GamesClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.records import record_type
+from pybomb.response import FetchManyResult, Response
 
 
 class GameClient(FetchClient):
@@ -14,6 +18,8 @@ class GameClient(FetchClient):
 
     RESOURCE_NAME = "game"
 
+    EXPAND_FIELD_MAP = {"platforms": PlatformsClient, "similar_games": GamesClient}
+
     RESPONSE_FIELD_MAP = {
         "aliases": ResponseParam(True, False),
         "api_detail_url": ResponseParam(True, False),
@@ -56,7 +62,12 @@ class GameClient(FetchClient):
         "videos": ResponseParam(True, False),
     }
 
-    def fetch(self, id_: int, return_fields: List = None) -> Response:
+    def fetch(
+        self,
+        id_: int,
+        return_fields: Optional[List] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Response:
         """Fetch details of a game by ID.
 
         Args:
@@ -64,18 +75,96 @@ class GameClient(FetchClient):
             return_fields: A list of fields to be returned by the response.
                 These will be validated against the availiable return fields.
                 The default is to return everything
+            expand: A list of fields holding references to replace with the
+                objects they refer to, resolved in batches.
+                See :mod:`pybomb.expand`
 
         Returns:
             A Pybomb Respose object containing the details of the requested game
         """
-        game_params: Dict[str, Union[str, int]] = {"id": id_}
+        expander = self._expander(expand) if expand else None
+        game_params = self._build_fetch_params(
+            id_, self._expanded_return_fields(return_fields, expand)
+        )
 
-        if return_fields is not None:
-            self._validate_return_fields(return_fields)
-            field_list = ",".join(return_fields)
+        response = self._query(game_params)
 
-            game_params["field_list"] = field_list
+        return expander.expand(response) if expander else response
 
-        response = self._query(game_params)
+    def fetch_many(
+        self,
+        ids: Iterable[int],
+        return_fields: Optional[List] = None,
+        workers: int = 1,
+    ) -> FetchManyResult:
+        """Fetch details of many games by ID, in as few calls as possible.
+
+        The games are searched for on the 'games' resource, filtering by up to
+        100 IDs per call. Fields only returned by the 'game' resource are then
+        fetched one game at a time, for the games that were found.
+
+        Args:
+            ids: The IDs of the games
+            return_fields: A list of fields to be returned for each game.
+                These will be validated against the availiable return fields.
+                The default is to return everything, which requires a call per game
+            workers: The max number of calls to make concurrently. Defaults to 1
+
+        Returns:
+            The details of each game found keyed by ID, always including the
+            ID, and the IDs of the games that were not found. The details are
+            records if the client uses them
+        """
+        if return_fields is None:
+            return_fields = list(self.RESPONSE_FIELD_MAP)
+        self._validate_return_fields(return_fields)
+
+        unique_ids = list(dict.fromkeys(ids))
+        search_fields = [
+            field for field in return_fields if field in GamesClient.RESPONSE_FIELD_MAP
+        ]
+        detail_fields = [
+            field
+            for field in return_fields
+            if field not in GamesClient.RESPONSE_FIELD_MAP
+        ]
+
+        games_client = cast(
+            GamesClient, self._sibling(GamesClient, self._cache, self._catalog)
+        )
+        page_size = GamesClient.MAX_PAGE_SIZE
+        id_chunks = [
+            unique_ids[start : start + page_size]
+            for start in range(0, len(unique_ids), page_size)
+        ]
+
+        def search_chunk(id_chunk: List[int]) -> Response:
+            return games_client._search_ids(id_chunk, search_fields + ["id"])
+
+        def fetch_details(id_: int) -> Response:
+            return self.fetch(id_, detail_fields + ["id"])
+
+        results: Dict[int, dict] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for page in executor.map(search_chunk, id_chunks):
+                for result in page.results:
+                    # Copied, as the page may be held by the cache
+                    results[result["id"]] = dict(result)
+
+            if detail_fields:
+                found_ids = [id_ for id_ in unique_ids if id_ in results]
+                for response in executor.map(fetch_details, found_ids):
+                    result = response.results[0]
+                    results[result["id"]].update(result)
+
+        missing = [id_ for id_ in unique_ids if id_ not in results]
+
+        if not self._records:
+            return FetchManyResult(results, missing)
+
+        record_class = record_type(
+            self.RESOURCE_NAME, tuple(dict.fromkeys(return_fields + ["id"]))
+        )
+        records = {id_: record_class(result) for id_, result in results.items()}
 
-        return response
+        return FetchManyResult(records, missing)
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional, Union
 
 from pybomb.clients.base.client import ResponseParam
 from pybomb.clients.base.search_client import SearchClient
+from pybomb.clients.platforms_client import PlatformsClient
 from pybomb.response import Response
 
 
@@ -14,6 +15,8 @@ class GamesClient(SearchClient):
 
     RESOURCE_NAME = "games"
 
+    EXPAND_FIELD_MAP = {"platforms": PlatformsClient}
+
     RESPONSE_FIELD_MAP = {
         "aliases": ResponseParam(True, False),
         "api_detail_url": ResponseParam(False, False),
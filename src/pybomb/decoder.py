@@ -0,0 +1,25 @@
+"""JSON decoders used to decode GB API responses."""
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+Decoder = Callable[[Union[bytes, str]], Any]
+
+
+def get_default_decoder() -> Decoder:
+    """Get the fastest JSON decoder available.
+
+    orjson is used when installed (``pip install pybomb[speedups]``), falling
+    back to the standard library `json` module.
+
+    Returns:
+        A function decoding a JSON document from bytes
+    """
+    if orjson is not None:
+        return orjson.loads
+
+    return json.loads
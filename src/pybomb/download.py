@@ -0,0 +1,280 @@
+"""Concurrent mirroring of the images of results to disk.
+
+An `ImageDownloader` consumes a stream of results, such as those of
+`SearchClient.iter_search`, and downloads the wanted sizes of their `image`
+over a bounded pool of threads sharing pooled connections. Each file is
+streamed to disk in chunks, so it is never held in memory whole.
+"""
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+from urllib.parse import unquote, urlparse
+
+from requests import Session
+from requests.exceptions import RequestException
+
+from pybomb.session import create_session
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_SIZES = ("original_url",)
+
+
+class DownloadStats(NamedTuple):
+    """The outcome of downloading the images of a stream of results."""
+
+    downloaded: int
+    existing: int
+    duplicate_urls: int
+    duplicate_content: int
+    failed: int
+    bytes_received: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The bytes received per second."""
+        return self.bytes_received / self.seconds if self.seconds else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        """The files downloaded per second."""
+        return self.downloaded / self.seconds if self.seconds else 0.0
+
+
+class _Counts:
+    """The counts of a download, updated by the threads of the pool."""
+
+    __slots__ = (
+        "downloaded",
+        "existing",
+        "duplicate_urls",
+        "duplicate_content",
+        "failed",
+        "bytes_received",
+    )
+
+    def __init__(self) -> None:
+        """Init the counts at zero."""
+        self.downloaded = 0
+        self.existing = 0
+        self.duplicate_urls = 0
+        self.duplicate_content = 0
+        self.failed = 0
+        self.bytes_received = 0
+
+
+class ImageDownloader:
+    """Downloads the images of results into a directory, mirroring their URLs.
+
+    Each image is saved under the path of its URL within the directory, so
+    every size of an image gets its own file. URLs already seen by the
+    downloader, and files already present, are skipped without a request.
+    Files with the same content as one already downloaded are replaced with
+    a hard link to it.
+
+    At most `workers` images are downloaded at once, and results are only
+    read from the stream as downloads finish, so a slow disk or network
+    holds back the search feeding it. Images that cannot be downloaded are
+    counted as failed, and any partial file is removed.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        sizes: Sequence[str] = DEFAULT_SIZES,
+        workers: int = 8,
+        session: Optional[Session] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = 30.0,
+    ) -> None:
+        """Init the downloader with where to save the images.
+
+        Args:
+            directory: The directory to save the images in
+            sizes: The keys of the `image` of each result to download, such as
+                `original_url` or `thumb_url`. Defaults to the original
+            workers: The max number of images to download at once
+            session: The session to download with. Defaults to a new session
+                with a connection per worker
+            chunk_size: The number of bytes to read and write at a time
+            timeout: The number of seconds to wait for the server to respond
+        """
+        self.directory = Path(directory)
+        self.sizes = tuple(sizes)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._session = (
+            session if session is not None else create_session(pool_maxsize=workers)
+        )
+        self._lock = threading.Lock()
+        self._seen_urls: Set[str] = set()
+        self._paths_by_hash: Dict[str, Path] = {}
+
+    def download(self, results: Iterable[Mapping[str, Any]]) -> DownloadStats:
+        """Download the images of a stream of results.
+
+        An error other than a failed request, such as a full disk, stops the
+        download and is raised once the downloads in flight finish.
+
+        Args:
+            results: The results, as dicts or records
+
+        Returns:
+            The counts of images downloaded and skipped, and the throughput
+        """
+        counts = _Counts()
+        start = time.perf_counter()
+        pending: Set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for url in self._urls(results):
+                if url in self._seen_urls:
+                    counts.duplicate_urls += 1
+                    continue
+                self._seen_urls.add(url)
+
+                path = self.path_for(url)
+                if path.exists():
+                    counts.existing += 1
+                    continue
+
+                if len(pending) >= self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(self._fetch, url, path, counts))
+
+        for future in pending:
+            future.result()
+
+        return DownloadStats(
+            counts.downloaded,
+            counts.existing,
+            counts.duplicate_urls,
+            counts.duplicate_content,
+            counts.failed,
+            counts.bytes_received,
+            time.perf_counter() - start,
+        )
+
+    def path_for(self, url: str) -> Path:
+        """Get the path an image is saved at.
+
+        Args:
+            url: The URL of the image
+
+        Returns:
+            The path of the URL within the directory, or the SHA-256 of the URL
+            for URLs without a path
+        """
+        parts = [
+            part
+            for part in PurePosixPath(unquote(urlparse(url).path)).parts
+            if part not in ("/", ".", "..")
+        ]
+        if not parts:
+            parts = [hashlib.sha256(url.encode()).hexdigest()]
+
+        return self.directory.joinpath(*parts)
+
+    def _urls(self, results: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+        """Get the URLs of the wanted sizes of the images of results.
+
+        Args:
+            results: The results
+
+        Yields:
+            Each URL, in order
+        """
+        for result in results:
+            image = result.get("image")
+            if not isinstance(image, Mapping):
+                continue
+
+            for size in self.sizes:
+                url = image.get(size)
+                if url:
+                    yield url
+
+    def _fetch(self, url: str, path: Path, counts: _Counts) -> None:
+        """Stream an image to disk, linking it to any file with the same content.
+
+        Args:
+            url: The URL of the image
+            path: The path to save the image at
+            counts: The counts of the download
+
+        Raises:
+            BaseException: Any error other than a failed request, once the
+                partial file is removed
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.part")
+        digest = hashlib.sha256()
+        received = 0
+
+        try:
+            with self._session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(partial, "wb") as file:
+                    for chunk in response.iter_content(self.chunk_size):
+                        file.write(chunk)
+                        digest.update(chunk)
+                        received += len(chunk)
+        except BaseException as error:
+            if partial.exists():
+                partial.unlink()
+            if not isinstance(error, RequestException):
+                raise
+            with self._lock:
+                counts.failed += 1
+            return
+
+        with self._lock:
+            counts.bytes_received += received
+            original = self._paths_by_hash.get(digest.hexdigest())
+            if original is None:
+                self._paths_by_hash[digest.hexdigest()] = path
+                counts.downloaded += 1
+            else:
+                counts.duplicate_content += 1
+
+        if original is not None and self._link(original, path):
+            partial.unlink()
+        else:
+            partial.replace(path)
+
+    @staticmethod
+    def _link(original: Path, path: Path) -> bool:
+        """Hard link a path to a file with the same content.
+
+        Args:
+            original: The path of the file
+            path: The path to link
+
+        Returns:
+            True if the path was linked, False if the filesystem does not
+            support hard links
+        """
+        try:
+            os.link(original, path)
+        except OSError:
+            return False
+
+        return True
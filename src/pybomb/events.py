@@ -0,0 +1,273 @@
+"""Lifecycle events of the calls made by clients to the GB API.
+
+Register listeners on an `EventHooks` and hand it to clients, or a factory, to
+be told about every call: how long each phase took, the bytes received, the
+status of the response and whether it was served from the cache or retried.
+Clients without hooks, or with hooks without listeners, skip all timing.
+"""
+import time
+from types import TracebackType
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+
+class Phase(NamedTuple):
+    """A timed phase of a call.
+
+    Calls go through some of these phases, in order: "prepare", adding the
+    params and looking up the cache, "coalesce", joining an identical call in
+    flight, then for each attempt "throttle", waiting on the rate limiter,
+    "request", and "backoff" before any retry, followed by "decode",
+    "validate", and "build", creating the response.
+    """
+
+    name: str
+    start: float
+    duration: float
+
+
+class CallEvent(NamedTuple):
+    """A call made by a client, emitted once the call has ended.
+
+    `start` times are seconds since the epoch, and durations are in seconds.
+    `coalesced` calls waited for an identical call made by another caller.
+    """
+
+    resource: str
+    start: float
+    duration: float
+    phases: Tuple[Phase, ...]
+    status: Optional[int]
+    bytes_received: int
+    cache_hit: bool
+    retries: int
+    error: Optional[BaseException]
+    coalesced: bool = False
+
+
+Listener = Callable[[CallEvent], None]
+
+
+class EventHooks:
+    """Listeners told about each call made by the clients using the hooks.
+
+    Hooks can be shared between clients. Listeners are called in the thread,
+    or event loop, that made the call, once the call has ended.
+    """
+
+    def __init__(self, listeners: Iterable[Listener] = ()) -> None:
+        """Init the hooks with any listeners.
+
+        Args:
+            listeners: The listeners to register
+        """
+        self._listeners: Tuple[Listener, ...] = tuple(listeners)
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register a listener.
+
+        Args:
+            listener: A function called with the event of each call
+        """
+        self._listeners += (listener,)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """Unregister a listener.
+
+        Args:
+            listener: The listener to remove
+        """
+        self._listeners = tuple(
+            registered for registered in self._listeners if registered != listener
+        )
+
+    def trace(self, resource: str) -> "CallTrace":
+        """Start timing a call.
+
+        Args:
+            resource: The name of the resource called
+
+        Returns:
+            The trace of the call, which does nothing if there are no listeners
+        """
+        if not self._listeners:
+            return NULL_TRACE
+
+        return CallTrace(self, resource)
+
+    def emit(self, event: CallEvent) -> None:
+        """Tell every listener about a call.
+
+        Args:
+            event: The event of the call
+        """
+        for listener in self._listeners:
+            listener(event)
+
+
+class CallTrace:
+    """Times the phases of a call, emitting its event when the call ends.
+
+    Used as a context manager around the call, so failed calls are emitted
+    along with their error.
+    """
+
+    def __init__(
+        self,
+        hooks: EventHooks,
+        resource: str,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Start timing the call.
+
+        Args:
+            hooks: The hooks to emit the event of the call to
+            resource: The name of the resource called
+            clock: Function returning the current time in seconds
+        """
+        self.resource = resource
+        self.status: Optional[int] = None
+        self.bytes_received = 0
+        self.cache_hit = False
+        self.retries = 0
+        self.coalesced = False
+        self._hooks = hooks
+        self._clock = clock
+        self._start = clock()
+        self._epoch_start = time.time()
+        self._phases: List[Phase] = []
+        self._phase: Optional[str] = None
+        self._phase_start = self._start
+
+    def begin(self, phase: str) -> None:
+        """End the current phase of the call, and begin the next.
+
+        Args:
+            phase: The name of the phase beginning
+        """
+        now = self._clock()
+        self._end_phase(now)
+        self._phase = phase
+        self._phase_start = now
+
+    def response(self, status: int, size: int) -> None:
+        """Record a response received for the call.
+
+        Args:
+            status: The HTTP status of the response
+            size: The size of the response body in bytes
+        """
+        self.status = status
+        self.bytes_received += size
+
+    def hit_cache(self) -> None:
+        """Record the call was answered from the cache."""
+        self.cache_hit = True
+
+    def retry(self) -> None:
+        """Record the call is being retried."""
+        self.retries += 1
+
+    def coalesce(self) -> None:
+        """Record the call was answered by an identical call in flight."""
+        self.coalesced = True
+
+    def __enter__(self) -> "CallTrace":
+        """Trace the call made within the context.
+
+        Returns:
+            The trace
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """End the call, and emit its event.
+
+        A stream of results closed before its end, raising `GeneratorExit`
+        within the call, is a call that ended normally.
+
+        Args:
+            exc_type: The type of any exception raised by the call
+            exc: Any exception raised by the call
+            traceback: The traceback of any exception raised by the call
+        """
+        now = self._clock()
+        self._end_phase(now)
+        self._hooks.emit(
+            CallEvent(
+                self.resource,
+                self._epoch_start,
+                now - self._start,
+                tuple(self._phases),
+                self.status,
+                self.bytes_received,
+                self.cache_hit,
+                self.retries,
+                None if isinstance(exc, GeneratorExit) else exc,
+                self.coalesced,
+            )
+        )
+
+    def _end_phase(self, now: float) -> None:
+        """Record the current phase, if there is one, as ended.
+
+        Args:
+            now: The time the phase ended
+        """
+        if self._phase is None:
+            return
+
+        start = self._epoch_start + self._phase_start - self._start
+        self._phases.append(Phase(self._phase, start, now - self._phase_start))
+
+
+class _NullTrace(CallTrace):
+    """A trace that does nothing, used when there are no listeners."""
+
+    def __init__(self) -> None:
+        """Init the trace, without starting to time."""
+
+    def begin(self, phase: str) -> None:
+        """Do nothing.
+
+        Args:
+            phase: The name of the phase beginning
+        """
+
+    def response(self, status: int, size: int) -> None:
+        """Do nothing.
+
+        Args:
+            status: The HTTP status of the response
+            size: The size of the response body in bytes
+        """
+
+    def hit_cache(self) -> None:
+        """Do nothing."""
+
+    def retry(self) -> None:
+        """Do nothing."""
+
+    def coalesce(self) -> None:
+        """Do nothing."""
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Do nothing.
+
+        Args:
+            exc_type: The type of any exception raised by the call
+            exc: Any exception raised by the call
+            traceback: The traceback of any exception raised by the call
+        """
+
+
+NULL_TRACE: CallTrace = _NullTrace()
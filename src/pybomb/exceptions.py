@@ -31,6 +31,12 @@ class InvalidFilterFieldException(ClientException):
     pass
 
 
+class InvalidExpandFieldException(ClientException):
+    """Exception for fields that cannot be expanded."""
+
+    pass
+
+
 class InvalidResponseException(ClientException):
     """Exception thrown when receiving an invalid response from selected resource."""
 
@@ -47,3 +53,15 @@ class InvalidClientException(ClientException):
     """Exception thrown when attempting to import a non-defined client."""
 
     pass
+
+
+class CircuitOpenException(ClientException):
+    """Exception thrown when failing fast, as the requested resource is down."""
+
+    pass
+
+
+class InvalidPlanException(ClientException):
+    """Exception thrown when executing a search plan on the wrong client."""
+
+    pass
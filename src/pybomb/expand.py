@@ -0,0 +1,207 @@
+"""Batched resolution of the references held by results.
+
+Results hold references to other resources as stubs, such as the platforms of
+a game. An `Expander` replaces the stubs with the full objects they refer to,
+resolving every reference of a page, or a stream of pages, in as few calls
+as possible, rather than a call per reference.
+"""
+import json
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pybomb.cache import Cache
+from pybomb.records import Record
+from pybomb.response import Response
+
+Resolver = Callable[[List[int]], Response]
+
+
+def _references(value: Any) -> List[Mapping[str, Any]]:
+    """Get the references held by the value of a field.
+
+    Args:
+        value: The value of the field, a reference or a list of references
+
+    Returns:
+        The references
+    """
+    references = value if isinstance(value, list) else [value]
+
+    return [
+        reference
+        for reference in references
+        if isinstance(reference, Mapping) and "id" in reference
+    ]
+
+
+class Expander:
+    """Replaces references held by results with the objects they refer to.
+
+    The IDs referenced by the expanded fields are collected across all of the
+    results, deduped, and resolved by resource in batches of up to
+    `BATCH_SIZE` IDs. Objects resolved are kept by the expander, so the pages
+    of a stream only resolve the references not already seen, and are cached
+    by ID in the cache, if given, to be shared between expanders.
+
+    Each reference is replaced by the object it refers to, keeping any of the
+    fields of the reference the object does not have. References that cannot
+    be resolved are kept as they are. Results are copied rather than updated,
+    so cached responses are left as they are.
+    """
+
+    BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        resolvers: Mapping[str, Tuple[str, Resolver]],
+        cache: Optional[Cache] = None,
+    ) -> None:
+        """Init the expander with the fields to expand.
+
+        Args:
+            resolvers: The resource each expanded field refers to, and the
+                function searching the resource for a batch of IDs, by field
+            cache: The cache to share resolved objects in. When None, objects
+                are only kept by the expander
+        """
+        self.calls = 0
+        self._resolvers = resolvers
+        self._cache = cache
+        self._objects: Dict[str, Dict[int, Mapping[str, Any]]] = {
+            resource: {} for resource, _ in resolvers.values()
+        }
+
+    def expand(self, response: Response) -> Response:
+        """Expand the references held by the results of a response.
+
+        Args:
+            response: The response to expand
+
+        Returns:
+            The response, with its results expanded
+        """
+        self._resolve(response.results)
+        results = [self._expand_result(result) for result in response.results]
+        result = results[0] if response.result is not None else None
+
+        return response._replace(results=results, result=result)
+
+    def _resolve(self, results: Iterable[Mapping[str, Any]]) -> None:
+        """Resolve every reference held by the results not already resolved.
+
+        Args:
+            results: The results to resolve the references of
+        """
+        wanted: Dict[str, Dict[int, None]] = {}
+        for result in results:
+            for field, (resource, _) in self._resolvers.items():
+                objects = self._objects[resource]
+                for reference in _references(result.get(field)):
+                    if reference["id"] not in objects:
+                        wanted.setdefault(resource, {})[reference["id"]] = None
+
+        resolvers = dict(self._resolvers.values())
+        for resource, ids in wanted.items():
+            missing = [id_ for id_ in ids if not self._get_cached(resource, id_)]
+            for start in range(0, len(missing), self.BATCH_SIZE):
+                batch = missing[start : start + self.BATCH_SIZE]
+                response = resolvers[resource](batch)
+                self.calls += 1
+                for found in response.results:
+                    self._objects[resource][found["id"]] = found
+                    self._cache_object(resource, response.uri, found)
+
+    def _get_cached(self, resource: str, id_: int) -> bool:
+        """Get a resolved object from the cache.
+
+        Args:
+            resource: The name of the resource of the object
+            id_: The ID of the object
+
+        Returns:
+            True if the object was cached
+        """
+        if self._cache is None:
+            return False
+
+        response = self._cache.get(self._cache_key(resource, id_))
+        if response is None:
+            return False
+
+        self._objects[resource][id_] = response.results[0]
+        return True
+
+    def _cache_object(self, resource: str, uri: str, found: Mapping[str, Any]) -> None:
+        """Cache a resolved object by ID.
+
+        Args:
+            resource: The name of the resource of the object
+            uri: The URI the object was resolved from
+            found: The object
+        """
+        if self._cache is None:
+            return
+
+        self._cache.set(
+            resource,
+            self._cache_key(resource, found["id"]),
+            Response(uri, 1, 1, [found], None),
+            len(json.dumps(found)),
+        )
+
+    @staticmethod
+    def _cache_key(resource: str, id_: int) -> str:
+        """Create the cache key of a resolved object.
+
+        Args:
+            resource: The name of the resource of the object
+            id_: The ID of the object
+
+        Returns:
+            The cache key
+        """
+        return Cache.make_key(resource, {"id": id_})
+
+    def _expand_result(self, result: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Copy a result, replacing its references with the resolved objects.
+
+        Args:
+            result: The result to expand
+
+        Returns:
+            The expanded result, a dict or a record like the result
+        """
+        updates = {}
+        for field, (resource, _) in self._resolvers.items():
+            value = result.get(field)
+            if _references(value):
+                updates[field] = self._expand_value(resource, value)
+
+        if not updates:
+            return result
+
+        if isinstance(result, Record):
+            return type(result)({**result.to_dict(), **updates})
+
+        return {**result, **updates}
+
+    def _expand_value(self, resource: str, value: Any) -> Any:
+        """Replace the references held by the value of a field.
+
+        Args:
+            resource: The name of the resource the references refer to
+            value: The value of the field, a reference or a list of references
+
+        Returns:
+            The value, with its references replaced
+        """
+        if isinstance(value, list):
+            return [self._expand_value(resource, reference) for reference in value]
+
+        if not isinstance(value, Mapping) or "id" not in value:
+            return value
+
+        found = self._objects[resource].get(value["id"])
+        if found is None:
+            return value
+
+        return {**value, **found}
@@ -0,0 +1,343 @@
+"""Columnar export of search results to Apache Arrow and Parquet.
+
+Requires the ``arrow`` extra to be installed (``pip install pybomb[arrow]``).
+
+Each page of results is converted to an Arrow record batch as it arrives, and
+written to Parquet incrementally, so a full dump of a resource only ever holds a
+page of results as Python objects at once.
+"""
+import json
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Type, Union
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore
+
+from pybomb.clients.base.client import BaseClient
+from pybomb.clients.base.search_client import BaseSearchClient, SearchClient
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+_IMAGE_FIELDS = (
+    "icon_url",
+    "medium_url",
+    "screen_url",
+    "screen_large_url",
+    "small_url",
+    "super_url",
+    "thumb_url",
+    "tiny_url",
+    "original_url",
+    "image_tags",
+)
+_INTEGER_FIELDS = (
+    "expected_release_day",
+    "expected_release_month",
+    "expected_release_quarter",
+    "expected_release_year",
+    "id",
+    "number_of_user_reviews",
+)
+_DATE_FIELDS = (
+    "date_added",
+    "date_last_updated",
+    "original_release_date",
+    "release_date",
+)
+_REFERENCE_LIST_FIELDS = (
+    "characters",
+    "concepts",
+    "developers",
+    "first_appearance_characters",
+    "first_appearance_concepts",
+    "first_appearance_locations",
+    "first_appearance_objects",
+    "first_appearance_people",
+    "franchises",
+    "genres",
+    "killed_characters",
+    "locations",
+    "objects",
+    "original_game_rating",
+    "people",
+    "publishers",
+    "releases",
+    "reviews",
+    "similar_games",
+    "themes",
+    "videos",
+)
+
+
+def _require_pyarrow() -> None:
+    """Check pyarrow is installed.
+
+    Raises:
+        ImportError: pyarrow is not installed
+    """
+    if pyarrow is None:  # pragma: no cover
+        raise ImportError(
+            'pyarrow is required for exports, use "pip install pybomb[arrow]"'
+        )
+
+
+@lru_cache(maxsize=None)
+def _field_types() -> Dict[str, "pyarrow.DataType"]:
+    """Get the Arrow types of the fields returned by the GB API.
+
+    Returns:
+        The Arrow type of each field name with a known type
+    """
+
+    def struct(fields: Sequence[str]) -> "pyarrow.DataType":
+        return pyarrow.struct([(field, pyarrow.string()) for field in fields])
+
+    reference_fields = [
+        ("api_detail_url", pyarrow.string()),
+        ("id", pyarrow.int64()),
+        ("name", pyarrow.string()),
+        ("site_detail_url", pyarrow.string()),
+    ]
+    reference = pyarrow.struct(reference_fields)
+    platform = pyarrow.struct(reference_fields + [("abbreviation", pyarrow.string())])
+
+    types: Dict[str, "pyarrow.DataType"] = {
+        "company": reference,
+        "image": struct(_IMAGE_FIELDS),
+        "images": pyarrow.list_(struct(_IMAGE_FIELDS[:-1] + ("tags",))),
+        "online_support": pyarrow.bool_(),
+        "platforms": pyarrow.list_(platform),
+    }
+    types.update((field, pyarrow.int64()) for field in _INTEGER_FIELDS)
+    types.update((field, pyarrow.timestamp("ms")) for field in _DATE_FIELDS)
+    types.update((field, pyarrow.list_(reference)) for field in _REFERENCE_LIST_FIELDS)
+
+    return types
+
+
+def schema_for(
+    client: BaseClient, return_fields: Optional[Sequence[str]] = None
+) -> "pyarrow.Schema":
+    """Build the Arrow schema of the results of a client.
+
+    Dates are timestamps, counts and IDs are integers, and nested references,
+    such as the platforms of a game, are lists of structs. Fields without a
+    known type are strings, with any non string values stored as JSON.
+
+    Args:
+        client: The client returning the results
+        return_fields: The fields returned. Defaults to every field the client
+            can return
+
+    Returns:
+        The schema, with a column per field in order
+    """
+    _require_pyarrow()
+    if return_fields is None:
+        return_fields = list(client.RESPONSE_FIELD_MAP)
+
+    types = _field_types()
+
+    return pyarrow.schema(
+        [(field, types.get(field, pyarrow.string())) for field in return_fields]
+    )
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """Convert a value of a field without a known type to a string.
+
+    Args:
+        value: The value of the field
+
+    Returns:
+        The value, encoded as JSON if it is not already a string
+    """
+    if value is None or isinstance(value, str):
+        return value
+
+    return json.dumps(value)
+
+
+def to_record_batch(
+    results: Sequence[Mapping[str, Any]], schema: "pyarrow.Schema"
+) -> "pyarrow.RecordBatch":
+    """Convert a page of results to an Arrow record batch.
+
+    Dates are parsed a column at a time by Arrow, rather than per result.
+
+    Args:
+        results: The results, as dicts or records
+        schema: The schema of the batch, from `schema_for`
+
+    Returns:
+        The record batch, with a row per result
+    """
+    columns = []
+    for field in schema:
+        values = [result.get(field.name) for result in results]
+        if pyarrow.types.is_timestamp(field.type):
+            column = pyarrow.array(values, pyarrow.string()).cast(field.type)
+        elif pyarrow.types.is_string(field.type):
+            column = pyarrow.array([_to_text(value) for value in values], field.type)
+        else:
+            column = pyarrow.array(values, field.type)
+        columns.append(column)
+
+    return pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+
+
+class ParquetSink:
+    """Writes pages of results to a Parquet file as they arrive.
+
+    Each page is converted to an Arrow record batch straight away, so only the
+    page being written is held as Python objects. Batches are buffered until
+    there are enough rows to write a row group. Use as a context manager, or
+    call `close` once done, to finish the file.
+    """
+
+    def __init__(
+        self,
+        where: Union[str, Path],
+        schema: "pyarrow.Schema",
+        compression: str = "snappy",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        """Init the sink, creating the Parquet file.
+
+        Args:
+            where: The path of the Parquet file to write
+            schema: The schema of the results, from `schema_for`
+            compression: The compression codec of the file. Defaults to snappy
+            row_group_size: The min number of rows to write per row group
+        """
+        _require_pyarrow()
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._batches: List["pyarrow.RecordBatch"] = []
+        self._buffered_rows = 0
+        self._writer = pyarrow.parquet.ParquetWriter(
+            str(where), schema, compression=compression
+        )
+
+    def write_page(self, results: Sequence[Mapping[str, Any]]) -> None:
+        """Write a page of results to the file.
+
+        Args:
+            results: The results, as dicts or records
+        """
+        if not results:
+            return
+
+        batch = to_record_batch(results, self.schema)
+        self._batches.append(batch)
+        self._buffered_rows += batch.num_rows
+        self.rows_written += batch.num_rows
+
+        if self._buffered_rows >= self.row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        """Write any buffered rows and finish writing the file."""
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        """Write the buffered batches as a row group."""
+        if not self._batches:
+            return
+
+        table = pyarrow.Table.from_batches(self._batches, self.schema)
+        self._writer.write_table(table, row_group_size=self._buffered_rows)
+        self._batches = []
+        self._buffered_rows = 0
+
+    def __enter__(self) -> "ParquetSink":
+        """Use the sink as a context manager.
+
+        Returns:
+            The sink
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Finish writing the file on leaving the context.
+
+        Args:
+            exc_type: The type of any exception raised in the context
+            exc_value: Any exception raised in the context
+            traceback: The traceback of any exception raised in the context
+        """
+        self.close()
+
+
+def _pages(results: Iterator[Any], page_size: int) -> Iterator[List[Any]]:
+    """Group results into pages.
+
+    Args:
+        results: The results to group
+        page_size: The max number of results per page
+
+    Yields:
+        Each page of results, in order
+    """
+    while True:
+        page = list(islice(results, page_size))
+        if not page:
+            return
+        yield page
+
+
+def export_search(
+    client: SearchClient,
+    where: Union[str, Path],
+    filter_by: Dict[str, Any],
+    return_fields: Optional[List] = None,
+    sort_by: Optional[str] = None,
+    desc: bool = True,
+    page_size: int = BaseSearchClient.MAX_PAGE_SIZE,
+    workers: int = 1,
+    compression: str = "snappy",
+) -> int:
+    """Stream every result of a search into a Parquet file.
+
+    Pages are fetched with `SearchClient.iter_search` and converted as they
+    arrive, so a full dump never holds every result in memory.
+
+    Args:
+        client: The search client to search with
+        where: The path of the Parquet file to write
+        filter_by: A map of fields to filter the search by
+        return_fields: A list of fields to be returned, and written as columns.
+            The default is every field of the resource
+        sort_by: The field to sort the results by
+        desc: If sort direction is DESC or not (ASC). Defaults to True
+        page_size: The number of results to request, and write, per page.
+            Defaults to the max allowed by the GB API
+        workers: The max number of pages to fetch concurrently. Defaults to 1
+        compression: The compression codec of the file. Defaults to snappy
+
+    Returns:
+        The number of results written
+    """
+    schema = schema_for(client, return_fields)
+    results = client.iter_search(
+        filter_by, return_fields, sort_by, desc, page_size=page_size, workers=workers
+    )
+
+    with ParquetSink(where, schema, compression) as sink:
+        for page in _pages(results, page_size):
+            sink.write_page(page)
+
+    return sink.rows_written
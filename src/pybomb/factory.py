@@ -1,20 +1,117 @@
 """Factories for creating Clients."""
 from importlib import import_module
+from typing import Any, Optional
 
+from requests import Session
+
+from pybomb.cache import Cache
 from pybomb.clients.base.client import Client
+from pybomb.decoder import Decoder
+from pybomb.events import EventHooks
 from pybomb.exceptions import InvalidClientException
+from pybomb.fields import FieldProfiler
+from pybomb.local import LocalCatalog
+from pybomb.rate_limit import RateLimiter
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.session import create_session
+from pybomb.single_flight import SingleFlight
+
+
+def _import_client_class(client_name: str, prefix: str = "") -> Any:
+    """Import the class of the required client.
+
+    Args:
+        client_name: The name of the client. Should match the name of the
+            module, minus the "_client" part.
+        prefix: Prefix of the client module and class, such as "async"
+
+    Returns:
+        The client class
+
+    Raises:
+        InvalidClientException: Rasied when the client module or
+            class cannot be found
+    """
+    module_prefix = f"{prefix}_" if prefix else ""
+    module_name = f".{module_prefix}{client_name}_client"
+    client_class_name = f"{prefix.title()}{client_name.title()}Client"
+
+    try:
+        client_module = import_module(f"{module_name}", "pybomb.clients")
+
+        return getattr(client_module, client_class_name)
+    except (ModuleNotFoundError, AttributeError) as e:
+        raise InvalidClientException from e
 
 
 class ClientFactory:
     """Factory for creating all clients with the same API key."""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[Session] = None,
+        cache: Optional[Cache] = None,
+        decoder: Optional[Decoder] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        records: bool = False,
+        events: Optional[EventHooks] = None,
+        single_flight: Optional[SingleFlight] = None,
+        catalog: Optional[LocalCatalog] = None,
+        field_profiler: Optional[FieldProfiler] = None,
+    ) -> None:
         """Init Factory with the API key to use when creating clients.
 
+        All clients built by the factory share a single pooled session, so
+        connections to the GB API are reused across every client.
+
         Args:
             api_key: The API key to use when instantiating all clients
+            session: The session to share between all clients. When None, a
+                session is created using the default pool settings.
+                See :func:`pybomb.session.create_session`
+            cache: The response cache to share between all clients. When None,
+                responses are not cached. See :mod:`pybomb.cache`
+            decoder: The function used by all clients to decode response bodies.
+                When None, the fastest installed JSON decoder is used
+            rate_limiter: The limiter shared by all clients, pacing calls to
+                keep within the GB API quota. When None, calls are not limited.
+                See :class:`pybomb.rate_limit.RateLimiter`
+            retry_policy: The policy controlling how all clients retry failed
+                calls. When None, failed calls are not retried.
+                See :class:`pybomb.retry.RetryPolicy`
+            circuit_breaker: The breaker shared by all clients, failing calls
+                fast while a resource is down. When None, every call is sent.
+                See :class:`pybomb.retry.CircuitBreaker`
+            records: If all clients should return results as compact records,
+                rather than dicts. See :mod:`pybomb.records`
+            events: The hooks told about each call made by all clients. When
+                None, calls are not traced. See :mod:`pybomb.events`
+            single_flight: The coalescer shared by all clients, sharing one
+                call between identical calls made at the same time. When None,
+                every call is made. See :class:`pybomb.single_flight.SingleFlight`
+            catalog: The local catalog answering the searches of all clients
+                from a mirror, before calling the GB API. When None, every
+                search is sent. See :mod:`pybomb.local`
+            field_profiler: The profiler shared by all clients, learning the
+                fields read from results so calls made without return fields
+                request only those. When None, every field is requested.
+                See :mod:`pybomb.fields`
         """
         self.api_key = api_key
+        self.session = session if session is not None else create_session()
+        self.cache = cache
+        self.decoder = decoder
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.records = records
+        self.events = events
+        self.single_flight = single_flight
+        self.catalog = catalog
+        self.field_profiler = field_profiler
 
     def build(self, client_name: str) -> Client:
         """Import and instantiate the required class.
@@ -24,18 +121,22 @@ class ClientFactory:
                 name of the module, minus the "_client" part.
 
         Returns:
-            An instance of the client, creates with the API key held on the class.
-
-        Raises:
-            InvalidClientException: Rasied when the client module or
-                class cannot be found
+            An instance of the client, created with the API key and session
+            held on the class.
         """
-        module_name = f".{client_name}_client"
-        client_class_name = f"{client_name.title()}Client"
-
-        try:
-            client_module = import_module(f"{module_name}", "pybomb.clients")
+        client_class = _import_client_class(client_name)
 
-            return getattr(client_module, client_class_name)(self.api_key)
-        except (ModuleNotFoundError, AttributeError) as e:
-            raise InvalidClientException from e
+        return client_class(
+            self.api_key,
+            session=self.session,
+            cache=self.cache,
+            decoder=self.decoder,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            records=self.records,
+            events=self.events,
+            single_flight=self.single_flight,
+            catalog=self.catalog,
+            field_profiler=self.field_profiler,
+        )
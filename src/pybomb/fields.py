@@ -0,0 +1,475 @@
+"""Profiling of the fields read from results, to request only those used.
+
+A `FieldProfiler` records which fields are read from the results of calls
+made without return fields, by call site or named query. Once a site has
+been profiled, its calls request only the fields it reads, and a result
+missing a field the code then reads is refetched in full, transparently.
+"""
+import sys
+import threading
+from collections.abc import Mapping
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pybomb.records import Record
+from pybomb.response import Response
+
+if sys.version_info >= (3, 7):
+    from contextvars import ContextVar
+else:  # pragma: no cover
+    _T = TypeVar("_T")
+
+    class ContextVar(Generic[_T]):
+        """Stands in for `contextvars.ContextVar`, which is Python 3.7+.
+
+        The value is kept per thread, so on Python 3.6 named queries apply to
+        the thread entering them, but not to an asyncio task.
+        """
+
+        def __init__(self, name: str, default: _T) -> None:
+            """Init the variable with its default value.
+
+            Args:
+                name: The name of the variable
+                default: The value of the variable until it is set
+            """
+            self.name = name
+            self._default = default
+            self._local = threading.local()
+
+        def get(self) -> _T:
+            """Get the value of the variable in the current thread.
+
+            Returns:
+                The value
+            """
+            return getattr(self._local, "value", self._default)
+
+        def set(self, value: _T) -> Any:
+            """Set the value of the variable in the current thread.
+
+            Args:
+                value: The value
+
+            Returns:
+                A token restoring the previous value
+            """
+            token = self.get()
+            self._local.value = value
+            return token
+
+        def reset(self, token: Any) -> None:
+            """Restore the value the variable had before it was set.
+
+            Args:
+                token: The token returned by `set`
+            """
+            self._local.value = token
+
+
+_PACKAGE = __name__.partition(".")[0]
+_query_name: ContextVar[Optional[str]] = ContextVar("query_name", default=None)
+
+
+class NamedQuery:
+    """Profiles the calls made within the context as one named query.
+
+    Use a name to share a profile between calls made from several call
+    sites, or to tell apart the calls made from one site. Named queries
+    apply to the thread or asyncio task entering them.
+    """
+
+    def __init__(self, name: Optional[str]) -> None:
+        """Init with the name of the query.
+
+        Args:
+            name: The name of the query, or None to profile the calls by their
+                call site
+        """
+        self.name = name
+        self._tokens: List[Any] = []
+
+    def __enter__(self) -> "NamedQuery":
+        """Name the calls made within the context.
+
+        Returns:
+            The named query
+        """
+        self._tokens.append(_query_name.set(self.name))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop naming the calls made.
+
+        Args:
+            exc_type: The type of any exception raised within the context
+            exc: Any exception raised within the context
+            traceback: The traceback of any exception raised within the context
+        """
+        _query_name.reset(self._tokens.pop())
+
+
+class FieldProfile(NamedTuple):
+    """The fields read from the results of the calls made from a site.
+
+    `fields` is None once the code reads every field, such as by iterating
+    over a result or converting it to a dict.
+    """
+
+    resource: str
+    site: str
+    calls: int
+    fields: Optional[Tuple[str, ...]]
+    refetches: int
+
+
+class _Site:
+    """The profile of a site, updated as its results are read."""
+
+    __slots__ = ("calls", "fields", "every_field", "refetches")
+
+    def __init__(self) -> None:
+        """Init the profile with no calls."""
+        self.calls = 0
+        self.fields: Set[str] = set()
+        self.every_field = False
+        self.refetches = 0
+
+
+class FieldProfiler:
+    """Requests only the fields read from results, learnt by profiling.
+
+    Calls made without return fields are profiled by their site: the name of
+    the enclosing :class:`NamedQuery`, or else the file and line of the code
+    calling the client. The first `warmup` calls of a site request every
+    field, and the fields read from their results are recorded. Later calls
+    request only those fields, and the ID.
+
+    If the code reads a field that was not requested, the call is made again
+    for every field, once per response, and the field is added to the profile
+    of the site. Iterating over a result, or converting it to a dict, reads
+    every field, so the site goes back to requesting every field.
+
+    Results of profiled calls are read only mappings, wrapping the dicts or
+    records the client would return. It is thread safe, and can be shared
+    between clients.
+    """
+
+    def __init__(self, warmup: int = 3) -> None:
+        """Init the profiler with no sites profiled.
+
+        Args:
+            warmup: The number of calls of each site requesting every field,
+                before its profile is used
+        """
+        self.warmup = warmup
+        self.refetches = 0
+        self._lock = threading.Lock()
+        self._sites: Dict[Tuple[str, str], _Site] = {}
+
+    def site(self) -> str:
+        """Get the site of the call being made.
+
+        Returns:
+            The name of the query, or else the file and line of the first
+            caller outside of PyBomb
+        """
+        name = _query_name.get()
+        if name is not None:
+            return name
+
+        frame = sys._getframe(1)
+        while (
+            frame.f_back is not None
+            and frame.f_globals.get("__name__", "").partition(".")[0] == _PACKAGE
+        ):
+            frame = frame.f_back
+
+        return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+    def field_list(self, resource: str, site: str) -> Optional[Tuple[str, ...]]:
+        """Count a call of a site, and get the fields it should request.
+
+        Args:
+            resource: The name of the resource called
+            site: The site of the call
+
+        Returns:
+            The fields to request, or None to request every field
+        """
+        with self._lock:
+            profile = self._sites.get((resource, site))
+            if profile is None:
+                profile = self._sites[(resource, site)] = _Site()
+            profile.calls += 1
+            if profile.calls <= self.warmup or profile.every_field:
+                return None
+
+            return tuple(sorted(profile.fields | {"id"}))
+
+    def track(
+        self,
+        response: Response,
+        resource: str,
+        site: str,
+        fields: Optional[Tuple[str, ...]],
+        known_fields: Collection[str],
+        refetch: Callable[[], Response],
+    ) -> Response:
+        """Wrap the results of a profiled call, to record the fields read.
+
+        Args:
+            response: The response of the call
+            resource: The name of the resource called
+            site: The site of the call
+            fields: The fields requested, or None if every field was
+            known_fields: The return fields of the resource
+            refetch: Function making the call for every field
+
+        Returns:
+            The response, with its results wrapped
+        """
+        tracker = _Tracker(
+            self, self._sites[(resource, site)], fields, known_fields, refetch
+        )
+        results = [TrackedResult(result, tracker) for result in response.results]
+        result = results[0] if response.result is not None else None
+
+        return response._replace(results=results, result=result)
+
+    def profiles(self) -> List[FieldProfile]:
+        """Get the profile of every site.
+
+        Returns:
+            The profiles, in the order the sites were first called
+        """
+        with self._lock:
+            return [
+                FieldProfile(
+                    resource,
+                    site,
+                    profile.calls,
+                    None if profile.every_field else tuple(sorted(profile.fields)),
+                    profile.refetches,
+                )
+                for (resource, site), profile in self._sites.items()
+            ]
+
+    def _read(self, profile: _Site, field: Optional[str]) -> None:
+        """Record a field was read from a result of a site.
+
+        Args:
+            profile: The profile of the site
+            field: The field read, or None if every field was
+        """
+        with self._lock:
+            if field is None:
+                profile.every_field = True
+            else:
+                profile.fields.add(field)
+
+    def _refetched(self, profile: _Site) -> None:
+        """Count a response of a site was refetched for every field.
+
+        Args:
+            profile: The profile of the site
+        """
+        with self._lock:
+            profile.refetches += 1
+            self.refetches += 1
+
+
+class _Tracker:
+    """Records the fields read from the results of a response."""
+
+    def __init__(
+        self,
+        profiler: FieldProfiler,
+        profile: _Site,
+        fields: Optional[Tuple[str, ...]],
+        known_fields: Collection[str],
+        refetch: Callable[[], Response],
+    ) -> None:
+        """Init the tracker of a response.
+
+        Args:
+            profiler: The profiler of the call
+            profile: The profile of the site of the call
+            fields: The fields requested, or None if every field was
+            known_fields: The return fields of the resource
+            refetch: Function making the call for every field
+        """
+        self.known_fields = known_fields
+        self._profiler = profiler
+        self._profile = profile
+        self._fields = fields
+        self._refetch = refetch
+        self._lock = threading.Lock()
+        self._full: Optional[Dict[Any, Mapping]] = None
+
+    def read(self, field: Optional[str]) -> None:
+        """Record a field was read.
+
+        Args:
+            field: The field read, or None if every field was
+        """
+        if field is None:
+            if not self._profile.every_field:
+                self._profiler._read(self._profile, None)
+        elif field in self.known_fields and field not in self._profile.fields:
+            self._profiler._read(self._profile, field)
+
+    def full_result(self, result: Mapping, field: Optional[str]) -> Optional[Mapping]:
+        """Get a result with every field, if a field read was not requested.
+
+        Args:
+            result: The result read
+            field: The field read, or None if every field was
+
+        Returns:
+            The result with every field, or None if the result already holds
+            the field
+        """
+        if self._fields is None or (
+            field is not None
+            and (field in self._fields or field not in self.known_fields)
+        ):
+            return None
+
+        with self._lock:
+            if self._full is None:
+                response = self._refetch()
+                self._profiler._refetched(self._profile)
+                self._full = {full["id"]: full for full in response.results}
+
+        return self._full.get(result["id"])
+
+
+class TrackedResult(Mapping):
+    """A result of a profiled call, recording the fields read from it.
+
+    Fields are read as keys, or as attributes if the client uses records.
+    Any other attribute of the wrapped result, such as `to_dict`, reads every
+    field.
+    """
+
+    __slots__ = ("_result", "_tracker")
+
+    def __init__(self, result: Mapping, tracker: _Tracker) -> None:
+        """Init with the result to wrap.
+
+        Args:
+            result: The result, as a dict or record
+            tracker: The tracker of the response
+        """
+        self._result = result
+        self._tracker = tracker
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a field, refetching the result if it is missing.
+
+        Args:
+            key: The name of the field
+
+        Returns:
+            The value of the field
+
+        Raises:
+            KeyError: The result does not have the field, even once refetched
+        """
+        self._tracker.read(key)
+        try:
+            return self._result[key]
+        except KeyError:
+            if not self._complete(key):
+                raise
+
+        return self._result[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of every field.
+
+        Returns:
+            An iterator of the names of the fields, all of which are marked read
+        """
+        self._tracker.read(None)
+        self._complete(None)
+
+        return iter(self._result)
+
+    def __len__(self) -> int:
+        """The number of fields.
+
+        Returns:
+            The number of fields, all of which are marked read
+        """
+        self._tracker.read(None)
+        self._complete(None)
+
+        return len(self._result)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a field of a record, or another attribute of the result.
+
+        Args:
+            name: The name of the attribute
+
+        Returns:
+            The value of the attribute
+
+        Raises:
+            AttributeError: The attribute is private
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if isinstance(self._result, Record) and name in self._tracker.known_fields:
+            return self[name]
+
+        self._tracker.read(None)
+        self._complete(None)
+
+        return getattr(self._result, name)
+
+    def __repr__(self) -> str:
+        """Represent the wrapped result.
+
+        Returns:
+            The representation of the wrapped result
+        """
+        return repr(self._result)
+
+    def _complete(self, field: Optional[str]) -> bool:
+        """Replace the result with one holding every field, if it is missing one.
+
+        Args:
+            field: The field read, or None if every field was
+
+        Returns:
+            True if the result was replaced
+        """
+        full = self._tracker.full_result(self._result, field)
+        if full is None:
+            return False
+
+        self._result = full
+        return True
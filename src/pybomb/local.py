@@ -0,0 +1,164 @@
+"""Searches answered from a local mirror of GB resources, without calling GB."""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from pybomb.response import Response
+from pybomb.store import SyncStatus, SyncStore
+
+DEFAULT_MAX_AGE = 86400.0
+
+Filters = List[Tuple[str, str]]
+
+
+class LocalCatalog:
+    """Answers searches from a store of resources synced by a `SyncEngine`.
+
+    Hand a catalog to clients, or a factory, to answer their searches from the
+    store, with the same `Response` the GB API would give. A search is only
+    answered locally when its resource was fully synced within `max_age`
+    seconds, the store holds every field it uses, and it only filters by
+    fields the store can search. See :meth:`pybomb.store.SyncStore.search`.
+    Any other search is a miss, and is sent to the GB API as usual. Fetches
+    are always sent to the GB API, without being counted.
+    """
+
+    PARAMS = ("api_key", "field_list", "filter", "format", "limit", "offset", "sort")
+    DEFAULT_LIMIT = 100
+
+    def __init__(
+        self,
+        store: SyncStore,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init the catalog with the store to search.
+
+        Args:
+            store: The store of synced resources
+            max_age: The number of seconds since the last complete sync of a
+                resource that its searches are answered locally for
+            clock: Function returning the current time as a UNIX timestamp
+        """
+        self.store = store
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._counter_lock = threading.Lock()
+
+    def search(
+        self, resource: str, uri: str, params: Dict[str, Union[str, int]]
+    ) -> Optional[Response]:
+        """Answer a search from the store.
+
+        Args:
+            resource: The name of the resource searched
+            uri: The URI of the resource
+            params: All of the params of the search
+
+        Returns:
+            The response, or None if the search cannot be answered locally
+        """
+        filters = self._filters(params)
+        status = self.store.status(resource) if filters is not None else None
+        if (
+            filters is None
+            or status is None
+            or self._clock() - status.synced_at > self.max_age
+        ):
+            return self._count(None)
+
+        sort = None
+        if "sort" in params:
+            sort_field, _, direction = str(params["sort"]).partition(":")
+            sort = (sort_field, direction == "desc")
+
+        fields = (
+            str(params["field_list"]).split(",") if "field_list" in params else None
+        )
+        used_fields = [field for field, _ in filters] + ([sort[0]] if sort else [])
+        if not self._holds(status, fields, used_fields):
+            return self._count(None)
+
+        total, results = self.store.search(
+            resource,
+            filters,
+            sort,
+            int(params.get("limit", self.DEFAULT_LIMIT)),
+            int(params.get("offset", 0)),
+        )
+        if fields is not None:
+            results = [
+                {field: result.get(field) for field in fields} for result in results
+            ]
+
+        return self._count(
+            Response(f"{uri}?{urlencode(params)}", len(results), total, results, None)
+        )
+
+    def _filters(self, params: Dict[str, Union[str, int]]) -> Optional[Filters]:
+        """Parse the filters of a search, if the store can search by them.
+
+        Args:
+            params: All of the params of the search
+
+        Returns:
+            The fields and values to filter by, or None if the search cannot
+            be answered locally
+        """
+        if (
+            any(name not in self.PARAMS for name in params)
+            or params.get("format", "json") != "json"
+        ):
+            return None
+
+        filters = []
+        filter_string = str(params.get("filter", ""))
+        for part in filter_string.split(",") if filter_string else []:
+            field, _, value = part.partition(":")
+            ids = field == "id" or field in SyncStore.REFERENCE_FIELDS
+            if not SyncStore.can_filter(field) or (
+                ids and not all(id_.isdigit() for id_ in value.split("|"))
+            ):
+                return None
+            filters.append((field, value))
+
+        return filters
+
+    @staticmethod
+    def _holds(
+        status: SyncStatus, fields: Optional[List[str]], used_fields: List[str]
+    ) -> bool:
+        """Check the store holds every field a search uses.
+
+        Args:
+            status: The status of the sync of the resource
+            fields: The fields returned by the search, or None for every field
+            used_fields: The fields the search filters and sorts by
+
+        Returns:
+            True if every field is held
+        """
+        if status.fields is None:
+            return True
+
+        return fields is not None and set(fields + used_fields) <= set(status.fields)
+
+    def _count(self, response: Optional[Response]) -> Optional[Response]:
+        """Count a search as a hit or a miss.
+
+        Args:
+            response: The response of the search, or None on a miss
+
+        Returns:
+            The response
+        """
+        with self._counter_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return response
@@ -0,0 +1,121 @@
+"""Prepared searches, validated and compiled once to be executed many times."""
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+from pybomb.cache import Cache
+from pybomb.exceptions import InvalidFilterFieldException
+
+Params = Dict[str, Union[str, int]]
+
+
+class SearchPlan(NamedTuple):
+    """A search validated and compiled by :meth:`SearchClient.prepare`.
+
+    The plan holds everything fixed about the search: the filters with fixed
+    values, the sort, the return fields and the limit. Only the values of the
+    bound filter fields, and the offset, vary between executions. Plans are
+    immutable, so can be shared between threads, and between clients of the
+    same resource.
+    """
+
+    resource: str
+    params: Tuple[Tuple[str, Union[str, int]], ...]
+    fixed_filter: str
+    bound_fields: Tuple[str, ...]
+    key_parts: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+    @classmethod
+    def compile(
+        cls,
+        resource: str,
+        params: Params,
+        fixed_filter: str,
+        bound_fields: Tuple[str, ...],
+        response_format: str,
+    ) -> "SearchPlan":
+        """Compile a validated search into a plan.
+
+        The cache key of each execution is precomputed around the two params
+        that vary, the filter and the offset, so executing a plan only joins
+        strings.
+
+        Args:
+            resource: The name of the resource searched
+            params: The fixed params of the search
+            fixed_filter: The filter string of the filters with fixed values
+            bound_fields: The filter fields bound on each execution
+            response_format: The format added to the params of every call
+
+        Returns:
+            The plan
+        """
+        key_params = dict(params, format=response_format)
+        names = sorted(name for name in key_params if name not in Cache.IGNORED_PARAMS)
+        parts = [f"{name}={key_params[name]}" for name in names]
+        filter_at = sum(1 for name in names if name < "filter")
+        offset_at = sum(1 for name in names if name < "offset")
+
+        return cls(
+            resource,
+            tuple(params.items()),
+            fixed_filter,
+            bound_fields,
+            (
+                tuple(parts[:filter_at]),
+                tuple(parts[filter_at:offset_at]),
+                tuple(parts[offset_at:]),
+            ),
+        )
+
+    def bind(self, values: Mapping[str, Any], offset: Optional[int] = None) -> Params:
+        """Build the params of an execution of the plan.
+
+        Args:
+            values: The values of the bound filter fields. Fields without a
+                value, or with a value of None, are not filtered on
+            offset: The start offset for the return items
+
+        Returns:
+            The params of the search
+
+        Raises:
+            InvalidFilterFieldException: A value was given for a field not
+                bound by the plan
+        """
+        for field in values:
+            if field not in self.bound_fields:
+                raise InvalidFilterFieldException(
+                    f'"{field}" is not a bound filter field of the plan'
+                )
+
+        filters = [self.fixed_filter] if self.fixed_filter else []
+        for field in self.bound_fields:
+            value = values.get(field)
+            if value is not None:
+                filters.append(f"{field}:{value}")
+
+        params = dict(self.params)
+        params["filter"] = ",".join(filters)
+        if offset is not None:
+            params["offset"] = int(offset)
+
+        return params
+
+    def cache_key(self, params: Params) -> str:
+        """Get the cache key of an execution of the plan.
+
+        The key is the same as :meth:`pybomb.cache.Cache.make_key` creates for
+        the params, so prepared and unprepared searches share cached responses.
+
+        Args:
+            params: The params of the execution, from `bind`
+
+        Returns:
+            The cache key
+        """
+        before, between, after = self.key_parts
+        parts = [*before, f"filter={params['filter']}", *between]
+        if "offset" in params:
+            parts.append(f"offset={params['offset']}")
+        parts.extend(after)
+
+        return f"{self.resource}?{'&'.join(parts)}"
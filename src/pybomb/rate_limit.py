@@ -0,0 +1,95 @@
+"""Client side rate limiting of calls to the GB API."""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+DEFAULT_REQUESTS_PER_HOUR = 200
+SECONDS_PER_HOUR = 3600.0
+
+
+class RateLimiter:
+    """Paces calls to keep within the hourly request quota of each GB resource.
+
+    The GB API limits the number of requests per resource, per hour. Rather
+    than sending requests as fast as possible until the quota is used up, calls
+    to each resource are spaced out evenly across the hour. The limiter is
+    thread safe, and can be shared between clients so all calls made with the
+    same API key share the quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+        resource_limits: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Init the limiter with the quotas to keep to.
+
+        Args:
+            requests_per_hour: The number of requests allowed per resource, per hour
+            resource_limits: The number of requests allowed per hour, per resource
+                name. Resources not in the map use `requests_per_hour`
+            clock: Function returning the current time in seconds
+            sleep: Function sleeping for the given number of seconds
+        """
+        self.requests_per_hour = requests_per_hour
+        self.resource_limits = resource_limits or {}
+        self.wait_time = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def interval_for(self, resource: str) -> float:
+        """Get the number of seconds between requests to a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The number of seconds between each request
+        """
+        limit = self.resource_limits.get(resource, self.requests_per_hour)
+
+        return SECONDS_PER_HOUR / limit
+
+    def reserve(self, resource: str) -> float:
+        """Reserve the next free slot to call a resource.
+
+        Args:
+            resource: The name of the resource to call
+
+        Returns:
+            The number of seconds to wait before making the call
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_allowed.get(resource, now))
+            self._next_allowed[resource] = slot + self.interval_for(resource)
+
+            delay = slot - now
+            self.wait_time += delay
+
+            return delay
+
+    def acquire(self, resource: str) -> None:
+        """Block until a call can be made to a resource.
+
+        Args:
+            resource: The name of the resource to call
+        """
+        delay = self.reserve(resource)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def acquire_async(self, resource: str) -> None:
+        """Wait, without blocking the event loop, until a call can be made.
+
+        Args:
+            resource: The name of the resource to call
+        """
+        delay = self.reserve(resource)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,252 @@
+"""Compact, typed records holding the results of GB API responses.
+
+A record class is generated for each resource and set of return fields, with
+a ``__slots__`` entry per field rather than a per-result dict. Nested values,
+such as the platforms or image of a game, arrive decoded along with the rest of
+the response, and are re-encoded as compact JSON bytes, which are decoded again
+when the field is first accessed.
+
+This trades time for memory: the extra encode, and the decode of each nested
+field read, make records slower to build than dicts, but they hold far less.
+For 50,000 games, ``benchmarks.bench_records`` measures 89MB held as dicts,
+loaded in 0.21s, against 57MB held as records, loaded in 0.36s.
+"""
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from pybomb.decoder import get_default_decoder
+from pybomb.response import Response
+
+_decode = get_default_decoder()
+_NESTED_TYPES = (dict, list)
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a nested value as compact JSON.
+
+    Args:
+        value: The list or dict to encode
+
+    Returns:
+        The encoded value
+    """
+    if orjson is not None:
+        # Copy the output, as orjson over-allocates the bytes it returns
+        return bytes(memoryview(orjson.dumps(value)))
+
+    return json.dumps(value, separators=(",", ":")).encode()  # pragma: no cover
+
+
+class _Field:
+    """A record field, decoding its encoded nested value on first access."""
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: Any) -> None:
+        """Init the field with the slot holding its value.
+
+        Args:
+            slot: The slot descriptor of the field
+        """
+        self.slot = slot
+
+    def __get__(self, record: Optional["Record"], owner: type) -> Any:
+        """Get the value of the field, decoding it if needed.
+
+        Args:
+            record: The record to get the value of
+            owner: The record class
+
+        Returns:
+            The value of the field, or the field itself if accessed on the class
+        """
+        if record is None:
+            return self
+
+        value = self.slot.__get__(record, owner)
+        if isinstance(value, bytes):
+            value = _decode(value)
+            self.slot.__set__(record, value)
+
+        return value
+
+
+class Record(Mapping):
+    """Base class of the records generated for each resource.
+
+    Fields are read as attributes, ``record.name``, or as keys,
+    ``record["name"]``, so records can be used in place of result dicts.
+    Fields missing from the result are None. Any fields returned that are not
+    known to the client are kept in `extra`.
+    """
+
+    __slots__ = ("extra",)
+
+    RESOURCE_NAME = ""
+    FIELDS: Tuple[str, ...] = ()
+    _FIELD_SET: FrozenSet[str] = frozenset()
+    _SLOTS: Tuple[Any, ...] = ()
+
+    extra: Optional[Dict[str, Any]]
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # The fields, and their slots, are generated by `record_type`
+        def __getattr__(self, name: str) -> Any:
+            """Get a generated field, or the slot holding it."""
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        """Init the record from a result.
+
+        Args:
+            result: A decoded result of a GB API response
+        """
+        for field, slot in zip(self.FIELDS, self._SLOTS):
+            value = result.get(field)
+            if type(value) in _NESTED_TYPES:
+                value = _encode(value)
+            slot.__set__(self, value)
+
+        if result.keys() <= self._FIELD_SET:
+            self.extra = None
+        else:
+            self.extra = {
+                key: value
+                for key, value in result.items()
+                if key not in self._FIELD_SET
+            }
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a field.
+
+        Args:
+            key: The name of the field
+
+        Returns:
+            The value of the field
+
+        Raises:
+            KeyError: The record does not have the field
+        """
+        if key in self.FIELDS:
+            return getattr(self, key)
+
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the fields."""
+        yield from self.FIELDS
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        """The number of fields."""
+        return len(self.FIELDS) + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        """Represent the record with the values of its fields."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the record, keeping nested values encoded."""
+        values = {field: getattr(self, f"_{field}") for field in self.FIELDS}
+
+        return _restore, (self.RESOURCE_NAME, self.FIELDS, values, self.extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a result dict.
+
+        Returns:
+            The fields of the record, with nested values decoded
+        """
+        return dict(self.items())
+
+
+@lru_cache(maxsize=None)
+def record_type(resource: str, fields: Tuple[str, ...]) -> Type[Record]:
+    """Get the record class for results of a resource with the given fields.
+
+    Args:
+        resource: The name of the resource
+        fields: The names of the fields, in order
+
+    Returns:
+        A Record subclass with a slot per field
+    """
+    name = "".join(part.title() for part in resource.split("_")) + "Record"
+    record_class: Type[Record] = type(
+        name,
+        (Record,),
+        {
+            "__slots__": tuple(f"_{field}" for field in fields),
+            "RESOURCE_NAME": resource,
+            "FIELDS": fields,
+            "_FIELD_SET": frozenset(fields),
+        },
+    )
+    record_class._SLOTS = tuple(record_class.__dict__[f"_{field}"] for field in fields)
+    for field, slot in zip(fields, record_class._SLOTS):
+        setattr(record_class, field, _Field(slot))
+
+    return record_class
+
+
+def _restore(
+    resource: str,
+    fields: Tuple[str, ...],
+    values: Dict[str, Any],
+    extra: Optional[Dict[str, Any]],
+) -> Record:
+    """Restore a pickled record.
+
+    Args:
+        resource: The name of the resource
+        fields: The names of the fields, in order
+        values: The values of the fields, with nested values encoded
+        extra: The fields not known to the client
+
+    Returns:
+        The record
+    """
+    record_class = record_type(resource, fields)
+    record = record_class.__new__(record_class)
+    for field, value in values.items():
+        setattr(record, f"_{field}", value)
+    record.extra = extra
+
+    return record
+
+
+def to_records(response: Response, record_class: Type[Record]) -> Response:
+    """Convert the results of a response to records.
+
+    Args:
+        response: The response, with results as dicts
+        record_class: The record class to convert the results to
+
+    Returns:
+        The response, with results as records
+    """
+    records = [record_class(result) for result in response.results]
+    result = records[0] if response.result is not None else None
+
+    return response._replace(results=records, result=result)
@@ -1,5 +1,5 @@
 """The response types and factories for PyBomb."""
-from typing import NamedTuple, Optional
+from typing import Any, List, Mapping, NamedTuple, Optional
 
 from requests import Response as RequestsResponse
 
@@ -11,7 +11,7 @@ class Response(NamedTuple):
     num_page_results: int
     num_total_results: int
     results: list
-    result: Optional[dict]
+    result: Optional[Mapping[str, Any]]
 
     @classmethod
     def from_response_data(cls, response_data: RequestsResponse) -> "Response":
@@ -32,10 +32,23 @@ class Response(NamedTuple):
         Returns:
             A PyBomb Response containing the raw response data.
         """
-        response_json = response_data.json()
+        return cls.from_response_json(response_data.url, response_data.json())
 
+    @classmethod
+    def from_response_json(cls, uri: str, response_json: dict) -> "Response":
+        """Response factory for an already decoded response body.
+
+        See :meth:`from_response_data` for how results are stored.
+
+        Args:
+            uri: The URI that was called
+            response_json: The decoded JSON body of the API call
+
+        Returns:
+            A PyBomb Response containing the response data.
+        """
         cls_args = [
-            response_data.url,
+            uri,
             response_json["number_of_page_results"],
             response_json["number_of_total_results"],
         ]
@@ -46,3 +59,10 @@ class Response(NamedTuple):
             cls_args.extend((response_json["results"], None))
 
         return cls(*cls_args)
+
+
+class FetchManyResult(NamedTuple):
+    """The results of fetching many items by ID."""
+
+    results: Mapping[int, Mapping[str, Any]]
+    missing: List[int]
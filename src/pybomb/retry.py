@@ -0,0 +1,173 @@
+"""Retries and circuit breaking for calls to the GB API."""
+import random
+import threading
+import time
+from typing import Callable, Collection, Dict, Optional
+
+from pybomb.exceptions import CircuitOpenException
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Controls how failed calls to the GB API are retried.
+
+    Calls failing with a network error or a retryable status are retried with
+    exponential backoff and full jitter. The policy is thread safe, and counts
+    the retries made and the time spent waiting across every client using it.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """Init the policy.
+
+        Args:
+            max_retries: The max number of times to retry a call
+            backoff_factor: The base number of seconds to back off for. The
+                backoff doubles with each retry
+            max_backoff: The max number of seconds to back off for
+            retry_statuses: The HTTP statuses to retry calls for
+            rand: Function returning a random float in [0, 1), for the jitter
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.retries = 0
+        self.wait_time = 0.0
+        self._rand = rand
+        self._lock = threading.Lock()
+
+    def is_retryable_status(self, status: int) -> bool:
+        """Check if calls failing with the HTTP status should be retried.
+
+        Args:
+            status: The HTTP status of the response
+
+        Returns:
+            True if the call should be retried
+        """
+        return status in self.retry_statuses
+
+    def delay_for(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Get how long to wait before retrying a failed call, counting the retry.
+
+        Args:
+            attempt: The number of retries already made for the call
+            retry_after: The Retry-After header of the failed response, if any.
+                When given in seconds, the delay is at least this long
+
+        Returns:
+            The number of seconds to wait, or None if the call should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self._rand() * min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+
+        with self._lock:
+            self.retries += 1
+            self.wait_time += delay
+
+        return delay
+
+
+class CircuitBreaker:
+    """Fails calls fast while a GB resource is down.
+
+    After `failure_threshold` consecutive failures to a resource the circuit
+    opens, and calls to that resource raise a CircuitOpenException without
+    being sent. Once `reset_timeout` seconds have passed, a single trial call
+    is let through. If it succeeds the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init the breaker.
+
+        Args:
+            failure_threshold: The number of consecutive failures that open
+                the circuit
+            reset_timeout: The number of seconds to fail fast for, once opened
+            clock: Function returning the current time in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trips = 0
+        self._clock = clock
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, resource: str) -> bool:
+        """Check if the circuit of a resource is open.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            True if calls to the resource are failing fast
+        """
+        return resource in self._opened_at
+
+    def before_call(self, resource: str) -> None:
+        """Check a call can be made to a resource.
+
+        Args:
+            resource: The name of the resource to call
+
+        Raises:
+            CircuitOpenException: The circuit is open, and it is not time for
+                a trial call
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(resource)
+            if opened_at is None:
+                return
+
+            if self._clock() - opened_at < self.reset_timeout:
+                raise CircuitOpenException(
+                    f'Circuit open for "{resource}" after repeated failures'
+                )
+
+            # Let a single trial call through, failing fast until it completes
+            self._opened_at[resource] = self._clock()
+
+    def record_success(self, resource: str) -> None:
+        """Record a successful call, closing the circuit.
+
+        Args:
+            resource: The name of the resource called
+        """
+        with self._lock:
+            self._failures.pop(resource, None)
+            self._opened_at.pop(resource, None)
+
+    def record_failure(self, resource: str) -> None:
+        """Record a failed call, opening the circuit if over the threshold.
+
+        Args:
+            resource: The name of the resource called
+        """
+        with self._lock:
+            failures = self._failures.get(resource, 0) + 1
+            self._failures[resource] = failures
+
+            if failures >= self.failure_threshold:
+                if resource not in self._opened_at:
+                    self.trips += 1
+                self._opened_at[resource] = self._clock()
@@ -0,0 +1,362 @@
+"""An append-only archive of results, read through memory maps.
+
+A `SegmentStore` appends the results of each resource to a single segment
+file, with a compact index of the offset of each result by ID. Lookups by ID
+read straight from a memory map of the segment, and scans walk it in order,
+so archived pages are never spread over many files or read whole.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pybomb.clients.base.search_client import BaseSearchClient, SearchClient
+from pybomb.decoder import Decoder, get_default_decoder
+
+# Each result is stored as its ID and length, followed by its JSON.
+_HEADER = struct.Struct("<qI")
+# Each index entry is the ID, offset and length of the JSON of a result.
+_ENTRY = struct.Struct("<qQI")
+
+
+class _Segment:
+    """The segment and index files of a resource, and its index in memory."""
+
+    def __init__(self, directory: Path, resource: str) -> None:
+        """Open the files of a resource, creating them if needed.
+
+        Entries of the index past the end of the segment, and data past the
+        end of the last entry, are left by a write that did not finish, and
+        are dropped.
+
+        Args:
+            directory: The directory of the store
+            resource: The name of the resource
+        """
+        segment_path = directory / f"{resource}.seg"
+        index_path = directory / f"{resource}.idx"
+        segment_path.touch()
+        index_path.touch()
+
+        size = segment_path.stat().st_size
+        index_data = index_path.read_bytes()
+        self.offsets: Dict[int, Tuple[int, int]] = {}
+        end = entries = 0
+        for id_, offset, length in _ENTRY.iter_unpack(
+            index_data[: len(index_data) - len(index_data) % _ENTRY.size]
+        ):
+            if offset + length > size:
+                break
+            self.offsets[id_] = (offset, length)
+            end = offset + length
+            entries += 1
+
+        os.truncate(segment_path, end)
+        os.truncate(index_path, entries * _ENTRY.size)
+
+        self.size = end
+        self.segment: BinaryIO = open(segment_path, "ab")
+        self.index: BinaryIO = open(index_path, "ab")
+        self.reader: BinaryIO = open(segment_path, "rb")
+        self.map: Optional[mmap.mmap] = None
+
+    def view(self) -> memoryview:
+        """Get a view of the whole segment, mapping it again if it has grown.
+
+        Returns:
+            The view
+        """
+        if self.size == 0:
+            return memoryview(b"")
+
+        if self.map is None or len(self.map) < self.size:
+            self.map = mmap.mmap(self.reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return memoryview(self.map)[: self.size]
+
+    def close(self) -> None:
+        """Close the files of the resource."""
+        self.segment.close()
+        self.index.close()
+        if self.map is not None:
+            self.map.close()
+        self.reader.close()
+
+
+class SegmentStore:
+    """An append-only archive of results, stored in a segment file per resource.
+
+    Results are appended as JSON to the segment of their resource, and the ID,
+    offset and length of each is appended to its index. Appending a result
+    already stored supersedes it, and the latest is read. The index is loaded
+    into memory on first use, and results are read from a memory map of the
+    segment, so a lookup by ID is a dict lookup and the decoding of a single
+    result.
+
+    Use a store from one process at a time. It is thread safe. Use as a
+    context manager, or call `close` once done.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], decoder: Optional[Decoder] = None
+    ) -> None:
+        """Init the store, creating the directory if needed.
+
+        Args:
+            directory: The directory of the segment and index files
+            decoder: The JSON decoder to decode results with. Defaults to the
+                fastest available
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._decoder = decoder if decoder is not None else get_default_decoder()
+        self._lock = threading.RLock()
+        self._segments: Dict[str, _Segment] = {}
+
+    def append_page(self, resource: str, results: Iterable[Mapping[str, Any]]) -> int:
+        """Append a page of results to the segment of a resource.
+
+        The page is written to the segment before the index, so a page that is
+        only partly written is dropped when the store is next opened.
+
+        Args:
+            resource: The name of the resource
+            results: The results, as dicts or records, each with an ID
+
+        Returns:
+            The number of results appended
+        """
+        data = bytearray()
+        entries = bytearray()
+        with self._lock:
+            segment = self._segment(resource)
+            offsets = {}
+            for result in results:
+                if not isinstance(result, dict):
+                    result = dict(result)
+                encoded = json.dumps(result, separators=(",", ":")).encode()
+                offset = segment.size + len(data) + _HEADER.size
+                data += _HEADER.pack(result["id"], len(encoded)) + encoded
+                entries += _ENTRY.pack(result["id"], offset, len(encoded))
+                offsets[result["id"]] = (offset, len(encoded))
+
+            segment.segment.write(data)
+            segment.segment.flush()
+            segment.index.write(entries)
+            segment.index.flush()
+            segment.size += len(data)
+            segment.offsets.update(offsets)
+
+        return len(entries) // _ENTRY.size
+
+    def get_raw(self, resource: str, id_: int) -> Optional[memoryview]:
+        """Get the JSON of a stored result, without copying it.
+
+        Release the view before closing the store.
+
+        Args:
+            resource: The name of the resource
+            id_: The ID of the result
+
+        Returns:
+            A view of the JSON of the result in the segment, or None if it is
+            not stored
+        """
+        with self._lock:
+            segment = self._segment(resource)
+            location = segment.offsets.get(id_)
+            if location is None:
+                return None
+
+            offset, length = location
+            return segment.view()[offset : offset + length]
+
+    def get(self, resource: str, id_: int) -> Optional[Dict[str, Any]]:
+        """Get a stored result.
+
+        Args:
+            resource: The name of the resource
+            id_: The ID of the result
+
+        Returns:
+            The result, or None if it is not stored
+        """
+        raw = self.get_raw(resource, id_)
+        if raw is None:
+            return None
+
+        with raw:
+            return self._decoder(raw.tobytes())
+
+    def get_many(self, resource: str, ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get the stored results with the given IDs.
+
+        Args:
+            resource: The name of the resource
+            ids: The IDs of the results
+
+        Returns:
+            The results stored, by ID
+        """
+        results = {}
+        for id_ in ids:
+            result = self.get(resource, id_)
+            if result is not None:
+                results[id_] = result
+
+        return results
+
+    def iter_results(self, resource: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the stored results of a resource, in the order appended.
+
+        The segment is read in order, skipping results superseded by a later
+        append without decoding them.
+
+        Args:
+            resource: The name of the resource
+
+        Yields:
+            Each stored result
+        """
+        with self._lock:
+            segment = self._segment(resource)
+            view = segment.view()
+            offsets = dict(segment.offsets)
+
+        with view:
+            position = 0
+            while position < len(view):
+                id_, length = _HEADER.unpack_from(view, position)
+                offset = position + _HEADER.size
+                position = offset + length
+                if offsets.get(id_) == (offset, length):
+                    yield self._decoder(view[offset:position].tobytes())
+
+    def ids(self, resource: str) -> List[int]:
+        """Get the IDs of the stored results of a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The IDs, in the order first appended
+        """
+        with self._lock:
+            return list(self._segment(resource).offsets)
+
+    def count(self, resource: str) -> int:
+        """Count the stored results of a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The number of results stored
+        """
+        with self._lock:
+            return len(self._segment(resource).offsets)
+
+    def close(self) -> None:
+        """Close the files of every resource."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments = {}
+
+    def _segment(self, resource: str) -> _Segment:
+        """Get the segment of a resource, opening it on first use.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The segment
+        """
+        segment = self._segments.get(resource)
+        if segment is None:
+            segment = self._segments[resource] = _Segment(self.directory, resource)
+
+        return segment
+
+    def __enter__(self) -> "SegmentStore":
+        """Use the store as a context manager.
+
+        Returns:
+            The store
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the store on leaving the context.
+
+        Args:
+            exc_type: The type of any exception raised in the context
+            exc_value: Any exception raised in the context
+            traceback: The traceback of any exception raised in the context
+        """
+        self.close()
+
+
+def archive_search(
+    client: SearchClient,
+    store: SegmentStore,
+    filter_by: Dict[str, Any],
+    return_fields: Optional[List] = None,
+    sort_by: Optional[str] = None,
+    desc: bool = True,
+    page_size: int = BaseSearchClient.MAX_PAGE_SIZE,
+    workers: int = 1,
+) -> int:
+    """Append every result of a search to a store, a page at a time.
+
+    Args:
+        client: The search client to search with
+        store: The store to append the results to, under the resource of the
+            client
+        filter_by: A map of fields to filter the search by
+        return_fields: A list of fields to be returned, and stored. The ID is
+            always stored. The default is every field of the resource
+        sort_by: The field to sort the results by
+        desc: If sort direction is DESC or not (ASC). Defaults to True
+        page_size: The number of results to request, and append, per page.
+            Defaults to the max allowed by the GB API
+        workers: The max number of pages to fetch concurrently. Defaults to 1
+
+    Returns:
+        The number of results appended
+    """
+    if return_fields is not None:
+        return_fields = list(dict.fromkeys(["id", *return_fields]))
+
+    appended = 0
+    page: List[Mapping[str, Any]] = []
+    for result in client.iter_search(
+        filter_by, return_fields, sort_by, desc, page_size=page_size, workers=workers
+    ):
+        page.append(result)
+        if len(page) == page_size:
+            appended += store.append_page(client.RESOURCE_NAME, page)
+            page = []
+
+    return appended + store.append_page(client.RESOURCE_NAME, page)
@@ -0,0 +1,42 @@
+"""HTTP session management for PyBomb clients."""
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = True,
+    gzip: bool = True,
+) -> Session:
+    """Create a pooled session to be shared between clients.
+
+    Reusing a single session means connections to the GB API are kept open
+    and reused between calls, rather than a new TCP (and TLS) connection
+    being opened for every request.
+
+    Args:
+        pool_connections: The number of host connection pools to cache
+        pool_maxsize: The max number of connections to keep open per host.
+            Set this to at least the number of threads sharing the session
+        keep_alive: If connections should be kept open between requests.
+            Defaults to True
+        gzip: If compressed responses should be requested. Defaults to True
+
+    Returns:
+        A requests Session configured with the requested pool
+    """
+    session = Session()
+
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
@@ -0,0 +1,122 @@
+"""Coalescing of identical calls to the GB API made at the same time."""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one call between every caller making the same call at once.
+
+    The first caller of a key makes the call. Callers of the same key arriving
+    while it is in flight wait for it, and are given the same result, or the
+    same exception, rather than making the call again. Once the call ends, the
+    next caller makes a new call.
+
+    It is thread safe, works for both threads and asyncio tasks, and can be
+    shared between clients so all calls made with the same key are coalesced.
+    """
+
+    def __init__(self) -> None:
+        """Init with no calls in flight."""
+        self.saved = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "Future[Any]"] = {}
+        self._async_calls: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+
+    def do(self, key: str, call: Callable[[], T]) -> Tuple[T, bool]:
+        """Make a call, or wait for the identical call in flight.
+
+        Args:
+            key: The key identifying the call
+            call: Function making the call
+
+        Returns:
+            The result of the call, and True if it was made by another caller
+
+        Raises:
+            BaseException: Any error raised by the call, to its caller and to
+                every caller waiting for it
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                future: "Future[Any]" = Future()
+                self._calls[key] = future
+            else:
+                self.saved += 1
+
+        if in_flight is not None:
+            return in_flight.result(), True
+
+        try:
+            result = call()
+        except BaseException as error:
+            self._end(self._calls, key)
+            future.set_exception(error)
+            raise
+
+        self._end(self._calls, key)
+        future.set_result(result)
+
+        return result, False
+
+    async def do_async(
+        self, key: str, call: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """Make a call, or wait for the identical call in flight, in asyncio.
+
+        Calls are only coalesced with those made in the same event loop.
+
+        Args:
+            key: The key identifying the call
+            call: Function returning an awaitable making the call
+
+        Returns:
+            The result of the call, and True if it was made by another caller
+
+        Raises:
+            BaseException: Any error raised by the call, to its caller and to
+                every caller waiting for it
+        """
+        loop = asyncio.get_event_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            in_flight = self._async_calls.get(loop_key)
+            if in_flight is None:
+                future = loop.create_future()
+                self._async_calls[loop_key] = future
+            else:
+                self.saved += 1
+
+        if in_flight is not None:
+            return await asyncio.shield(in_flight), True
+
+        try:
+            result = await call()
+        except BaseException as error:
+            self._end(self._async_calls, loop_key)
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # Mark the exception as retrieved, for when nobody is waiting
+                future.exception()
+            raise
+
+        self._end(self._async_calls, loop_key)
+        future.set_result(result)
+
+        return result, False
+
+    def _end(self, calls: Dict[Any, Any], key: Any) -> None:
+        """Remove an ended call, so the next caller makes a new call.
+
+        Args:
+            calls: The calls in flight
+            key: The key of the ended call
+        """
+        with self._lock:
+            del calls[key]
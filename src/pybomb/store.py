@@ -0,0 +1,471 @@
+"""A local mirror of GB resources, kept up to date by :mod:`pybomb.sync`."""
+import json
+import sqlite3
+import threading
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+UPDATED_FIELD = "date_last_updated"
+
+
+def _is_date_field(field: str) -> bool:
+    """Check if a field holds a date.
+
+    Args:
+        field: The name of the field
+
+    Returns:
+        True if the field holds a date
+    """
+    return field.startswith("date_") or field.endswith("_date")
+
+
+class SyncCursor(NamedTuple):
+    """The position of the sync of a resource.
+
+    Results are synced in order of their `date_last_updated`. The watermark is
+    the `date_last_updated` of the last result stored, and `ids` are the IDs
+    of the results stored with that same `date_last_updated`. The sync carries
+    on from the watermark, dropping those results if they have not changed.
+    """
+
+    watermark: Optional[str] = None
+    ids: FrozenSet[int] = frozenset()
+
+    def is_stored(self, result: Mapping[str, Any]) -> bool:
+        """Check if a result is stored at the watermark, and has not changed since.
+
+        Args:
+            result: The result
+
+        Returns:
+            True if the result is already stored
+        """
+        return result[UPDATED_FIELD] == self.watermark and result["id"] in self.ids
+
+    def advance(self, results: List[Dict[str, Any]]) -> "SyncCursor":
+        """Move the cursor past a page of results.
+
+        Args:
+            results: The results, in order of their `date_last_updated`
+
+        Returns:
+            The cursor after the results
+        """
+        watermark, ids = self.watermark, set(self.ids)
+        for result in results:
+            updated = result[UPDATED_FIELD]
+            if updated != watermark:
+                watermark, ids = updated, set()
+            ids.add(result["id"])
+
+        return SyncCursor(watermark, frozenset(ids))
+
+
+class SyncStatus(NamedTuple):
+    """The last complete sync of a resource.
+
+    `fields` are the fields stored for each result, or None if every field is.
+    """
+
+    synced_at: float
+    fields: Optional[Tuple[str, ...]]
+
+
+class SyncStore:
+    """A local mirror of GB resources, stored in a SQLite file.
+
+    Results are stored by resource and ID, along with the cursor of the sync
+    of each resource. Results and the cursor are updated in one transaction,
+    so the cursor always matches the stored results. The IDs of the lists of
+    references held by results, such as their `platforms`, are indexed so
+    results can be searched by them.
+
+    Each thread keeps its own connection to the database open, so searches do
+    not pay for opening the database on every call.
+    """
+
+    REFERENCE_FIELDS = ("company", "platforms")
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        """Init the store, creating the database file if needed.
+
+        Args:
+            path: The path of the SQLite database file
+            timeout: Seconds to wait for another process to release a lock on
+                the database
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "resource TEXT NOT NULL, "
+            "id INTEGER NOT NULL, "
+            "date_last_updated TEXT, "
+            "name TEXT, "
+            "result TEXT NOT NULL, "
+            "PRIMARY KEY (resource, id))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_date_last_updated "
+            "ON results (resource, date_last_updated, id)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_name ON results (resource, name, id)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS refs ("
+            "resource TEXT NOT NULL, "
+            "id INTEGER NOT NULL, "
+            "field TEXT NOT NULL, "
+            "ref_id INTEGER NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS refs_ref_id "
+            "ON refs (resource, field, ref_id, id)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS refs_id ON refs (resource, id)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cursors ("
+            "resource TEXT PRIMARY KEY, "
+            "watermark TEXT, "
+            "ids TEXT NOT NULL, "
+            "synced_at REAL, "
+            "fields TEXT)"
+        )
+
+    def count(self, resource: str) -> int:
+        """Count the stored results of a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The number of results stored
+        """
+        connection = self._connection()
+        return connection.execute(
+            "SELECT COUNT(*) FROM results WHERE resource = ?", (resource,)
+        ).fetchone()[0]
+
+    def get(self, resource: str, id_: int) -> Optional[Dict[str, Any]]:
+        """Get a stored result.
+
+        Args:
+            resource: The name of the resource
+            id_: The ID of the result
+
+        Returns:
+            The result, or None if it is not stored
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT result FROM results WHERE resource = ? AND id = ?",
+            (resource, id_),
+        ).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def iter_results(self, resource: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the stored results of a resource, in order of ID.
+
+        Args:
+            resource: The name of the resource
+
+        Yields:
+            Each stored result
+        """
+        connection = self._connection()
+        for (result,) in connection.execute(
+            "SELECT result FROM results WHERE resource = ? ORDER BY id",
+            (resource,),
+        ):
+            yield json.loads(result)
+
+    @classmethod
+    def can_filter(cls, field: str) -> bool:
+        """Check if stored results can be searched by a field.
+
+        Args:
+            field: The name of the field
+
+        Returns:
+            True if a search of the stored results can filter by the field
+        """
+        return (
+            field in ("id", "name")
+            or field in cls.REFERENCE_FIELDS
+            or _is_date_field(field)
+        )
+
+    def search(
+        self,
+        resource: str,
+        filters: Sequence[Tuple[str, str]],
+        sort: Optional[Tuple[str, bool]] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Search the stored results of a resource, as the GB API does.
+
+        A filter on the ID, or on a reference field such as `platforms`,
+        matches any of the IDs in the value separated by "|". A filter on the
+        name matches names containing the value, ignoring case. A filter on a
+        date matches the date, or the range of dates "start|end" inclusive.
+
+        Args:
+            resource: The name of the resource
+            filters: The fields and values to filter by, as given by
+                :meth:`can_filter`
+            sort: The field to sort by, and True if descending. Results are
+                sorted by ID after the sort field
+            limit: The max number of results to return
+            offset: The number of results to skip
+
+        Returns:
+            The total number of results found, and the results in the page
+        """
+        conditions = ["resource = ?"]
+        args: List[Any] = [resource]
+        name_filter = False
+        for field, value in filters:
+            if field == "name":
+                name_filter = True
+                pattern = (
+                    value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                conditions.append("name LIKE ? ESCAPE '\\'")
+                args.append(f"%{pattern}%")
+            elif _is_date_field(field):
+                column, column_args = self._column(field)
+                start, _, end = value.partition("|")
+                if end:
+                    conditions.append(f"{column} BETWEEN ? AND ?")
+                    args.extend([*column_args, start, end])
+                else:
+                    conditions.append(f"{column} = ?")
+                    args.extend([*column_args, start])
+            else:
+                ids = [int(id_) for id_ in value.split("|")]
+                placeholders = ", ".join("?" * len(ids))
+                if field == "id":
+                    conditions.append(f"id IN ({placeholders})")
+                    args.extend(ids)
+                else:
+                    conditions.append(
+                        "id IN (SELECT id FROM refs WHERE resource = ? AND field = ? "  # noqa: S608
+                        f"AND ref_id IN ({placeholders}))"
+                    )
+                    args.extend([resource, field, *ids])
+
+        where = " AND ".join(conditions)
+        order = "id"
+        order_args: List[str] = []
+        if sort is not None:
+            column, order_args = self._column(sort[0])
+            order = f"{column} {'DESC' if sort[1] else 'ASC'}, id"
+
+        # A search by name scans the names, rather than the whole results.
+        table = "results INDEXED BY results_name" if name_filter else "results"
+        connection = self._connection()
+        total = connection.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {where}", args  # noqa: S608
+        ).fetchone()[0]
+        ids = [
+            id_
+            for (id_,) in connection.execute(
+                f"SELECT id FROM {table} WHERE {where} "  # noqa: S608
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                [*args, *order_args, limit, offset],
+            )
+        ]
+        rows = dict(
+            connection.execute(
+                "SELECT id, result FROM results "  # noqa: S608
+                f"WHERE resource = ? AND id IN ({', '.join('?' * len(ids))})",
+                [resource, *ids],
+            )
+        )
+
+        return total, [json.loads(rows[id_]) for id_ in ids]
+
+    @staticmethod
+    def _column(field: str) -> Tuple[str, List[str]]:
+        """Get the SQL expression of a field of the stored results.
+
+        Args:
+            field: The name of the field
+
+        Returns:
+            The expression, and the args it binds
+        """
+        if field in ("id", "name", UPDATED_FIELD):
+            return field, []
+
+        return "json_extract(result, ?)", [f"$.{field}"]
+
+    def cursor(self, resource: str) -> SyncCursor:
+        """Get the cursor of the sync of a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The cursor, at the start if the resource has never been synced
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT watermark, ids FROM cursors WHERE resource = ?", (resource,)
+        ).fetchone()
+
+        if row is None:
+            return SyncCursor()
+
+        watermark, ids = row
+        return SyncCursor(watermark, frozenset(json.loads(ids)))
+
+    def status(self, resource: str) -> Optional[SyncStatus]:
+        """Get the last complete sync of a resource.
+
+        Args:
+            resource: The name of the resource
+
+        Returns:
+            The status of the sync, or None if no sync has completed
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT synced_at, fields FROM cursors "
+            "WHERE resource = ? AND synced_at IS NOT NULL",
+            (resource,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        synced_at, fields = row
+        return SyncStatus(synced_at, tuple(fields.split(",")) if fields else None)
+
+    def mark_synced(
+        self, resource: str, fields: Optional[Sequence[str]], synced_at: float
+    ) -> None:
+        """Record a sync of a resource completed, storing every change.
+
+        Args:
+            resource: The name of the resource
+            fields: The fields stored for each result, or None for every field
+            synced_at: The UNIX timestamp the sync completed at
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR IGNORE INTO cursors (resource, ids) VALUES (?, '[]')",
+                (resource,),
+            )
+            connection.execute(
+                "UPDATE cursors SET synced_at = ?, fields = ? WHERE resource = ?",
+                (synced_at, ",".join(fields) if fields else None, resource),
+            )
+
+    def save_page(
+        self, resource: str, results: List[Dict[str, Any]], cursor: SyncCursor
+    ) -> None:
+        """Upsert a page of results, and move the cursor past them.
+
+        Args:
+            resource: The name of the resource
+            results: The results to upsert
+            cursor: The cursor after the results
+        """
+        rows = [
+            (
+                resource,
+                result["id"],
+                result.get(UPDATED_FIELD),
+                result.get("name"),
+                json.dumps(result),
+            )
+            for result in results
+        ]
+        refs = [
+            (resource, result["id"], field, ref["id"])
+            for result in results
+            for field, value in result.items()
+            for ref in (value if isinstance(value, list) else [value])
+            if isinstance(ref, dict) and "id" in ref
+        ]
+
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows
+            )
+            connection.executemany(
+                "DELETE FROM refs WHERE resource = ? AND id = ?",
+                [(resource, result["id"]) for result in results],
+            )
+            connection.executemany("INSERT INTO refs VALUES (?, ?, ?, ?)", refs)
+            connection.execute(
+                "INSERT OR IGNORE INTO cursors (resource, ids) VALUES (?, '[]')",
+                (resource,),
+            )
+            connection.execute(
+                "UPDATE cursors SET watermark = ?, ids = ? WHERE resource = ?",
+                (cursor.watermark, json.dumps(sorted(cursor.ids)), resource),
+            )
+
+    def reset(self, resource: str) -> None:
+        """Remove the stored results and cursor of a resource.
+
+        The next sync of the resource loads every result again.
+
+        Args:
+            resource: The name of the resource
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM results WHERE resource = ?", (resource,))
+            connection.execute("DELETE FROM refs WHERE resource = ?", (resource,))
+            connection.execute("DELETE FROM cursors WHERE resource = ?", (resource,))
+
+    def close(self) -> None:
+        """Close the connection of the calling thread, if it has one."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection to the database of the calling thread.
+
+        Connections are in autocommit mode. Transactions are begun explicitly,
+        and used as a context manager to commit, or roll back on errors.
+
+        Returns:
+            The SQLite connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            self._local.connection = connection
+
+        return connection
@@ -0,0 +1,223 @@
+"""Incremental decoding of the results of GB API responses as they arrive.
+
+A `ResultStream` decodes a response body from its chunks, yielding each
+element of `results` as soon as it has been read, rather than once the whole
+body has been received and decoded. Only the chunk being read, and the result
+being decoded, are held in memory.
+"""
+import codecs
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+_WHITESPACE = " \t\n\r"
+_DECODER = JSONDecoder()
+
+
+class ResultStream:
+    """Decodes the results of a response body, one at a time, as it arrives.
+
+    The other fields of the body, such as `status_code` and
+    `number_of_total_results`, are decoded into `envelope` as they are read,
+    and handed to `validate` before the first result is yielded. GB sends
+    them ahead of the results. For a body that does not, the results are held
+    until the rest of the body has been read and validated.
+
+    A body with a single result, from a detail resource, yields the result.
+    Each value is decoded by the standard library `json` module.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        validate: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Init the stream with the chunks of the body.
+
+        Args:
+            chunks: The chunks of the body, as they are received
+            validate: Function checking the fields of the body other than
+                `results`, raising an exception if they are invalid
+        """
+        self.envelope: Dict[str, Any] = {}
+        self.bytes_received = 0
+        self._chunks = iter(chunks)
+        self._validate = validate
+        self._validated = False
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode the body, yielding each result once decoded.
+
+        Any error raised by `validate` is raised as it is.
+
+        Yields:
+            Each result, in order
+
+        Raises:
+            JSONDecodeError: The body is not valid JSON
+        """
+        held: List[Any] = []
+        self._expect("{")
+        closed = self._peek() == "}"
+        if closed:
+            self._pos += 1
+        while not closed:
+            key = self._value()
+            if not isinstance(key, str):
+                raise JSONDecodeError(
+                    "Expecting property name", self._buffer, self._pos
+                )
+            self._expect(":")
+            if key != "results":
+                self.envelope[key] = self._value()
+            else:
+                if "status_code" in self.envelope:
+                    self._validate_envelope()
+
+                for result in self._results():
+                    if self._validated:
+                        yield result
+                    else:
+                        held.append(result)
+
+            separator = self._next()
+            if separator not in ",}":
+                raise JSONDecodeError(
+                    "Expecting ',' delimiter", self._buffer, self._pos
+                )
+            closed = separator == "}"
+
+        if not self._validated:
+            self._validate_envelope()
+        yield from held
+
+    def _validate_envelope(self) -> None:
+        """Validate the fields of the body read so far."""
+        self._validate(self.envelope)
+        self._validated = True
+
+    def _results(self) -> Iterator[Any]:
+        """Decode the results, as an array or a single result.
+
+        Yields:
+            Each result, in order
+
+        Raises:
+            JSONDecodeError: The results are not valid JSON
+        """
+        if self._peek() != "[":
+            yield self._value()
+            return
+
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            separator = self._next()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise JSONDecodeError(
+                    "Expecting ',' delimiter", self._buffer, self._pos
+                )
+
+    def _value(self) -> Any:
+        """Decode the next value, reading more of the body until it is whole.
+
+        A value ending the data read so far is only taken once more data has
+        been read, as a number could carry on in the next chunk.
+
+        Returns:
+            The value
+
+        Raises:
+            JSONDecodeError: The value is not valid JSON
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+
+            if end == len(self._buffer) and self._read():
+                continue
+
+            self._pos = end
+            return value
+
+    def _expect(self, char: str) -> None:
+        """Read the next character, which must be the one given.
+
+        Args:
+            char: The character expected
+
+        Raises:
+            JSONDecodeError: The next character is another
+        """
+        if self._next() != char:
+            raise JSONDecodeError(f"Expecting {char!r}", self._buffer, self._pos)
+
+    def _next(self) -> str:
+        """Read the next character other than whitespace.
+
+        Returns:
+            The character, or an empty string at the end of the body
+        """
+        char = self._peek()
+        self._pos += len(char)
+
+        return char
+
+    def _peek(self) -> str:
+        """Skip whitespace, and get the next character without reading it.
+
+        Returns:
+            The character, or an empty string at the end of the body
+        """
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+
+            if not self._read():
+                return ""
+
+    def _read(self) -> bool:
+        """Read the next chunk of the body, dropping the data already decoded.
+
+        Returns:
+            False at the end of the body
+
+        Raises:
+            JSONDecodeError: The body is not valid UTF-8
+        """
+        if self._exhausted:
+            return False
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+        else:
+            self.bytes_received += len(chunk)
+
+        try:
+            text = self._text.decode(chunk or b"", final=chunk is None)
+        except UnicodeDecodeError as error:
+            raise JSONDecodeError(
+                f"Invalid UTF-8: {error.reason}", self._buffer, self._pos
+            ) from error
+
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+
+        return True
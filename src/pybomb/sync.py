@@ -0,0 +1,118 @@
+"""Incremental syncing of a local mirror of GB resources.
+
+A `SyncEngine` pulls the results of a search resource changed since the last
+sync, using the `date_last_updated` field, and upserts them into a `SyncStore`.
+The first sync loads every result. The position of the sync is stored with
+each page of results, so an interrupted sync carries on where it stopped.
+"""
+import time
+from typing import Callable, cast, List, NamedTuple, Optional
+
+from pybomb.clients.base.search_client import SearchClient
+from pybomb.store import SyncCursor, SyncStore, UPDATED_FIELD
+
+UPDATED_UNTIL = "9999-12-31 23:59:59"
+
+
+class SyncResult(NamedTuple):
+    """The outcome of syncing a resource."""
+
+    resource: str
+    fetched: int
+    pages: int
+    cursor: SyncCursor
+    complete: bool
+
+
+class SyncEngine:
+    """Syncs search resources, such as games and platforms, into a store.
+
+    Each page is a search for the results updated at or after the watermark,
+    sorted by `date_last_updated`, from the first of them. The results stored
+    at the watermark are dropped from the page, unless they have been updated
+    since, so a result updated while syncing is stored again rather than
+    skipped. Only when more results share the watermark than fit on a page
+    does the search page past them.
+
+    Every page is fetched from the GB API, bypassing the cache and local
+    catalog of the client. Results deleted from GB are not removed from the
+    store.
+    """
+
+    def __init__(
+        self,
+        store: SyncStore,
+        page_size: int = 100,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init the engine with the store to sync into.
+
+        Args:
+            store: The store of the synced results
+            page_size: The number of results to request per page.
+                Defaults to the max allowed by the GB API
+            clock: Function returning the current time as a UNIX timestamp
+        """
+        self.store = store
+        self.page_size = page_size
+        self._clock = clock
+
+    def sync(
+        self,
+        client: SearchClient,
+        return_fields: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+    ) -> SyncResult:
+        """Sync the results of a resource changed since the last sync.
+
+        Args:
+            client: The client of the resource to sync
+            return_fields: A list of fields to store for each result. The ID
+                and `date_last_updated` are always stored. The default is to
+                store everything
+            max_pages: The max number of pages to fetch, to bound the calls
+                made by one sync. The next sync carries on from the last page.
+                When None, the sync runs until every change is stored
+
+        Returns:
+            The outcome of the sync
+        """
+        if return_fields is not None:
+            return_fields = list(dict.fromkeys(["id", UPDATED_FIELD, *return_fields]))
+
+        client = cast(SearchClient, client.uncached())
+        resource = client.RESOURCE_NAME
+        plan = client.prepare(
+            bind=(UPDATED_FIELD,),
+            return_fields=return_fields,
+            sort_by=UPDATED_FIELD,
+            desc=False,
+            limit=self.page_size,
+        )
+        cursor = self.store.cursor(resource)
+        fetched = pages = offset = 0
+
+        while max_pages is None or pages < max_pages:
+            updated = (
+                f"{cursor.watermark}|{UPDATED_UNTIL}"
+                if cursor.watermark is not None
+                else None
+            )
+            response = client.execute(plan, offset=offset, date_last_updated=updated)
+            results = [dict(result) for result in response.results]
+            pages += 1
+
+            changed = [result for result in results if not cursor.is_stored(result)]
+            if changed:
+                cursor = cursor.advance(changed)
+                self.store.save_page(resource, changed, cursor)
+                fetched += len(changed)
+
+            if len(results) < self.page_size:
+                self.store.mark_synced(resource, return_fields, self._clock())
+                return SyncResult(resource, fetched, pages, cursor, True)
+
+            # A page of results all stored at the watermark is paged past
+            offset = 0 if changed else offset + len(results)
+
+        return SyncResult(resource, fetched, pages, cursor, False)
@@ -0,0 +1,293 @@
+"""Extraction of text and links from the HTML fields of results, across processes.
+
+Fields such as the `description` of games and platforms hold long HTML.
+Converting it to text and extracting its links is bound by the CPU, so a
+`TextExtractor` ships batches of it from a stream of results, such as those
+of `SearchClient.iter_search`, to a pool of processes. Results are yielded in
+the order of the stream, along with what was extracted from them.
+"""
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from html.parser import HTMLParser
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urljoin
+
+DEFAULT_FIELDS = ("description",)
+GIANT_BOMB_URL = "https://www.giantbomb.com/"
+
+# Tags whose content is not text.
+_SKIPPED_TAGS = {"script", "style", "template"}
+# Tags that break the text onto a new line.
+_BLOCK_TAGS = {
+    "blockquote",
+    "br",
+    "dd",
+    "div",
+    "dt",
+    "figcaption",
+    "figure",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "table",
+    "td",
+    "th",
+    "tr",
+    "ul",
+}
+_SPACES = re.compile(r"[^\S\n]+")
+_LINES = re.compile(r" *\n\s*")
+_WORDS = re.compile(r"\w+")
+
+
+class ExtractedText(NamedTuple):
+    """The text and links of an HTML field."""
+
+    text: str
+    words: List[str]
+    links: List[str]
+
+
+class ExtractedResult(NamedTuple):
+    """A result, and the text and links extracted from each of its HTML fields."""
+
+    result: Mapping[str, Any]
+    fields: Dict[str, ExtractedText]
+
+
+class _TextParser(HTMLParser):
+    """Collects the text and links of an HTML document."""
+
+    def __init__(self, base_url: Optional[str]) -> None:
+        """Init the parser.
+
+        Args:
+            base_url: The URL to resolve relative links against
+        """
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.links: Dict[str, None] = {}
+        self._base_url = base_url
+        self._skipping = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        """Start a tag, collecting its link.
+
+        Args:
+            tag: The name of the tag
+            attrs: The attributes of the tag
+        """
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith("#"):
+                link = urljoin(self._base_url, href) if self._base_url else href
+                self.links[link] = None
+
+    def handle_endtag(self, tag: str) -> None:
+        """End a tag.
+
+        Args:
+            tag: The name of the tag
+        """
+        if tag in _SKIPPED_TAGS:
+            self._skipping = max(self._skipping - 1, 0)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        """Collect text outside of skipped tags.
+
+        Args:
+            data: The text
+        """
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def extract_text(html: str, base_url: Optional[str] = GIANT_BOMB_URL) -> ExtractedText:
+    """Convert HTML to text, and extract its links.
+
+    Runs of whitespace are collapsed, with a line per block, such as a
+    paragraph or heading.
+
+    Args:
+        html: The HTML
+        base_url: The URL to resolve relative links against, or None to keep
+            them as they are. Defaults to Giant Bomb
+
+    Returns:
+        The text, its words in lower case, and the unique links, in order
+    """
+    parser = _TextParser(base_url)
+    parser.feed(html)
+    parser.close()
+
+    text = _LINES.sub("\n", _SPACES.sub(" ", "".join(parser.parts))).strip()
+
+    return ExtractedText(text, _WORDS.findall(text.lower()), list(parser.links))
+
+
+def _extract_batch(
+    batch: List[Optional[str]], base_url: Optional[str]
+) -> List[Optional[ExtractedText]]:
+    """Extract the text of a batch of HTML, in a process of the pool.
+
+    Args:
+        batch: The HTML of each field, or None for fields without any
+        base_url: The URL to resolve relative links against
+
+    Returns:
+        What was extracted from each field, or None for fields without HTML
+    """
+    return [extract_text(html, base_url) if html else None for html in batch]
+
+
+class TextExtractor:
+    """Extracts the text and links of HTML fields over a pool of processes.
+
+    Results are read from a stream in batches, and the HTML of the wanted
+    fields of each batch is sent to the pool, without the rest of the result.
+    Up to `max_pending` batches are in the pool at once, and results are only
+    read from the stream as batches finish, so the search feeding it is held
+    back by the parsing rather than buffered in memory. Searching and parsing
+    overlap, as the search carries on while batches are parsed.
+
+    Results are yielded in the order of the stream.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        workers: Optional[int] = None,
+        batch_size: int = 20,
+        max_pending: Optional[int] = None,
+        base_url: Optional[str] = GIANT_BOMB_URL,
+    ) -> None:
+        """Init the extractor with the fields to extract.
+
+        Args:
+            fields: The HTML fields of each result to extract. Defaults to the
+                description
+            workers: The number of processes in the pool. Defaults to the
+                number of CPUs
+            batch_size: The number of results to send to the pool at a time
+            max_pending: The max number of batches in the pool at once.
+                Defaults to twice the number of workers
+            base_url: The URL to resolve relative links against, or None to
+                keep them as they are. Defaults to Giant Bomb
+        """
+        self.fields = tuple(fields)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.base_url = base_url
+
+    def extract(
+        self, results: Iterable[Mapping[str, Any]]
+    ) -> Iterator[ExtractedResult]:
+        """Extract the text of the HTML fields of a stream of results.
+
+        Stopping the iteration early cancels the batches not yet started.
+
+        Args:
+            results: The results, as dicts or records
+
+        Yields:
+            Each result and what was extracted from its fields, in order. A
+            field missing from a result, or empty, is left out
+        """
+        extract_batch = partial(_extract_batch, base_url=self.base_url)
+        pending: Deque[Tuple[List[Mapping[str, Any]], Future]] = deque()
+        batches = self._batches(results)
+
+        workers = self.workers or os.cpu_count() or 1
+        max_pending = self.max_pending or 2 * workers
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next_batch() -> None:
+                batch = next(batches, None)
+                if batch is not None:
+                    pending.append(
+                        (batch, executor.submit(extract_batch, self._html(batch)))
+                    )
+
+            try:
+                for _ in range(max_pending):
+                    submit_next_batch()
+
+                while pending:
+                    batch, future = pending.popleft()
+                    extracted = iter(future.result())
+                    submit_next_batch()
+                    for result in batch:
+                        fields = {}
+                        for field in self.fields:
+                            text = next(extracted)
+                            if text is not None:
+                                fields[field] = text
+                        yield ExtractedResult(result, fields)
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _batches(
+        self, results: Iterable[Mapping[str, Any]]
+    ) -> Iterator[List[Mapping[str, Any]]]:
+        """Split a stream of results into batches.
+
+        Args:
+            results: The results
+
+        Yields:
+            Each batch of results, in order
+        """
+        batch: List[Mapping[str, Any]] = []
+        for result in results:
+            batch.append(result)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _html(self, batch: List[Mapping[str, Any]]) -> List[Optional[str]]:
+        """Get the HTML of the wanted fields of a batch of results.
+
+        Args:
+            batch: The results
+
+        Returns:
+            The HTML of each field of each result, in order, or None for fields
+            that are missing
+        """
+        return [result.get(field) for result in batch for field in self.fields]
@@ -0,0 +1,86 @@
+"""OpenTelemetry spans for the calls made by clients to the GB API.
+
+Requires the ``tracing`` extra to be installed (``pip install pybomb[tracing]``).
+"""
+from typing import Dict, Optional, Union
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+from pybomb.events import CallEvent
+
+
+def _nanoseconds(seconds: float) -> int:
+    """Convert seconds since the epoch to the nanoseconds used by spans.
+
+    Args:
+        seconds: The seconds since the epoch
+
+    Returns:
+        The nanoseconds since the epoch
+    """
+    return int(seconds * 1e9)
+
+
+class OpenTelemetryListener:
+    """Turns call events into OpenTelemetry spans.
+
+    Each call is a client span named after the resource, with a child span
+    for each phase of the call. Register it on the hooks handed to clients::
+
+        events = EventHooks([OpenTelemetryListener()])
+    """
+
+    def __init__(self, tracer: Optional["trace.Tracer"] = None) -> None:
+        """Init the listener with the tracer to create spans with.
+
+        Args:
+            tracer: The tracer creating the spans. When None, the tracer of
+                the globally configured tracer provider is used
+
+        Raises:
+            ImportError: opentelemetry is not installed
+        """
+        if trace is None:  # pragma: no cover
+            raise ImportError(
+                "opentelemetry-api is required for tracing, "
+                'use "pip install pybomb[tracing]"'
+            )
+
+        self._tracer = tracer if tracer is not None else trace.get_tracer("pybomb")
+
+    def __call__(self, event: CallEvent) -> None:
+        """Record the spans of a call.
+
+        Args:
+            event: The event of the call
+        """
+        attributes: Dict[str, Union[str, int, bool]] = {
+            "pybomb.resource": event.resource,
+            "pybomb.bytes_received": event.bytes_received,
+            "pybomb.cache_hit": event.cache_hit,
+            "pybomb.retries": event.retries,
+            "pybomb.coalesced": event.coalesced,
+        }
+        if event.status is not None:
+            attributes["http.status_code"] = event.status
+
+        span = self._tracer.start_span(
+            f"pybomb {event.resource}",
+            kind=trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=_nanoseconds(event.start),
+        )
+        context = trace.set_span_in_context(span)
+        for phase in event.phases:
+            self._tracer.start_span(
+                phase.name, context=context, start_time=_nanoseconds(phase.start)
+            ).end(end_time=_nanoseconds(phase.start + phase.duration))
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+
+        span.end(end_time=_nanoseconds(event.start + event.duration))
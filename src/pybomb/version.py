@@ -0,0 +1,22 @@
+"""The installed version of PyBomb."""
+from functools import lru_cache
+
+try:
+    from importlib.metadata import PackageNotFoundError, version  # type: ignore
+except ImportError:  # pragma: no cover
+    from importlib_metadata import version, PackageNotFoundError  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def get_version() -> str:
+    """Get the installed version of PyBomb.
+
+    The version is read from the package metadata on the first call only.
+
+    Returns:
+        The version, or "unknown" if PyBomb is not installed
+    """
+    try:
+        return version("pybomb")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
@@ -0,0 +1,87 @@
+"""A fake GB API, serving fetches and searches of a catalog of results."""
+import json
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+from urllib.parse import urlencode
+
+from requests.models import Response as RequestsResponse
+
+
+class FakeCatalog:
+    """Serve fetches and searches of a catalog of results, as the GB API does."""
+
+    def __init__(self) -> None:
+        """Start with an empty catalog."""
+        self.results: List[Dict[str, Any]] = []
+        self.calls: List[Dict[str, Any]] = []
+
+    def add(self, id_: int, updated: str, **fields: Any) -> None:
+        """Add a result, or update an existing one."""
+        self.results = [result for result in self.results if result["id"] != id_]
+        self.results.append(
+            {
+                "id": id_,
+                "name": f"Result {id_}",
+                "date_last_updated": updated,
+                "platforms": [],
+                **fields,
+            }
+        )
+
+    def matches(self, result: Dict[str, Any], field: str, value: str) -> bool:
+        """Check if a result matches a filter."""
+        if field == "name":
+            return value.lower() in result["name"].lower()
+        if field == "id":
+            return str(result["id"]) in value.split("|")
+        if field == "platforms":
+            return any(
+                str(platform["id"]) in value.split("|")
+                for platform in result["platforms"]
+            )
+
+        if field.startswith("date_"):
+            start, _, end = value.partition("|")
+            return start <= result[field] <= (end or start)
+
+        return str(result.get(field)) == value
+
+    def __call__(self, url: str, params: Dict[str, Any], **kwargs: Any) -> MagicMock:
+        """Fetch a result by ID, or search the catalog."""
+        self.calls.append(params)
+        results = sorted(self.results, key=lambda result: result["id"])
+        _, _, id_ = url.rpartition("/")
+        if id_.isdigit():
+            results = [result for result in results if result["id"] == int(id_)]
+        if "sort" in params:
+            field, direction = params["sort"].split(":")
+            results.sort(key=lambda result: result[field], reverse=direction == "desc")
+        for part in params["filter"].split(",") if params.get("filter") else []:
+            field, value = part.split(":", 1)
+            results = [
+                result for result in results if self.matches(result, field, value)
+            ]
+        offset = params.get("offset", 0)
+        page = results[offset : offset + params.get("limit", 100)]
+        if "field_list" in params:
+            fields = params["field_list"].split(",")
+            page = [{field: result[field] for field in fields} for result in page]
+
+        response = MagicMock(RequestsResponse)
+        response.url = f"{url}?{urlencode(params)}"
+        response.status_code = 200
+        response.content = json.dumps(
+            {
+                "status_code": 1,
+                "number_of_page_results": len(page),
+                "number_of_total_results": len(results),
+                "results": page[0] if id_.isdigit() else page,
+            }
+        ).encode()
+        response.iter_content.side_effect = lambda size: (
+            response.content[start : start + size]
+            for start in range(0, len(response.content), size)
+        )
+        response.__enter__.return_value = response
+
+        return response
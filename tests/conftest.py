@@ -0,0 +1,28 @@
+"""Fixtures shared by the PyBomb tests."""
+from typing import List
+
+import pytest
+
+
+class FakeClock:
+    """A clock that only moves when told to, or when something sleeps."""
+
+    def __init__(self) -> None:
+        """Start the clock at 0."""
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Move the clock forwards."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A fake clock, starting at 0."""
+    return FakeClock()
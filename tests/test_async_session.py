@@ -0,0 +1,30 @@
+"""Tests for the PyBomb async_session module."""
+import asyncio
+from typing import cast
+
+from aiohttp import TCPConnector
+
+from pybomb.async_session import create_async_session
+
+
+class TestCreateAsyncSession:
+    """Tests for create_async_session."""
+
+    def test_pool_size(self) -> None:
+        """Test the connection pool limits and compression are configured."""
+
+        async def create() -> None:
+            session = create_async_session(limit=50, limit_per_host=5, gzip=False)
+
+            connector = cast(TCPConnector, session.connector)
+            assert connector.limit == 50
+            assert connector.limit_per_host == 5
+            assert session.headers["Accept-Encoding"] == "identity"
+
+            await session.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(create())
+        finally:
+            loop.close()
@@ -0,0 +1,231 @@
+"""Tests for the PyBomb cache module."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from pybomb.cache import Cache, MemoryCache, SQLiteCache
+from pybomb.response import Response
+from .conftest import FakeClock
+
+
+def make_response(id_: int) -> Response:
+    """Create a response holding a single result."""
+    return Response("https://fake.com", 1, 1, [{"id": id_}], None)
+
+
+class TestCacheKey:
+    """Tests for the cache keys."""
+
+    def test_ignores_param_order_and_api_key(self) -> None:
+        """Test the same call with a different key and param order matches."""
+        key = Cache.make_key("games", {"filter": "name:a", "api_key": "1", "limit": 5})
+        other_key = Cache.make_key(
+            "games", {"limit": 5, "api_key": "2", "filter": "name:a"}
+        )
+
+        assert key == other_key
+
+    def test_includes_resource_and_params(self) -> None:
+        """Test different resources and params have different keys."""
+        keys: List[str] = [
+            Cache.make_key("games", {"filter": "name:a"}),
+            Cache.make_key("platforms", {"filter": "name:a"}),
+            Cache.make_key("games", {"filter": "name:b"}),
+        ]
+
+        assert len(set(keys)) == len(keys)
+
+
+class TestMemoryCache:
+    """Tests for the MemoryCache."""
+
+    def test_hit_and_miss(self, clock: FakeClock) -> None:
+        """Test cached responses are returned and counted."""
+        cache = MemoryCache(clock=clock)
+        response = make_response(1)
+
+        assert cache.get("a") is None
+        cache.set("games", "a", response, 10)
+        assert cache.get("a") is response
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_resource_ttls(self, clock: FakeClock) -> None:
+        """Test responses expire after the TTL of their resource."""
+        cache = MemoryCache(ttl=10, resource_ttls={"platforms": 100}, clock=clock)
+        cache.set("games", "game", make_response(1), 1)
+        cache.set("platforms", "platform", make_response(2), 1)
+
+        clock.now = 50
+
+        assert cache.get("game") is None
+        assert cache.get("platform") is not None
+        assert len(cache) == 1
+        assert cache.size == 1
+
+    def test_evicts_least_recently_used_entry(self, clock: FakeClock) -> None:
+        """Test the least recently used response is evicted when full."""
+        cache = MemoryCache(max_entries=2, clock=clock)
+        cache.set("games", "a", make_response(1), 1)
+        cache.set("games", "b", make_response(2), 1)
+        cache.get("a")
+        cache.set("games", "c", make_response(3), 1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_evicts_by_size(self, clock: FakeClock) -> None:
+        """Test responses are evicted to keep under the max size."""
+        cache = MemoryCache(max_bytes=100, clock=clock)
+        cache.set("games", "a", make_response(1), 60)
+        cache.set("games", "b", make_response(2), 60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.size == 60
+
+    def test_skips_oversized_response(self, clock: FakeClock) -> None:
+        """Test a response larger than the cache is not stored."""
+        cache = MemoryCache(max_bytes=100, clock=clock)
+        cache.set("games", "a", make_response(1), 101)
+
+        assert len(cache) == 0
+
+    def test_replace_and_clear(self, clock: FakeClock) -> None:
+        """Test responses can be replaced and cleared."""
+        cache = MemoryCache(clock=clock)
+        cache.set("games", "a", make_response(1), 10)
+        cache.set("games", "a", make_response(2), 20)
+
+        assert cache.size == 20
+        assert cache.get("a") == make_response(2)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestSQLiteCache:
+    """Tests for the SQLiteCache."""
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> str:
+        """Database path fixture."""
+        return str(tmp_path / "cache.db")
+
+    def test_hit_and_miss(self, path: str, clock: FakeClock) -> None:
+        """Test cached responses are returned and counted."""
+        cache = SQLiteCache(path, clock=clock)
+        response = make_response(1)
+
+        assert cache.get("a") is None
+        cache.set("games", "a", response, 10)
+
+        assert cache.get("a") == response
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_survives_restart(self, path: str, clock: FakeClock) -> None:
+        """Test responses are available to a new cache using the same file."""
+        SQLiteCache(path, clock=clock).set("games", "a", make_response(1), 10)
+
+        assert SQLiteCache(path, clock=clock).get("a") == make_response(1)
+
+    def test_resource_ttls(self, path: str, clock: FakeClock) -> None:
+        """Test responses expire after the TTL of their resource."""
+        cache = SQLiteCache(path, ttl=10, resource_ttls={"game": 100}, clock=clock)
+        cache.set("games", "games", make_response(1), 1)
+        cache.set("game", "game", make_response(2), 1)
+
+        clock.now = 50
+
+        assert cache.get("games") is None
+        assert cache.get("game") is not None
+
+        cache.set("games", "other", make_response(3), 1)
+
+        assert len(cache) == 2
+
+    def test_evicts_least_recently_used_entry(
+        self, path: str, clock: FakeClock
+    ) -> None:
+        """Test the least recently used response is evicted when full."""
+        cache = SQLiteCache(path, max_entries=2, clock=clock)
+        cache.set("games", "a", make_response(1), 1)
+        clock.now = 1
+        cache.set("games", "b", make_response(2), 1)
+        clock.now = 2
+        cache.get("a")
+        clock.now = 3
+        cache.set("games", "c", make_response(3), 1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_evicts_by_size(self, path: str, clock: FakeClock) -> None:
+        """Test responses are evicted to keep under the max size."""
+        response_size = len(json.dumps(make_response(1)._asdict()))
+        cache = SQLiteCache(path, max_bytes=response_size * 2, clock=clock)
+
+        for id_ in range(3):
+            clock.now = id_
+            cache.set("games", str(id_), make_response(id_), 1)
+
+        assert cache.get("0") is None
+        assert len(cache) == 2
+        assert cache.size == response_size * 2
+
+    def test_skips_oversized_response(self, path: str, clock: FakeClock) -> None:
+        """Test a response larger than the cache is not stored."""
+        cache = SQLiteCache(path, max_bytes=10, clock=clock)
+        cache.set("games", "a", make_response(1), 1)
+
+        assert len(cache) == 0
+
+    def test_evicts_everything(self, path: str, clock: FakeClock) -> None:
+        """Test a cache with no room for entries stores nothing."""
+        cache = SQLiteCache(path, max_entries=0, clock=clock)
+        cache.set("games", "a", make_response(1), 1)
+
+        assert len(cache) == 0
+
+    def test_clear(self, path: str, clock: FakeClock) -> None:
+        """Test all responses can be removed."""
+        cache = SQLiteCache(path, clock=clock)
+        cache.set("games", "a", make_response(1), 1)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_rolls_back_on_error(self, path: str, clock: FakeClock) -> None:
+        """Test a failed write leaves the cache unchanged."""
+        cache = SQLiteCache(path, clock=clock)
+
+        with patch.object(cache, "_evict", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                cache.set("games", "a", make_response(1), 1)
+
+        assert len(cache) == 0
+
+    def test_concurrent_access(self, path: str) -> None:
+        """Test several caches can write to the same file at once."""
+        caches = [SQLiteCache(path) for _ in range(4)]
+
+        def write(index: int) -> None:
+            cache = caches[index % len(caches)]
+            cache.set("games", str(index), make_response(index), 1)
+            assert cache.get(str(index)) == make_response(index)
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(write, range(100)))
+
+        assert len(caches[0]) == 100
@@ -1,15 +1,17 @@
 """Shared fixtures."""
+import json
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from requests import Session
 from requests.models import Response as RequestsResponse
 
 
 @pytest.fixture
 def mock_requests_get() -> Generator[MagicMock, None, None]:
     """Request GET test mock."""
-    with patch("pybomb.clients.base.search_client.get") as req_mock:
+    with patch.object(Session, "get") as req_mock:
         yield req_mock
 
 
@@ -18,6 +20,8 @@ def mock_response() -> MagicMock:
     """Raw response test mock."""
     mock_response = MagicMock(RequestsResponse)
     mock_response.url = "https://fake.com"
+    mock_response.status_code = 200
+    mock_response.headers = {}
 
     mock_response.json.return_value = {
         "status_code": 1,
@@ -25,5 +29,6 @@ def mock_response() -> MagicMock:
         "number_of_total_results": 1,
         "results": [],
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
     return mock_response
@@ -0,0 +1,491 @@
+"""Tests for the PyBomb async clients."""
+import asyncio
+import json
+from types import TracebackType
+from typing import Any, cast, Coroutine, Dict, List, Optional, Type, Union
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+import pybomb
+from pybomb.async_factory import AsyncClientFactory
+from pybomb.cache import MemoryCache
+from pybomb.clients.async_game_client import AsyncGameClient
+from pybomb.clients.async_games_client import AsyncGamesClient
+from pybomb.clients.async_platforms_client import AsyncPlatformsClient
+from pybomb.events import CallEvent, EventHooks
+from pybomb.exceptions import (
+    BadRequestException,
+    CircuitOpenException,
+    InvalidFilterFieldException,
+    InvalidResponseException,
+    InvalidReturnFieldException,
+)
+from pybomb.rate_limit import RateLimiter
+from pybomb.records import Record
+from pybomb.response import Response
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.single_flight import SingleFlight
+
+
+def run(coroutine: Coroutine) -> Any:
+    """Run a coroutine to completion on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class FakeResponse:
+    """A stand-in for an aiohttp response."""
+
+    def __init__(self, status: int, body: Dict[str, Any]) -> None:
+        """Init with the status and decoded body to return."""
+        self.status = status
+        self.reason = "Reason"
+        self.url = "https://fake.com"
+        self.headers: Dict[str, str] = {}
+        self.body = body
+
+    @property  # type: ignore
+    def __class__(self) -> Type:
+        """Pass type checks as an aiohttp response."""
+        return aiohttp.ClientResponse
+
+    async def __aenter__(self) -> "FakeResponse":
+        """Enter the request context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the request context."""
+
+    async def read(self) -> bytes:
+        """Return the encoded body, after yielding to other tasks."""
+        await asyncio.sleep(0)
+        return json.dumps(self.body).encode()
+
+
+class FakeSession:
+    """A stand-in for an aiohttp session, recording each call."""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Optional[Dict] = None,
+        failures: Optional[List[Union[int, Exception]]] = None,
+    ) -> None:
+        """Init with the response to return, after any failures to serve first."""
+        self.status = status
+        self.failures = failures or []
+        self.body = body or {
+            "status_code": 1,
+            "number_of_page_results": 1,
+            "number_of_total_results": 1,
+            "results": [],
+        }
+        self.calls: List[Any] = []
+        self.closed = False
+
+    @property  # type: ignore
+    def __class__(self) -> Type:
+        """Pass type checks as an aiohttp session."""
+        return aiohttp.ClientSession
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        """Record the call and return the response."""
+        self.calls.append((url, kwargs))
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return FakeResponse(failure, self.body)
+
+        return FakeResponse(self.status, self.body)
+
+    async def close(self) -> None:
+        """Mark the session as closed."""
+        self.closed = True
+
+
+def as_session(session: FakeSession) -> aiohttp.ClientSession:
+    """Type a fake session as the aiohttp session it stands in for."""
+    return cast(aiohttp.ClientSession, session)
+
+
+class TestAsyncGameClient:
+    """Tests for the AsyncGameClient."""
+
+    def test_fetch(self) -> None:
+        """Test the fetch call and response."""
+        session = FakeSession(
+            body={
+                "status_code": 1,
+                "number_of_page_results": 1,
+                "number_of_total_results": 1,
+                "results": {"id": 1},
+            }
+        )
+        client = AsyncGameClient("fake_key", session=as_session(session))
+
+        res = run(client.fetch(1, ["id", "name"]))
+
+        assert isinstance(res, Response)
+        assert res.result == {"id": 1}
+        assert res.results == [{"id": 1}]
+        url, kwargs = session.calls[0]
+        assert url == "http://www.giantbomb.com/api/game/1"
+        assert kwargs["params"] == {
+            "field_list": "id,name",
+            "api_key": "fake_key",
+            "format": "json",
+        }
+        assert kwargs["headers"]["User-Agent"].startswith("Pybomb")
+
+    def test_cache(self) -> None:
+        """Test repeated fetches are answered from a supplied cache."""
+        session = FakeSession()
+        cache = MemoryCache()
+        client = AsyncGameClient("fake_key", session=as_session(session), cache=cache)
+
+        res = run(client.fetch(1))
+        cached_res = run(client.fetch(1))
+
+        assert cached_res is res
+        assert len(session.calls) == 1
+        assert cache.hits == 1
+
+    def test_records(self) -> None:
+        """Test results are returned as records if the client uses them."""
+        session = FakeSession(
+            body={
+                "status_code": 1,
+                "number_of_page_results": 1,
+                "number_of_total_results": 1,
+                "results": {"id": 1, "name": "Game"},
+            }
+        )
+        client = AsyncGameClient("fake_key", session=as_session(session), records=True)
+
+        res = run(client.fetch(1, ["id", "name"]))
+
+        assert isinstance(res.result, Record)
+        assert res.result.name == "Game"
+        assert res.results == [res.result]
+
+    def test_rate_limiter(self) -> None:
+        """Test each call waits for the rate limiter of the resource."""
+        rate_limiter = RateLimiter()
+        client = AsyncGameClient(
+            "fake_key", session=as_session(FakeSession()), rate_limiter=rate_limiter
+        )
+
+        with patch.object(rate_limiter, "reserve", return_value=0) as reserve:
+            run(client.fetch(1))
+
+        reserve.assert_called_once_with("game")
+
+    def test_retry(self) -> None:
+        """Test failed calls are retried with the retry policy."""
+        session = FakeSession(failures=[aiohttp.ClientError(), 503])
+        retry_policy = RetryPolicy(backoff_factor=0)
+        client = AsyncGameClient(
+            "fake_key", session=as_session(session), retry_policy=retry_policy
+        )
+
+        run(client.fetch(1))
+
+        assert len(session.calls) == 3
+        assert retry_policy.retries == 2
+        assert all(url.endswith("/game/1") for url, _ in session.calls)
+
+    def test_events(self) -> None:
+        """Test each call emits an event with its phases and outcome."""
+        events: List[CallEvent] = []
+        session = FakeSession(failures=[503])
+        client = AsyncGameClient(
+            "fake_key",
+            session=as_session(session),
+            retry_policy=RetryPolicy(backoff_factor=0),
+            events=EventHooks([events.append]),
+        )
+
+        run(client.fetch(1))
+        session.body = {"status_code": 100, "error": "Invalid API Key"}
+        with pytest.raises(InvalidResponseException):
+            run(client.fetch(1))
+
+        call, failed = events
+        assert call.resource == "game"
+        assert [phase.name for phase in call.phases] == [
+            "prepare",
+            "request",
+            "backoff",
+            "request",
+            "decode",
+            "validate",
+            "build",
+        ]
+        assert call.status == 200
+        assert call.bytes_received > 0
+        assert call.retries == 1
+        assert call.error is None
+        assert isinstance(failed.error, InvalidResponseException)
+        assert failed.phases[-1].name == "validate"
+
+    def test_single_flight(self) -> None:
+        """Test identical fetches made at the same time share one call."""
+        events: List[CallEvent] = []
+        session = FakeSession()
+        single_flight = SingleFlight()
+        client = AsyncGameClient(
+            "fake_key",
+            session=as_session(session),
+            cache=MemoryCache(),
+            events=EventHooks([events.append]),
+            single_flight=single_flight,
+        )
+
+        async def fetch() -> List[Response]:
+            return await asyncio.gather(*(client.fetch(1) for _ in range(3)))
+
+        first, second, third = run(fetch())
+
+        assert first is second is third
+        assert len(session.calls) == 1
+        assert single_flight.saved == 2
+        assert [event.coalesced for event in events] == [False, True, True]
+
+    def test_retries_exhausted(self) -> None:
+        """Test the last failure is raised once retries are exhausted."""
+        client = AsyncGameClient(
+            "fake_key",
+            session=as_session(FakeSession(failures=[aiohttp.ClientError()] * 2)),
+            retry_policy=RetryPolicy(max_retries=1, backoff_factor=0),
+        )
+
+        with pytest.raises(aiohttp.ClientError):
+            run(client.fetch(1))
+
+    def test_circuit_breaker(self) -> None:
+        """Test calls fail fast once the circuit of the resource opens."""
+        session = FakeSession(status=503)
+        client = AsyncGameClient(
+            "fake_key",
+            session=as_session(session),
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+
+        with pytest.raises(BadRequestException):
+            run(client.fetch(1))
+        with pytest.raises(CircuitOpenException):
+            run(client.fetch(1))
+
+        assert len(session.calls) == 1
+
+    def test_invalid_return_fields(self) -> None:
+        """Test return fields are validated with the sync client rules."""
+        client = AsyncGameClient("fake_key", session=as_session(FakeSession()))
+
+        with pytest.raises(InvalidReturnFieldException):
+            run(client.fetch(1, ["bad"]))
+
+    def test_bad_request(self) -> None:
+        """Test HTTP errors are raised as bad requests."""
+        client = AsyncGameClient(
+            "fake_key", session=as_session(FakeSession(status=500))
+        )
+
+        with pytest.raises(BadRequestException):
+            run(client.fetch(1))
+
+    def test_bad_response(self) -> None:
+        """Test GB error responses are raised as invalid responses."""
+        session = FakeSession(body={"status_code": 100, "error": "Invalid API Key"})
+        client = AsyncGameClient("fake_key", session=as_session(session))
+
+        with pytest.raises(InvalidResponseException):
+            run(client.fetch(1))
+
+
+class TestAsyncSearchClients:
+    """Tests for the async search clients."""
+
+    def test_games_quick_search(self) -> None:
+        """Test the games quick search filters by name and platform."""
+        session = FakeSession()
+        client = AsyncGamesClient("fake_key", session=as_session(session))
+
+        res = run(client.quick_search("game name", platform=pybomb.PS4))
+
+        assert isinstance(res, Response)
+        assert res.result is None
+        url, kwargs = session.calls[0]
+        assert url == "http://www.giantbomb.com/api/games"
+        assert kwargs["params"] == {
+            "filter": f"name:game name,platforms:{pybomb.PS4}",
+            "api_key": "fake_key",
+            "format": "json",
+        }
+
+    def test_platforms_quick_search(self) -> None:
+        """Test the platforms quick search filters by name and sorts."""
+        session = FakeSession()
+        client = AsyncPlatformsClient("fake_key", session=as_session(session))
+
+        run(client.quick_search("name", sort_by="name", desc=False))
+
+        url, kwargs = session.calls[0]
+        assert url == "http://www.giantbomb.com/api/platforms"
+        assert kwargs["params"] == {
+            "filter": "name:name",
+            "sort": "name:asc",
+            "api_key": "fake_key",
+            "format": "json",
+        }
+
+    def test_execute(self) -> None:
+        """Test a prepared search binds its values on execution."""
+        session = FakeSession()
+        client = AsyncGamesClient(
+            "fake_key", session=as_session(session), cache=MemoryCache()
+        )
+        plan = client.prepare({"platforms": pybomb.PS4}, bind=["name"], limit=10)
+
+        res = run(client.execute(plan, offset=10, name="mario"))
+        cached_res = run(
+            client.search(
+                {"platforms": pybomb.PS4, "name": "mario"}, limit=10, offset=10
+            )
+        )
+
+        assert isinstance(res, Response)
+        assert cached_res is res
+        assert len(session.calls) == 1
+        _, kwargs = session.calls[0]
+        assert kwargs["params"] == {
+            "filter": f"platforms:{pybomb.PS4},name:mario",
+            "limit": 10,
+            "offset": 10,
+            "api_key": "fake_key",
+            "format": "json",
+        }
+
+    def test_invalid_filters(self) -> None:
+        """Test filters are validated with the sync client rules."""
+        client = AsyncGamesClient("fake_key", session=as_session(FakeSession()))
+
+        with pytest.raises(InvalidFilterFieldException):
+            run(client.search({"api_detail_url": "something"}))
+
+
+class TestAsyncSessions:
+    """Tests for async session ownership."""
+
+    def test_client_creates_and_closes_session(self) -> None:
+        """Test a client without a session creates one and closes it on exit."""
+
+        async def use_client() -> None:
+            client = AsyncGamesClient("fake_key")
+            async with client:
+                session = FakeSession()
+                client._session = as_session(session)
+                await client.quick_search("name")
+
+            assert session.closed
+            assert client._session is None
+
+        run(use_client())
+
+    def test_client_leaves_shared_session_open(self) -> None:
+        """Test a client does not close a session it was given."""
+        session = FakeSession()
+
+        async def use_client() -> None:
+            client = AsyncGamesClient("fake_key", session=as_session(session))
+            async with client:
+                await client.quick_search("name")
+
+        run(use_client())
+
+        assert not session.closed
+
+    def test_client_creates_session_on_first_use(self) -> None:
+        """Test a pooled session is created on first use."""
+        session = FakeSession()
+        client = AsyncGamesClient("fake_key")
+
+        with patch(
+            "pybomb.clients.base.async_client.create_async_session",
+            return_value=session,
+        ):
+            run(client.quick_search("name"))
+            run(client.close())
+
+        assert session.calls
+        assert session.closed
+
+
+class TestAsyncClientFactory:
+    """Tests for the AsyncClientFactory."""
+
+    def test_clients_share_session(self) -> None:
+        """Test built clients share the factory session, closed on exit."""
+
+        async def build() -> Any:
+            async with AsyncClientFactory("fake_key") as factory:
+                games_client = factory.build("games")
+                game_client = factory.build("game")
+
+                assert isinstance(games_client, AsyncGamesClient)
+                assert isinstance(game_client, AsyncGameClient)
+                assert games_client._session is factory.session
+                assert game_client._session is factory.session
+                assert games_client.api_key == "fake_key"
+
+                return factory.session
+
+        session = run(build())
+
+        assert session.closed
+
+    def test_supplied_session(self) -> None:
+        """Test a supplied session is used and not closed by the factory."""
+        session = FakeSession()
+
+        async def build() -> None:
+            async with AsyncClientFactory(
+                "fake_key", session=as_session(session)
+            ) as factory:
+                client = factory.build("platforms")
+                assert client._session is session
+
+        run(build())
+
+        assert not session.closed
+
+    def test_clients_share_events(self) -> None:
+        """Test supplied event hooks are shared by the built clients."""
+        events = EventHooks()
+        factory = AsyncClientFactory(
+            "fake_key", session=as_session(FakeSession()), events=events
+        )
+
+        assert factory.build("games")._events is events
+        assert factory.build("game")._events is events
+
+    def test_clients_share_single_flight(self) -> None:
+        """Test a supplied single flight is shared by the built clients."""
+        single_flight = SingleFlight()
+        factory = AsyncClientFactory(
+            "fake_key", session=as_session(FakeSession()), single_flight=single_flight
+        )
+
+        assert factory.build("games")._single_flight is single_flight
+        assert factory.build("game")._single_flight is single_flight
@@ -1,11 +1,13 @@
 """Tests for the PyBomb FetchClient."""
 import importlib
+import json
 import re
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pkg_resources
 import pytest
+from requests import Session
 from requests.exceptions import HTTPError
 from requests.models import Response as RequestsResponse
 
@@ -32,7 +34,7 @@ class TestFetchClients:
     @pytest.fixture
     def mock_requests_get(self) -> Generator[MagicMock, None, None]:
         """Request GET test mock."""
-        with patch("pybomb.clients.base.fetch_client.get") as req_mock:
+        with patch.object(Session, "get") as req_mock:
             yield req_mock
 
     @pytest.fixture
@@ -40,6 +42,8 @@ class TestFetchClients:
         """Raw response test mock."""
         mock_response = MagicMock(RequestsResponse)
         mock_response.url = "https://fake.com"
+        mock_response.status_code = 200
+        mock_response.headers = {}
 
         mock_response.json.return_value = {
             "status_code": 1,
@@ -47,6 +51,7 @@ class TestFetchClients:
             "number_of_total_results": 1,
             "results": {"id": 1, "description": "Great Game"},
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         return mock_response
 
@@ -150,6 +155,7 @@ class TestFetchClients:
         mock_response_json["status_code"] = 2
         mock_response_json["error"] = "Badness"
         mock_response.json.return_value = mock_response_json
+        mock_response.content = json.dumps(mock_response_json).encode()
 
         with pytest.raises(InvalidResponseException):
             fetch_client.fetch(1)
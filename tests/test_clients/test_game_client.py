@@ -0,0 +1,136 @@
+"""Tests for the PyBomb GameClient."""
+import json
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+from requests.models import Response as RequestsResponse
+
+from pybomb.cache import MemoryCache
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.exceptions import InvalidReturnFieldException
+from pybomb.records import Record
+from pybomb.response import FetchManyResult
+
+
+class TestFetchMany:
+    """Tests for fetching many games at once."""
+
+    MISSING_IDS = {2, 150}
+
+    @pytest.fixture
+    def mock_requests_get(self) -> Generator[MagicMock, None, None]:
+        """Serve games searches and game fetches, for all but the missing IDs."""
+
+        def get(url: str, params: Dict, **kwargs: Any) -> MagicMock:
+            if url.endswith("/games"):
+                id_filter = params["filter"].split(":")[1]
+                results: Any = [
+                    {"id": int(id_), "name": f"Game {id_}"}
+                    for id_ in id_filter.split("|")
+                    if int(id_) not in self.MISSING_IDS
+                ]
+            else:
+                id_ = int(url.rsplit("/", 1)[1])
+                results = {"id": id_, "developers": [{"id": id_ * 10}]}
+
+            response = MagicMock(RequestsResponse)
+            response.url = url
+            response.status_code = 200
+            response.content = json.dumps(
+                {
+                    "status_code": 1,
+                    "number_of_page_results": 1,
+                    "number_of_total_results": 1,
+                    "results": results,
+                }
+            ).encode()
+
+            return response
+
+        with patch.object(Session, "get", side_effect=get) as req_mock:
+            yield req_mock
+
+    def requested_urls(self, mock_requests_get: MagicMock) -> List[str]:
+        """Get the URLs of each call made."""
+        return [call[0][0] for call in mock_requests_get.call_args_list]
+
+    def test_batches_ids(self, mock_requests_get: MagicMock) -> None:
+        """Test IDs are searched for in batches of the max page size."""
+        client = GameClient("key")
+        ids = list(range(1, 251)) + [1]
+
+        res = client.fetch_many(ids, ["name"])
+
+        assert isinstance(res, FetchManyResult)
+        assert len(res.results) == 248
+        assert res.results[1] == {"id": 1, "name": "Game 1"}
+        assert res.missing == [2, 150]
+        assert self.requested_urls(mock_requests_get) == [
+            "http://www.giantbomb.com/api/games"
+        ] * 3
+
+        first_params = mock_requests_get.call_args_list[0][1]["params"]
+        assert first_params["filter"] == "id:" + "|".join(map(str, range(1, 101)))
+        assert first_params["field_list"] == "name,id"
+        assert first_params["limit"] == 100
+
+    def test_fetches_detail_fields(self, mock_requests_get: MagicMock) -> None:
+        """Test detail only fields are fetched for each game found."""
+        client = GameClient("key")
+
+        res = client.fetch_many([1, 2, 3], ["name", "developers"], workers=2)
+
+        assert res.results == {
+            1: {"id": 1, "name": "Game 1", "developers": [{"id": 10}]},
+            3: {"id": 3, "name": "Game 3", "developers": [{"id": 30}]},
+        }
+        assert res.missing == [2]
+        assert sorted(self.requested_urls(mock_requests_get)) == [
+            "http://www.giantbomb.com/api/game/1",
+            "http://www.giantbomb.com/api/game/3",
+            "http://www.giantbomb.com/api/games",
+        ]
+
+    def test_cached_searches_unchanged(self, mock_requests_get: MagicMock) -> None:
+        """Test detail fields are not merged into cached search results."""
+        cache = MemoryCache()
+        GameClient("key", cache=cache).fetch_many([1], ["name", "developers"])
+
+        games_client = GamesClient("key", cache=cache)
+        res = games_client.search({"id": "1"}, ["name", "id"], limit=100)
+
+        assert res.results == [{"id": 1, "name": "Game 1"}]
+        assert len(mock_requests_get.call_args_list) == 2
+
+    def test_records(self, mock_requests_get: MagicMock) -> None:
+        """Test details are returned as records if the client uses them."""
+        client = GameClient("key", records=True)
+
+        res = client.fetch_many([1, 2, 3], ["name", "developers"])
+
+        record = res.results[1]
+        assert isinstance(record, Record)
+        assert record.FIELDS == ("name", "developers", "id")
+        assert record.developers == [{"id": 10}]
+        assert res.missing == [2]
+
+    def test_defaults_to_all_fields(self, mock_requests_get: MagicMock) -> None:
+        """Test all fields are requested when no return fields are given."""
+        client = GameClient("key")
+
+        client.fetch_many([1])
+
+        fetch_params = mock_requests_get.call_args_list[1][1]["params"]
+        assert "characters" in fetch_params["field_list"]
+
+    def test_invalid_return_fields(self, mock_requests_get: MagicMock) -> None:
+        """Test return fields are validated before any call is made."""
+        client = GameClient("key")
+
+        with pytest.raises(InvalidReturnFieldException):
+            client.fetch_many([1], ["bad"])
+
+        mock_requests_get.assert_not_called()
@@ -1,22 +1,35 @@
 """Tests for all PyBomb Search Clients."""
 import importlib
+import json
 import re
-from typing import Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 from unittest.mock import MagicMock
 
 import pkg_resources
 import pytest
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError, HTTPError
+from requests.models import Response as RequestsResponse
 
+from pybomb.cache import MemoryCache
 from pybomb.clients.base.search_client import SearchClient
+from pybomb.events import CallEvent, EventHooks
 from pybomb.exceptions import (
     BadRequestException,
+    CircuitOpenException,
     InvalidFilterFieldException,
+    InvalidPlanException,
     InvalidResponseException,
     InvalidReturnFieldException,
     InvalidSortFieldException,
 )
+from pybomb.plan import SearchPlan
+from pybomb.rate_limit import RateLimiter
+from pybomb.records import Record
 from pybomb.response import Response
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.single_flight import SingleFlight
 from .helpers import get_clients
 
 version = pkg_resources.require("pybomb")[0].version
@@ -79,6 +92,7 @@ class TestSearchClients:
         mock_response_json["status_code"] = 2
         mock_response_json["error"] = "Badness"
         mock_response.json.return_value = mock_response_json
+        mock_response.content = json.dumps(mock_response_json).encode()
 
         with pytest.raises(InvalidResponseException):
             getattr(search_client, search_method)(call_params)
@@ -103,6 +117,299 @@ class TestSearchClients:
                 headers={"User-Agent": "Pybomb {}".format(version)},
             )
 
+        def test_cache(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test repeated calls are answered from a supplied cache."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            cache = MemoryCache()
+            search_client = getattr(client_module, test_client)("key", cache=cache)
+            mock_requests_get.return_value = mock_response
+
+            res = search_client.search({"name": "name"}, limit=10)
+            cached_res = search_client.search({"name": "name"}, limit=10)
+            search_client.search({"name": "other"}, limit=10)
+
+            assert cached_res is res
+            assert mock_requests_get.call_count == 2
+            assert cache.hits == 1
+            assert cache.misses == 2
+
+        def test_records(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test results are returned as records, and cached as dicts."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            client_class = getattr(client_module, test_client)
+            cache = MemoryCache()
+            record_client = client_class("key", cache=cache, records=True)
+            dict_client = client_class("key", cache=cache)
+            mock_response.content = json.dumps(
+                {
+                    "status_code": 1,
+                    "number_of_page_results": 1,
+                    "number_of_total_results": 1,
+                    "results": [{"id": 1, "name": "Name", "image": {"id": 2}}],
+                }
+            ).encode()
+            mock_requests_get.return_value = mock_response
+
+            res = record_client.search({"name": "name"}, ["id", "name", "image"])
+            cached_res = dict_client.search({"name": "name"}, ["id", "name", "image"])
+            all_fields_res = record_client.search({"name": "name"})
+
+            record = res.results[0]
+            assert isinstance(record, Record)
+            assert record.FIELDS == ("id", "name", "image")
+            assert record.image == {"id": 2}
+            assert type(cached_res.results[0]) is dict
+            assert cached_res.results[0] == record
+            assert all_fields_res.results[0].FIELDS == tuple(
+                client_class.RESPONSE_FIELD_MAP
+            )
+            assert mock_requests_get.call_count == 2
+
+        def test_rate_limiter(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test each call waits for the rate limiter of the resource."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            rate_limiter = MagicMock(RateLimiter)
+            search_client = getattr(client_module, test_client)(
+                "key", rate_limiter=rate_limiter
+            )
+            mock_requests_get.return_value = mock_response
+
+            search_client.quick_search("name")
+
+            rate_limiter.acquire.assert_called_once_with(search_client.RESOURCE_NAME)
+
+        def test_retry(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test network errors and retryable statuses are retried."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            retry_policy = RetryPolicy(backoff_factor=0)
+            search_client = getattr(client_module, test_client)(
+                "key", retry_policy=retry_policy
+            )
+            unavailable_response = MagicMock(RequestsResponse)
+            unavailable_response.status_code = 503
+            unavailable_response.headers = {"Retry-After": "0"}
+            mock_requests_get.side_effect = [
+                ConnectionError(),
+                unavailable_response,
+                mock_response,
+            ]
+
+            res = search_client.quick_search("name")
+
+            assert isinstance(res, Response)
+            assert mock_requests_get.call_count == 3
+            assert retry_policy.retries == 2
+
+        def test_retries_exhausted(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test failures are raised once retries are exhausted."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            search_client = getattr(client_module, test_client)(
+                "key", retry_policy=RetryPolicy(max_retries=1, backoff_factor=0)
+            )
+            mock_response.status_code = 503
+            mock_response.raise_for_status.side_effect = HTTPError
+            mock_requests_get.return_value = mock_response
+
+            with pytest.raises(BadRequestException):
+                search_client.quick_search("name")
+
+            mock_requests_get.side_effect = ConnectionError()
+
+            with pytest.raises(ConnectionError):
+                search_client.quick_search("name")
+
+            assert mock_requests_get.call_count == 4
+
+        def test_circuit_breaker(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test calls fail fast once the circuit of the resource opens."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            circuit_breaker = CircuitBreaker(failure_threshold=1)
+            search_client = getattr(client_module, test_client)(
+                "key", circuit_breaker=circuit_breaker
+            )
+            mock_requests_get.return_value = mock_response
+            search_client.quick_search("name")
+            mock_requests_get.side_effect = ConnectionError()
+
+            with pytest.raises(ConnectionError):
+                search_client.quick_search("name")
+            with pytest.raises(CircuitOpenException):
+                search_client.quick_search("name")
+
+            assert mock_requests_get.call_count == 2
+            assert circuit_breaker.is_open(search_client.RESOURCE_NAME)
+
+        def test_events(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test each call emits an event with its phases and outcome."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            events: List[CallEvent] = []
+            search_client = getattr(client_module, test_client)(
+                "key",
+                cache=MemoryCache(),
+                rate_limiter=MagicMock(RateLimiter),
+                retry_policy=RetryPolicy(backoff_factor=0),
+                events=EventHooks([events.append]),
+            )
+            unavailable_response = MagicMock(RequestsResponse)
+            unavailable_response.status_code = 503
+            unavailable_response.headers = {}
+            unavailable_response.content = b"busy"
+            mock_requests_get.side_effect = [unavailable_response, mock_response]
+
+            search_client.quick_search("name")
+            search_client.quick_search("name")
+            mock_requests_get.side_effect = ConnectionError()
+            with pytest.raises(ConnectionError):
+                search_client.quick_search("other")
+
+            call, cached, failed = events
+            assert call.resource == search_client.RESOURCE_NAME
+            assert [phase.name for phase in call.phases] == [
+                "prepare",
+                "throttle",
+                "request",
+                "backoff",
+                "throttle",
+                "request",
+                "decode",
+                "validate",
+                "build",
+            ]
+            assert call.status == 200
+            assert call.bytes_received == 4 + len(mock_response.content)
+            assert call.retries == 1
+            assert not call.cache_hit
+            assert call.error is None
+            assert call.duration >= sum(phase.duration for phase in call.phases)
+
+            assert cached.cache_hit
+            assert [phase.name for phase in cached.phases] == ["prepare", "build"]
+            assert cached.status is None
+
+            assert isinstance(failed.error, ConnectionError)
+            assert failed.retries == 3
+            assert failed.status is None
+
+        def test_single_flight(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test identical calls made at the same time share one call."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            events: List[CallEvent] = []
+            single_flight = SingleFlight()
+            search_client = getattr(client_module, test_client)(
+                "key", events=EventHooks([events.append]), single_flight=single_flight
+            )
+
+            def get(*args: Any, **kwargs: Any) -> MagicMock:
+                deadline = time.monotonic() + 5
+                while single_flight.saved < 2 and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                return mock_response
+
+            mock_requests_get.side_effect = get
+
+            with ThreadPoolExecutor(3) as executor:
+                first, second, third = executor.map(
+                    lambda _: search_client.quick_search("name"), range(3)
+                )
+            search_client.quick_search("name")
+
+            assert first is second is third
+            assert mock_requests_get.call_count == 2
+            assert single_flight.saved == 2
+            coalesced = [event for event in events if event.coalesced]
+            assert len(coalesced) == 2
+            assert [phase.name for phase in coalesced[0].phases] == [
+                "prepare",
+                "coalesce",
+                "build",
+            ]
+            assert coalesced[0].status is None
+
+        def test_decodes_once(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test the response body is decoded once, by the supplied decoder."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            decoder = MagicMock(side_effect=json.loads)
+            search_client = getattr(client_module, test_client)("key", decoder=decoder)
+            mock_requests_get.return_value = mock_response
+
+            res = search_client.quick_search("name")
+
+            assert res.results == []
+            decoder.assert_called_once_with(mock_response.content)
+            mock_response.json.assert_not_called()
+
     class TestQuickSearch:
         """Tests for the quick_search method."""
 
@@ -304,3 +611,157 @@ class TestSearchClients:
                 },
                 headers={"User-Agent": "Pybomb {}".format(version)},
             )
+
+    class TestPrepare:
+        """Tests for prepared searches."""
+
+        def test_execute(
+            self, search_client: SearchClient, mock_requests_get: MagicMock
+        ) -> None:
+            """Test a plan makes the same call as the equivalent search."""
+            plan = search_client.prepare(
+                bind=["name"], return_fields=["id", "name"], sort_by="name", limit=10
+            )
+
+            res = search_client.execute(plan, offset=20, name="mario")
+            search_client.search({"name": "mario"}, ["id", "name"], "name", True, 10, 20)
+
+            assert isinstance(res, Response)
+            prepared_call, search_call = mock_requests_get.call_args_list
+            assert prepared_call == search_call
+            assert prepared_call[1]["params"]["filter"] == "name:mario"
+
+        def test_shares_cache_with_search(
+            self,
+            test_client: str,
+            mock_requests_get: MagicMock,
+            mock_response: MagicMock,
+        ) -> None:
+            """Test executions of a plan are cached with the equivalent searches."""
+            client_module_name = client_pattern.sub("_", test_client).lower()
+            client_module = importlib.import_module(
+                f"pybomb.clients.{client_module_name}"
+            )
+            search_client = getattr(client_module, test_client)(
+                "key", cache=MemoryCache()
+            )
+            mock_requests_get.return_value = mock_response
+            plan = search_client.prepare(bind=["name"], sort_by="name", limit=10)
+
+            res = search_client.search({"name": "a"}, sort_by="name", limit=10)
+            cached_res = search_client.execute(plan, name="a")
+            search_client.execute(plan, name="b")
+
+            assert cached_res is res
+            assert mock_requests_get.call_count == 2
+
+        def test_invalid_fields(self, search_client: SearchClient) -> None:
+            """Test fields are validated when preparing and binding values."""
+            plan = search_client.prepare(bind=["name"])
+
+            with pytest.raises(InvalidFilterFieldException):
+                search_client.prepare(bind=["api_detail_url"])
+            with pytest.raises(InvalidReturnFieldException):
+                search_client.prepare(return_fields=["bad"])
+            with pytest.raises(InvalidFilterFieldException):
+                search_client.execute(plan, id=1)
+
+        def test_plan_for_another_resource(self, search_client: SearchClient) -> None:
+            """Test plans can only be executed on clients of their resource."""
+            plan = SearchPlan.compile("other", {}, "", (), "json")
+
+            with pytest.raises(InvalidPlanException):
+                search_client.execute(plan)
+
+    class TestIterSearch:
+        """Tests for the iter_search method."""
+
+        @pytest.fixture
+        def paged_requests_get(
+            self, mock_requests_get: MagicMock, mock_response: MagicMock
+        ) -> MagicMock:
+            """Serve pages of a 25 result search, based on the offset and limit."""
+
+            def get_page(*args: Any, params: Dict, **kwargs: Any) -> MagicMock:
+                offset, limit = params["offset"], params["limit"]
+                ids = list(range(offset, min(offset + limit, 25)))
+
+                page = MagicMock(RequestsResponse)
+                page.url = mock_response.url
+                page.status_code = 200
+                page.content = json.dumps(
+                    {
+                        "status_code": 1,
+                        "number_of_page_results": len(ids),
+                        "number_of_total_results": 25,
+                        "results": [{"id": id_} for id_ in ids],
+                    }
+                ).encode()
+
+                return page
+
+            mock_requests_get.side_effect = get_page
+
+            return mock_requests_get
+
+        def test_iterates_all_pages(
+            self, search_client: SearchClient, paged_requests_get: MagicMock
+        ) -> None:
+            """Test every result is yielded in order, one request per page."""
+            results = list(
+                search_client.iter_search(
+                    {"name": "name"}, sort_by="id", desc=False, page_size=10
+                )
+            )
+
+            assert [result["id"] for result in results] == list(range(25))
+
+            calls = paged_requests_get.call_args_list
+            assert [call[1]["params"]["offset"] for call in calls] == [0, 10, 20]
+
+            for call in calls:
+                assert call[1]["params"]["filter"] == "name:name"
+                assert call[1]["params"]["sort"] == "id:asc"
+                assert call[1]["params"]["limit"] == 10
+
+        def test_stops_early(
+            self, search_client: SearchClient, paged_requests_get: MagicMock
+        ) -> None:
+            """Test breaking out early only prefetches the next page."""
+            for result in search_client.iter_search({"name": "name"}, page_size=5):
+                if result["id"] == 2:
+                    break
+
+            assert paged_requests_get.call_count <= 2
+
+        @pytest.mark.parametrize("workers", [1, 3, 10])
+        def test_concurrent_pages_in_order(
+            self,
+            workers: int,
+            search_client: SearchClient,
+            paged_requests_get: MagicMock,
+        ) -> None:
+            """Test pages fetched concurrently are still yielded in order."""
+            results = search_client.iter_search(
+                {"name": "name"}, page_size=2, workers=workers
+            )
+
+            assert [result["id"] for result in results] == list(range(25))
+            assert paged_requests_get.call_count == 13
+
+        def test_concurrent_stops_early(
+            self, search_client: SearchClient, paged_requests_get: MagicMock
+        ) -> None:
+            """Test breaking out early only prefetches up to the worker count."""
+            for _ in search_client.iter_search({"name": "name"}, page_size=2, workers=3):
+                break
+
+            assert paged_requests_get.call_count <= 4
+
+        def test_single_page(
+            self, search_client: SearchClient, mock_requests_get: MagicMock
+        ) -> None:
+            """Test a result set smaller than a page makes a single request."""
+            assert list(search_client.iter_search({"name": "name"})) == []
+
+            mock_requests_get.assert_called_once()
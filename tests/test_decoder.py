@@ -0,0 +1,23 @@
+"""Tests for the PyBomb decoder module."""
+import json
+from unittest.mock import patch
+
+from pybomb import decoder
+
+
+class TestGetDefaultDecoder:
+    """Tests for get_default_decoder."""
+
+    def test_prefers_orjson(self) -> None:
+        """Test orjson is used when it is installed."""
+        with patch.object(decoder, "orjson") as orjson:
+            assert decoder.get_default_decoder() is orjson.loads
+
+    def test_falls_back_to_json(self) -> None:
+        """Test the standard library is used when orjson is not installed."""
+        with patch.object(decoder, "orjson", None):
+            assert decoder.get_default_decoder() is json.loads
+
+    def test_decodes_bytes(self) -> None:
+        """Test the default decoder decodes a body from bytes."""
+        assert decoder.get_default_decoder()(b'{"results": [1]}') == {"results": [1]}
@@ -0,0 +1,232 @@
+"""Tests for the PyBomb download module."""
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+from requests.exceptions import ConnectionError, HTTPError
+
+from pybomb.download import DownloadStats, ImageDownloader
+
+BASE = "https://giantbomb.com/a/uploads"
+
+
+class FakeImages:
+    """Serve images by URL, in chunks, counting the downloads in flight."""
+
+    def __init__(self) -> None:
+        """Start with no images."""
+        self.images: Dict[str, bytes] = {}
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, **kwargs: Any) -> MagicMock:
+        """Respond with the image at the URL, or a 404."""
+        assert kwargs["stream"] is True
+        self.calls.append(url)
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.__exit__.side_effect = self._exit
+        if url not in self.images:
+            response.raise_for_status.side_effect = HTTPError("404")
+        content = self.images.get(url, b"")
+        response.iter_content.side_effect = lambda size: (
+            content[start : start + size] for start in range(0, len(content), size)
+        )
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        return response
+
+    def _exit(self, *args: Any) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def images() -> Generator[FakeImages, None, None]:
+    """Images of 3 games, two of which share their content."""
+    images = FakeImages()
+    images.images[f"{BASE}/original/1.jpg"] = b"one" * 100
+    images.images[f"{BASE}/thumb/1.jpg"] = b"1"
+    images.images[f"{BASE}/original/2.jpg"] = b"two" * 100
+    images.images[f"{BASE}/original/3.jpg"] = b"two" * 100
+    with patch.object(Session, "get", side_effect=images):
+        yield images
+
+
+def game(id_: int) -> Dict[str, Any]:
+    """Create a game with an image."""
+    return {
+        "id": id_,
+        "image": {
+            "original_url": f"{BASE}/original/{id_}.jpg",
+            "thumb_url": f"{BASE}/thumb/{id_}.jpg",
+        },
+    }
+
+
+def test_download(images: FakeImages, tmp_path: Path) -> None:
+    """Test images are streamed to the paths of their URLs."""
+    downloader = ImageDownloader(tmp_path, chunk_size=16)
+
+    stats = downloader.download(
+        [game(1), game(2), {"id": 4, "image": None}, {"id": 5, "image": {}}]
+    )
+
+    assert (tmp_path / "a/uploads/original/1.jpg").read_bytes() == b"one" * 100
+    assert (tmp_path / "a/uploads/original/2.jpg").read_bytes() == b"two" * 100
+    assert stats._replace(seconds=0) == DownloadStats(2, 0, 0, 0, 0, 600, 0)
+    assert stats.bytes_per_second > 0
+    assert stats.files_per_second > 0
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_sizes(images: FakeImages, tmp_path: Path) -> None:
+    """Test every wanted size of an image is downloaded."""
+    downloader = ImageDownloader(tmp_path, sizes=["original_url", "thumb_url"])
+
+    stats = downloader.download([game(1)])
+
+    assert stats.downloaded == 2
+    assert (tmp_path / "a/uploads/thumb/1.jpg").read_bytes() == b"1"
+
+
+def test_duplicate_urls(images: FakeImages, tmp_path: Path) -> None:
+    """Test URLs seen before are not downloaded again."""
+    downloader = ImageDownloader(tmp_path)
+    downloader.download([game(1)])
+
+    stats = downloader.download([game(1), game(1)])
+
+    assert stats.duplicate_urls == 2
+    assert images.calls == [f"{BASE}/original/1.jpg"]
+
+
+def test_existing(images: FakeImages, tmp_path: Path) -> None:
+    """Test files already present are not downloaded again."""
+    ImageDownloader(tmp_path).download([game(1)])
+
+    stats = ImageDownloader(tmp_path).download([game(1)])
+
+    assert stats.existing == 1
+    assert len(images.calls) == 1
+
+
+def test_duplicate_content(images: FakeImages, tmp_path: Path) -> None:
+    """Test files with the same content as another are hard linked to it."""
+    stats = ImageDownloader(tmp_path, workers=1).download([game(2), game(3)])
+
+    original = tmp_path / "a/uploads/original/2.jpg"
+    duplicate = tmp_path / "a/uploads/original/3.jpg"
+    assert stats.downloaded == 1
+    assert stats.duplicate_content == 1
+    assert duplicate.read_bytes() == b"two" * 100
+    assert duplicate.stat().st_ino == original.stat().st_ino
+
+
+def test_duplicate_content_without_links(images: FakeImages, tmp_path: Path) -> None:
+    """Test duplicate files are kept if they cannot be hard linked."""
+    with patch("os.link", side_effect=OSError):
+        stats = ImageDownloader(tmp_path, workers=1).download([game(2), game(3)])
+
+    duplicate = tmp_path / "a/uploads/original/3.jpg"
+    assert stats.duplicate_content == 1
+    assert duplicate.read_bytes() == b"two" * 100
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_failed(images: FakeImages, tmp_path: Path) -> None:
+    """Test images that cannot be downloaded are counted, and not saved."""
+    stats = ImageDownloader(tmp_path).download([game(1), game(5)])
+
+    assert stats.downloaded == 1
+    assert stats.failed == 1
+    assert list(tmp_path.rglob("5.jpg*")) == []
+
+
+def iter_failing() -> Generator[bytes, None, None]:
+    """Yield a chunk, then fail."""
+    yield b"one"
+    raise ConnectionError
+
+
+def test_failed_mid_stream(images: FakeImages, tmp_path: Path) -> None:
+    """Test partial files are removed if the download fails part way."""
+    chunks = MagicMock()
+    chunks.__enter__.return_value = chunks
+    chunks.iter_content.return_value = iter_failing()
+    with patch.object(Session, "get", return_value=chunks):
+        stats = ImageDownloader(tmp_path).download([game(1)])
+
+    assert stats.failed == 1
+    assert list(tmp_path.rglob("1.jpg*")) == []
+
+
+def open_failing(failing: str) -> Callable[..., Any]:
+    """Open files for real, except that writes to the named file fail."""
+
+    def open_file(path: Path, mode: str) -> Any:
+        real = open(path, mode)
+        if path.name != failing:
+            return real
+
+        file = MagicMock()
+        file.__enter__.return_value = file
+        file.__exit__.side_effect = lambda *args: real.close()
+        file.write.side_effect = OSError(28, "No space left on device")
+        return file
+
+    return open_file
+
+
+def test_failed_write(images: FakeImages, tmp_path: Path) -> None:
+    """Test partial files are removed, and the error raised, if a write fails."""
+    with patch("pybomb.download.open", open_failing("1.jpg.part"), create=True):
+        with pytest.raises(OSError):
+            ImageDownloader(tmp_path).download([game(1)])
+
+    assert list(tmp_path.rglob("1.jpg*")) == []
+
+
+def test_failed_write_finished(images: FakeImages, tmp_path: Path) -> None:
+    """Test errors are raised from downloads that finish before the last."""
+    with patch("pybomb.download.open", open_failing("1.jpg.part"), create=True):
+        with pytest.raises(OSError):
+            ImageDownloader(tmp_path, workers=1).download([game(1), game(2)])
+
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_workers(images: FakeImages, tmp_path: Path) -> None:
+    """Test no more than `workers` images are downloaded at once."""
+    for id_ in range(10, 30):
+        images.images[f"{BASE}/original/{id_}.jpg"] = str(id_).encode()
+
+    stats = ImageDownloader(tmp_path, workers=3).download(
+        game(id_) for id_ in range(10, 30)
+    )
+
+    assert stats.downloaded == 20
+    assert images.max_in_flight <= 3
+
+
+@pytest.mark.parametrize(
+    "url, path",
+    [
+        ("https://giantbomb.com/a/b/c.jpg", "a/b/c.jpg"),
+        ("https://giantbomb.com/a/../../c%20d.jpg?x=1", "a/c d.jpg"),
+        (
+            "https://giantbomb.com/",
+            "a042a9c24577568656c7f8cccdf70c876ecf3559e7fd6de5dbcbade7545adb8d",
+        ),
+    ],
+)
+def test_path_for(url: str, path: str, tmp_path: Path) -> None:
+    """Test images are saved at the paths of their URLs, within the directory."""
+    assert ImageDownloader(tmp_path).path_for(url).relative_to(tmp_path) == Path(path)
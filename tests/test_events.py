@@ -0,0 +1,92 @@
+"""Tests for the PyBomb events module."""
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.events import CallEvent, CallTrace, EventHooks, NULL_TRACE, Phase
+from .conftest import FakeClock
+
+
+class TestEventHooks:
+    """Tests for the EventHooks class."""
+
+    def test_listeners(self) -> None:
+        """Test events are emitted to every registered listener."""
+        first: List[CallEvent] = []
+        second: List[CallEvent] = []
+        hooks = EventHooks([first.append])
+        hooks.add_listener(second.append)
+
+        with hooks.trace("games"):
+            pass
+        hooks.remove_listener(first.append)
+        with hooks.trace("games"):
+            pass
+
+        assert len(first) == 1
+        assert len(second) == 2
+
+    def test_no_listeners(self) -> None:
+        """Test calls are not timed without listeners."""
+        hooks = EventHooks()
+
+        assert hooks.trace("games") is NULL_TRACE
+
+    def test_client_without_hooks(self) -> None:
+        """Test clients without hooks do not trace calls."""
+        assert GamesClient("key")._trace() is NULL_TRACE
+
+
+class TestCallTrace:
+    """Tests for the CallTrace class."""
+
+    def test_phases(self, clock: FakeClock) -> None:
+        """Test the phases of a call are timed from the epoch start."""
+        events: List[CallEvent] = []
+
+        with patch("pybomb.events.time.time", return_value=1000.0):
+            trace = CallTrace(EventHooks([events.append]), "games", clock)
+
+        with trace:
+            clock.now += 1
+            trace.begin("prepare")
+            clock.now += 2
+            trace.begin("request")
+            trace.response(200, 10)
+            clock.now += 3
+
+        event = events[0]
+        assert event.resource == "games"
+        assert event.start == 1000.0
+        assert event.duration == 6.0
+        assert event.phases == (
+            Phase("prepare", 1001.0, 2.0),
+            Phase("request", 1003.0, 3.0),
+        )
+        assert event.status == 200
+        assert event.bytes_received == 10
+
+    def test_error(self) -> None:
+        """Test a call raising an error is emitted with the error."""
+        events: List[CallEvent] = []
+        error = ValueError("bad")
+
+        with pytest.raises(ValueError):
+            with EventHooks([events.append]).trace("game") as trace:
+                trace.begin("request")
+                trace.retry()
+                raise error
+
+        assert events[0].error is error
+        assert events[0].retries == 1
+        assert events[0].phases[0].name == "request"
+
+    def test_null_trace(self) -> None:
+        """Test the null trace records nothing."""
+        with NULL_TRACE as trace:
+            trace.begin("prepare")
+            trace.response(200, 10)
+            trace.hit_cache()
+            trace.retry()
@@ -0,0 +1,153 @@
+"""Tests for the PyBomb expand module."""
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+
+from pybomb.cache import MemoryCache
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.exceptions import InvalidExpandFieldException
+from pybomb.expand import Expander
+from pybomb.records import Record
+from .catalog import FakeCatalog
+
+
+def reference(id_: int) -> Dict[str, Any]:
+    """Create a reference to a platform, as held by a game."""
+    return {"id": id_, "name": f"Result {id_}", "site_detail_url": f"/{id_}/"}
+
+
+class FakeApi:
+    """Serve the games and platforms resources from a catalog each."""
+
+    def __init__(self) -> None:
+        """Start with 6 games, on 3 of 4 platforms."""
+        self.games = FakeCatalog()
+        self.platforms = FakeCatalog()
+        for id_ in range(1, 5):
+            self.platforms.add(id_, "2020-01-01 00:00:00", abbreviation=f"P{id_}")
+        for id_, platforms in enumerate(([1, 2], [2], [3], [1], [2, 3], []), 1):
+            self.games.add(
+                id_,
+                "2020-01-01 00:00:00",
+                platforms=[reference(platform) for platform in platforms],
+                similar_games=[reference(id_ % 6 + 1)],
+            )
+
+    def __call__(self, url: str, params: Dict[str, Any], **kwargs: Any) -> MagicMock:
+        """Call the catalog of the resource."""
+        resource = url.split("/api/")[1].split("/")[0]
+        catalog = self.platforms if resource == "platforms" else self.games
+
+        return catalog(url, params, **kwargs)
+
+
+@pytest.fixture
+def api() -> Generator[FakeApi, None, None]:
+    """A fake GB API."""
+    api = FakeApi()
+    with patch.object(Session, "get", side_effect=api):
+        yield api
+
+
+def abbreviations(result: Any) -> List[Any]:
+    """Get the abbreviations of the platforms of a game."""
+    return [platform.get("abbreviation") for platform in result["platforms"]]
+
+
+def test_search(api: FakeApi) -> None:
+    """Test the references of every result are resolved in one call."""
+    cache = MemoryCache()
+    client = GamesClient("key", cache=cache)
+
+    response = client.search({}, expand=["platforms"])
+
+    assert [abbreviations(result) for result in response.results] == [
+        ["P1", "P2"],
+        ["P2"],
+        ["P3"],
+        ["P1"],
+        ["P2", "P3"],
+        [],
+    ]
+    assert response.results[0]["platforms"][0]["site_detail_url"] == "/1/"
+    assert api.platforms.calls[0]["filter"] == "id:1|2|3"
+    assert len(api.platforms.calls) == 1
+    assert abbreviations(client.search({}).results[0]) == [None, None]
+
+
+def test_batches(api: FakeApi, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test references are resolved in batches."""
+    monkeypatch.setattr(Expander, "BATCH_SIZE", 2)
+
+    GamesClient("key").search({}, expand=["platforms"])
+
+    assert [call["filter"] for call in api.platforms.calls] == ["id:1|2", "id:3"]
+
+
+def test_iter_search(api: FakeApi) -> None:
+    """Test the references of a page not resolved for earlier pages are."""
+    results = list(
+        GamesClient("key").iter_search(
+            {}, desc=False, page_size=2, expand=["platforms"]
+        )
+    )
+
+    assert abbreviations(results[4]) == ["P2", "P3"]
+    assert [call["filter"] for call in api.platforms.calls] == ["id:1|2", "id:3"]
+
+
+def test_fetch(api: FakeApi) -> None:
+    """Test the references of each field are resolved from their resource."""
+    result = (
+        GameClient("key").fetch(1, expand=["platforms", "similar_games"]).results[0]
+    )
+
+    assert abbreviations(result) == ["P1", "P2"]
+    assert result["similar_games"][0]["platforms"] == [reference(2)]
+    assert api.games.calls[1]["filter"] == "id:2"
+
+
+def test_shared_cache(api: FakeApi) -> None:
+    """Test objects resolved are cached by ID, and shared between searches."""
+    client = GamesClient("key", cache=MemoryCache())
+
+    client.search({"id": "1|2"}, expand=["platforms"])
+    result = client.search({"id": "5"}, expand=["platforms"]).results[0]
+
+    assert abbreviations(result) == ["P2", "P3"]
+    assert [call["filter"] for call in api.platforms.calls] == ["id:1|2", "id:3"]
+
+
+def test_records(api: FakeApi) -> None:
+    """Test expanded results of clients returning records are records."""
+    result = (
+        GamesClient("key", records=True).search({}, expand=["platforms"]).results[0]
+    )
+
+    assert isinstance(result, Record)
+    assert abbreviations(result) == ["P1", "P2"]
+
+
+def test_return_fields(api: FakeApi) -> None:
+    """Test expanded fields are always returned, once."""
+    GamesClient("key").search({}, ["name"], expand=["platforms", "platforms"])
+
+    assert api.games.calls[0]["field_list"] == "name,platforms"
+
+
+def test_unresolved(api: FakeApi) -> None:
+    """Test references that cannot be resolved are kept as they are."""
+    api.games.add(7, "2020-01-01 00:00:00", platforms=[reference(9), {"name": "?"}])
+
+    result = GamesClient("key").search({"id": 7}, expand=["platforms"]).results[0]
+
+    assert result["platforms"] == [reference(9), {"name": "?"}]
+
+
+def test_invalid_field() -> None:
+    """Test fields that cannot be expanded are rejected."""
+    with pytest.raises(InvalidExpandFieldException):
+        GamesClient("key").search({}, expand=["similar_games"])
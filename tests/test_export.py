@@ -0,0 +1,168 @@
+"""Tests for the PyBomb export module."""
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.export import export_search, ParquetSink, schema_for, to_record_batch
+from pybomb.records import record_type
+
+FIELDS = ["id", "name", "date_added", "original_release_date", "platforms", "image"]
+
+
+def make_result(id_: int) -> Dict[str, Any]:
+    """Create a result of a games search."""
+    return {
+        "id": id_,
+        "name": f"Game {id_}",
+        "date_added": "2008-04-01 12:30:00",
+        "original_release_date": "1992-11-21",
+        "platforms": [{"id": 146, "name": "PlayStation 4", "abbreviation": "PS4"}],
+        "image": {"original_url": f"https://giantbomb.com/{id_}.jpg"},
+    }
+
+
+@pytest.fixture
+def games_client() -> GamesClient:
+    """A games client."""
+    return GamesClient("fake_key")
+
+
+class TestSchemaFor:
+    """Tests for the schema_for function."""
+
+    def test_column_types(self, games_client: GamesClient) -> None:
+        """Test columns are typed by field."""
+        schema = schema_for(games_client, FIELDS)
+
+        assert schema.names == FIELDS
+        assert schema.field("id").type == pyarrow.int64()
+        assert schema.field("name").type == pyarrow.string()
+        assert schema.field("date_added").type == pyarrow.timestamp("ms")
+        assert pyarrow.types.is_list(schema.field("platforms").type)
+        assert pyarrow.types.is_struct(schema.field("image").type)
+
+    @pytest.mark.parametrize("client_class", [GamesClient, PlatformsClient])
+    def test_defaults_to_every_field(self, client_class: type) -> None:
+        """Test the schema has a column per field of the client by default."""
+        client = client_class("fake_key")
+
+        schema = schema_for(client)
+
+        assert schema.names == list(client.RESPONSE_FIELD_MAP)
+
+
+class TestToRecordBatch:
+    """Tests for the to_record_batch function."""
+
+    def test_converts_results(self, games_client: GamesClient) -> None:
+        """Test results are converted to rows, parsing dates and keeping lists."""
+        schema = schema_for(games_client, FIELDS)
+
+        batch = to_record_batch([make_result(1), {"id": 2}], schema)
+
+        rows = batch.to_pylist()
+        assert rows[0]["date_added"] == datetime(2008, 4, 1, 12, 30)
+        assert rows[0]["original_release_date"] == datetime(1992, 11, 21)
+        assert rows[0]["platforms"] == [
+            {
+                "api_detail_url": None,
+                "id": 146,
+                "name": "PlayStation 4",
+                "site_detail_url": None,
+                "abbreviation": "PS4",
+            }
+        ]
+        assert rows[0]["image"]["original_url"] == "https://giantbomb.com/1.jpg"
+        assert rows[1] == {"id": 2, **{field: None for field in FIELDS[1:]}}
+
+    def test_untyped_fields_as_text(self) -> None:
+        """Test values of fields without a known type are stored as strings."""
+        platforms_client = PlatformsClient("fake_key")
+        schema = schema_for(platforms_client, ["guid", "install_base"])
+
+        batch = to_record_batch([{"guid": "3045-146", "install_base": 1000}], schema)
+
+        assert batch.to_pylist() == [{"guid": "3045-146", "install_base": "1000"}]
+
+    def test_records(self, games_client: GamesClient) -> None:
+        """Test records are converted like dicts."""
+        schema = schema_for(games_client, FIELDS)
+        record_class = record_type("games", tuple(FIELDS))
+
+        batch = to_record_batch([record_class(make_result(1))], schema)
+
+        assert batch.equals(to_record_batch([make_result(1)], schema))
+
+
+class TestParquetSink:
+    """Tests for the ParquetSink class."""
+
+    def test_writes_row_groups_as_pages_arrive(
+        self, games_client: GamesClient, tmp_path: Path
+    ) -> None:
+        """Test pages are written once there are enough rows for a row group."""
+        where = tmp_path / "games.parquet"
+        schema = schema_for(games_client, FIELDS)
+
+        with ParquetSink(where, schema, row_group_size=2) as sink:
+            sink.write_page([make_result(1), make_result(2)])
+            sink.write_page([])
+            sink.write_page([make_result(3)])
+            assert sink._buffered_rows == 1
+
+        parquet_file = pyarrow.parquet.ParquetFile(str(where))
+        assert sink.rows_written == 3
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.schema_arrow == schema
+        assert parquet_file.read().column("id").to_pylist() == [1, 2, 3]
+
+    def test_no_results(self, games_client: GamesClient, tmp_path: Path) -> None:
+        """Test a file with no rows is still written with the schema."""
+        where = tmp_path / "games.parquet"
+        schema = schema_for(games_client, FIELDS)
+
+        with ParquetSink(where, schema):
+            pass
+
+        table = pyarrow.parquet.read_table(str(where))
+        assert table.num_rows == 0
+        assert table.schema == schema
+
+
+class TestExportSearch:
+    """Tests for the export_search function."""
+
+    def test_exports_every_page(
+        self, games_client: GamesClient, tmp_path: Path
+    ) -> None:
+        """Test every result of the search is written, a page at a time."""
+        where = tmp_path / "games.parquet"
+        results: List[Dict[str, Any]] = [make_result(id_) for id_ in range(25)]
+
+        with patch.object(
+            GamesClient, "iter_search", return_value=iter(results)
+        ) as iter_search:
+            rows_written = export_search(
+                games_client,
+                where,
+                {"name": "mario"},
+                FIELDS,
+                sort_by="id",
+                page_size=10,
+                workers=2,
+            )
+
+        iter_search.assert_called_once_with(
+            {"name": "mario"}, FIELDS, "id", True, page_size=10, workers=2
+        )
+        table = pyarrow.parquet.read_table(str(where))
+        assert rows_written == 25
+        assert table.column("id").to_pylist() == list(range(25))
+        assert pyarrow.parquet.ParquetFile(str(where)).num_row_groups == 1
@@ -1,9 +1,16 @@
 """Test the factory module."""
 import pytest
+from requests import Session
 
+from pybomb.async_factory import AsyncClientFactory
+from pybomb.cache import MemoryCache
 from pybomb.clients.games_client import GamesClient
+from pybomb.events import EventHooks
 from pybomb.exceptions import InvalidClientException
 from pybomb.factory import ClientFactory
+from pybomb.rate_limit import RateLimiter
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from pybomb.single_flight import SingleFlight
 
 
 class TestClientFactory:
@@ -24,3 +31,76 @@ class TestClientFactory:
         """Test an exception is raised when client not found."""
         with pytest.raises(InvalidClientException):
             ClientFactory("1234").build("invalid_client")
+
+    def test_clients_share_session(self) -> None:
+        """Test all clients built by a factory share the same session."""
+        factory = ClientFactory("1234")
+
+        games_client = factory.build("games")
+        platforms_client = factory.build("platforms")
+
+        assert games_client._session is factory.session
+        assert platforms_client._session is factory.session
+
+    def test_clients_share_cache(self) -> None:
+        """Test a supplied cache is shared by all clients."""
+        cache = MemoryCache()
+        factory = ClientFactory("1234", cache=cache)
+
+        assert factory.build("games")._cache is cache
+        assert factory.build("game")._cache is cache
+
+    def test_clients_share_rate_limiter(self) -> None:
+        """Test a supplied rate limiter is shared by all clients."""
+        rate_limiter = RateLimiter()
+        factory = ClientFactory("1234", rate_limiter=rate_limiter)
+
+        assert factory.build("games")._rate_limiter is rate_limiter
+        assert factory.build("platforms")._rate_limiter is rate_limiter
+
+    def test_clients_share_retries(self) -> None:
+        """Test a supplied retry policy and circuit breaker are shared."""
+        retry_policy = RetryPolicy()
+        circuit_breaker = CircuitBreaker()
+        factory = ClientFactory(
+            "1234", retry_policy=retry_policy, circuit_breaker=circuit_breaker
+        )
+
+        for client in (factory.build("games"), factory.build("game")):
+            assert client._retry_policy is retry_policy
+            assert client._circuit_breaker is circuit_breaker
+
+    def test_clients_share_events(self) -> None:
+        """Test supplied event hooks are shared by the built clients."""
+        events = EventHooks()
+        factory = ClientFactory("1234", events=events)
+
+        assert factory.build("games")._events is events
+        assert factory.build("game")._events is events
+
+    def test_clients_share_single_flight(self) -> None:
+        """Test a supplied single flight is shared by the built clients."""
+        single_flight = SingleFlight()
+        factory = ClientFactory("1234", single_flight=single_flight)
+
+        assert factory.build("games")._single_flight is single_flight
+        assert factory.build("game")._single_flight is single_flight
+
+    def test_clients_use_records(self) -> None:
+        """Test all clients return records if the factory uses them."""
+        factory = ClientFactory("1234", records=True)
+
+        assert factory.build("games")._records
+        assert factory.build("game")._records
+
+    def test_supplied_session(self) -> None:
+        """Test a supplied session is passed to the built clients."""
+        session = Session()
+        client = ClientFactory("1234", session=session).build("game")
+
+        assert client._session is session
+
+    def test_async_raise_on_invalid_client(self) -> None:
+        """Test an exception is raised when an async client is not found."""
+        with pytest.raises(InvalidClientException):
+            AsyncClientFactory("1234").build("invalid_client")
@@ -0,0 +1,166 @@
+"""Tests for the PyBomb fields module."""
+from typing import Any, Generator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from requests import Session
+
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.factory import ClientFactory
+from pybomb.fields import FieldProfile, FieldProfiler, NamedQuery, TrackedResult
+from .catalog import FakeCatalog
+
+
+@pytest.fixture
+def catalog() -> Generator[FakeCatalog, None, None]:
+    """A catalog of 5 games."""
+    catalog = FakeCatalog()
+    for id_ in range(1, 6):
+        catalog.add(
+            id_, "2020-01-01 00:00:00", deck=f"Deck {id_}", description="<p>Long</p>"
+        )
+
+    with patch.object(Session, "get", side_effect=catalog):
+        yield catalog
+
+
+@pytest.fixture
+def profiler() -> FieldProfiler:
+    """A profiler using the profile of a site after its first call."""
+    return FieldProfiler(warmup=1)
+
+
+def show(client: GameClient, id_: int) -> Tuple[Any, Any]:
+    """Fetch a game and read its name and deck, as a page showing it would."""
+    game = client.fetch(id_).results[0]
+
+    return game["name"], game.get("deck")
+
+
+def field_lists(catalog: FakeCatalog) -> List[Any]:
+    """Get the field list of each call made."""
+    return [call.get("field_list") for call in catalog.calls]
+
+
+def test_requests_fields_read(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test calls request only the fields read, once the site is profiled."""
+    client = GameClient("key", field_profiler=profiler)
+
+    shown = [show(client, id_) for id_ in (1, 2, 3)]
+
+    assert shown == [(f"Result {id_}", f"Deck {id_}") for id_ in (1, 2, 3)]
+    assert field_lists(catalog) == [None, "deck,id,name", "deck,id,name"]
+    assert profiler.refetches == 0
+    site = profiler.profiles()[0].site
+    assert profiler.profiles() == [FieldProfile("game", site, 3, ("deck", "name"), 0)]
+
+
+def test_refetches_missing_fields(
+    catalog: FakeCatalog, profiler: FieldProfiler
+) -> None:
+    """Test reading a field not requested refetches the result, once."""
+    client = GameClient("key", field_profiler=profiler)
+    games = []
+    for id_ in (1, 2, 3):
+        with NamedQuery("game_page"):
+            games.append(client.fetch(id_).results[0])
+        games[-1]["name"]
+
+    assert games[1]["description"] == "<p>Long</p>"
+    assert games[1]["date_last_updated"] == "2020-01-01 00:00:00"
+    assert field_lists(catalog) == [None, "id,name", "id,name", None]
+    assert profiler.refetches == 1
+
+    with NamedQuery("game_page"):
+        client.fetch(4)
+
+    assert field_lists(catalog)[-1] == "date_last_updated,description,id,name"
+
+
+def test_reading_every_field(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test iterating over a result reads every field."""
+    client = GameClient("key", field_profiler=profiler)
+    for id_ in (1, 2):
+        game = client.fetch(id_).results[0]
+        game["name"]
+
+    assert len(game) == 6
+    assert dict(game)["deck"] == "Deck 2"
+
+    client.fetch(3)
+
+    assert field_lists(catalog) == [None, "id,name", None, None]
+    assert profiler.profiles()[0].fields is None
+
+
+def test_unknown_fields(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test reading a field the resource does not return does not refetch."""
+    client = GameClient("key", field_profiler=profiler)
+    client.fetch(1).results[0]["name"]
+    game = client.fetch(2).results[0]
+
+    assert game.get("rating") is None
+    assert len(catalog.calls) == 2
+
+
+def test_NamedQuery(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test calls of a named query share a profile, whatever their site."""
+    client = GameClient("key", field_profiler=profiler)
+
+    with NamedQuery("game_page"):
+        show(client, 1)
+    with NamedQuery("game_page"):
+        show(client, 2)
+
+    assert field_lists(catalog) == [None, "deck,id,name"]
+    assert [profile.site for profile in profiler.profiles()] == ["game_page"]
+
+
+def test_return_fields(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test calls made with return fields are not profiled."""
+    client = GameClient("key", field_profiler=profiler)
+
+    response = client.fetch(1, ["name"])
+
+    assert response.result == {"name": "Result 1"}
+    assert not isinstance(response.result, TrackedResult)
+    assert profiler.profiles() == []
+
+
+def test_records(catalog: FakeCatalog, profiler: FieldProfiler) -> None:
+    """Test fields are read from records as attributes."""
+    client = GamesClient("key", records=True, field_profiler=profiler)
+    for _ in range(2):
+        game = client.search({}).results[0]
+        game.name
+
+    assert repr(game) == "GamesRecord(id=1, name='Result 1')"
+    assert game.deck == "Deck 1"
+    assert game.to_dict()["deck"] == "Deck 1"
+    assert field_lists(catalog) == [None, "id,name", None]
+    with pytest.raises(AttributeError):
+        game._missing
+
+
+def test_search_pages(catalog: FakeCatalog) -> None:
+    """Test the pages of a search fetched in the background share a profile."""
+    profiler = FieldProfiler()
+    client = GamesClient("key", field_profiler=profiler)
+
+    for _ in range(2):
+        names = [
+            game["name"] for game in client.iter_search({}, page_size=2, workers=2)
+        ]
+
+    assert names == [f"Result {id_}" for id_ in range(1, 6)]
+    assert field_lists(catalog) == [None] * 3 + ["id,name"] * 3
+    assert len(profiler.profiles()) == 1
+
+
+def test_factory(profiler: FieldProfiler) -> None:
+    """Test a profiler is shared by the clients built by a factory."""
+    factory = ClientFactory("key", field_profiler=profiler)
+
+    assert factory.build("games")._field_profiler is profiler
+    assert factory.build("game")._field_profiler is profiler
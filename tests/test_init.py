@@ -0,0 +1,48 @@
+"""Tests for the PyBomb package."""
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+import pybomb
+from pybomb.clients.games_client import GamesClient
+from pybomb.factory import ClientFactory
+from pybomb.version import get_version
+
+
+def test_import_is_lazy() -> None:
+    """Test importing PyBomb does not import the clients or HTTP libraries."""
+    code = (
+        "import sys, pybomb; "
+        "print([name for name in ('requests', 'aiohttp', 'pybomb.factory') "
+        "if name in sys.modules])"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])  # noqa: S603
+
+    assert output.strip() == b"[]"
+
+
+def test_sync_clients_do_not_import_aiohttp() -> None:
+    """Test the sync clients and factory can be used without importing aiohttp."""
+    code = (
+        "import sys, pybomb; "
+        "pybomb.GamesClient('key'); pybomb.ClientFactory('key').build('game'); "
+        "print('aiohttp' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])  # noqa: S603
+
+    assert output.strip() == b"False"
+
+
+def test_lazy_attributes() -> None:
+    """Test clients, factories and the version are imported on first access."""
+    assert pybomb.GamesClient is GamesClient
+    assert pybomb.ClientFactory is ClientFactory
+    assert pybomb.__version__ == get_version()
+    assert "GamesClient" in dir(pybomb)
+
+
+def test_missing_attribute() -> None:
+    """Test accessing an unknown attribute raises an AttributeError."""
+    with pytest.raises(AttributeError):
+        pybomb.MissingClient
@@ -0,0 +1,197 @@
+"""Tests for the PyBomb local module."""
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+from unittest.mock import patch
+
+import pytest
+from requests import Session
+
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.factory import ClientFactory
+from pybomb.local import LocalCatalog
+from pybomb.records import Record
+from pybomb.store import SyncStore
+from pybomb.sync import SyncEngine
+from .catalog import FakeCatalog
+from .conftest import FakeClock
+
+
+@pytest.fixture
+def catalog() -> Generator[FakeCatalog, None, None]:
+    """A catalog of games on two platforms."""
+    catalog = FakeCatalog()
+    for id_, name, platforms in (
+        (1, "Super Mario", [1, 2]),
+        (2, "Mario Kart", [2]),
+        (3, "Zelda", []),
+        (4, "Metroid", [1]),
+    ):
+        catalog.add(
+            id_,
+            f"2020-01-0{id_} 00:00:00",
+            name=name,
+            platforms=[{"id": platform} for platform in platforms],
+        )
+
+    with patch.object(Session, "get", side_effect=catalog):
+        yield catalog
+
+
+@pytest.fixture
+def store(
+    tmp_path: Path, catalog: FakeCatalog, clock: FakeClock
+) -> Generator[SyncStore, None, None]:
+    """A store of every game in the catalog."""
+    store = SyncStore(str(tmp_path / "mirror.db"))
+    SyncEngine(store, clock=clock).sync(GamesClient("key"))
+    catalog.calls.clear()
+
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def local(store: SyncStore, clock: FakeClock) -> LocalCatalog:
+    """A local catalog of the store."""
+    return LocalCatalog(store, max_age=60, clock=clock)
+
+
+@pytest.mark.parametrize(
+    "filter_by, return_fields, sort_by, desc, limit, offset",
+    (
+        ({"name": "mario"}, None, "name", True, None, None),
+        ({"platforms": 2}, ["id", "name"], None, True, 1, 1),
+        ({"date_last_updated": "2020-01-02 00:00:00|2020-01-03 00:00:00"},)
+        + (None, "date_last_updated", False, None, None),
+        ({"id": "1|3", "name": "o"}, ["name"], "id", True, 10, None),
+        ({}, None, None, True, None, 3),
+    ),
+)
+def test_identical_responses(
+    catalog: FakeCatalog,
+    local: LocalCatalog,
+    filter_by: Dict[str, Any],
+    return_fields: Optional[List[str]],
+    sort_by: Optional[str],
+    desc: bool,
+    limit: Optional[int],
+    offset: Optional[int],
+) -> None:
+    """Test searches are answered with the response the GB API gives."""
+    args = (filter_by, return_fields, sort_by, desc, limit, offset)
+
+    live_response = GamesClient("key").search(*args)
+    local_response = GamesClient("key", catalog=local).search(*args)
+
+    assert local_response == live_response
+    assert len(catalog.calls) == 1
+    assert local.hits == 1
+
+
+def test_prepared_searches(catalog: FakeCatalog, local: LocalCatalog) -> None:
+    """Test every page of a prepared search is answered locally."""
+    client = GamesClient("key", catalog=local)
+
+    names = [game["name"] for game in client.iter_search({}, ["name"], page_size=3)]
+
+    assert names == ["Super Mario", "Mario Kart", "Zelda", "Metroid"]
+    assert catalog.calls == []
+
+
+def test_records(catalog: FakeCatalog, local: LocalCatalog) -> None:
+    """Test local results are returned as records if the client uses them."""
+    response = GamesClient("key", catalog=local, records=True).quick_search("zelda")
+
+    assert isinstance(response.results[0], Record)
+    assert response.results[0].name == "Zelda"
+
+
+@pytest.mark.parametrize(
+    "search",
+    (
+        {"filter_by": {"aliases": "mario"}},
+        {"filter_by": {"platforms": "ps4"}},
+    ),
+)
+def test_unsupported_searches(
+    catalog: FakeCatalog, local: LocalCatalog, search: Dict[str, Any]
+) -> None:
+    """Test searches the store cannot answer are sent to the GB API."""
+    GamesClient("key", catalog=local).search(**search)
+
+    assert len(catalog.calls) == 1
+    assert local.misses == 1
+
+
+def test_unsupported_params(local: LocalCatalog) -> None:
+    """Test calls with params the catalog does not know are misses."""
+    assert local.search("games", "uri", {"format": "xml"}) is None
+    assert local.search("games", "uri", {"resources": "game"}) is None
+
+
+def test_stale(catalog: FakeCatalog, local: LocalCatalog, clock: FakeClock) -> None:
+    """Test searches of a resource not synced within the max age are sent."""
+    client = GamesClient("key", catalog=local)
+
+    clock.now += 60
+    client.search({"name": "mario"})
+    clock.now += 1
+    client.search({"name": "mario"})
+
+    assert len(catalog.calls) == 1
+    assert local.hits == 1
+    assert local.misses == 1
+
+
+def test_not_synced(catalog: FakeCatalog, local: LocalCatalog) -> None:
+    """Test searches of a resource never fully synced are sent."""
+    PlatformsClient("key", catalog=local).search({"name": "mario"})
+
+    assert len(catalog.calls) == 1
+
+
+def test_fetch_skips_catalog(catalog: FakeCatalog, local: LocalCatalog) -> None:
+    """Test fetches are sent without being counted as misses of the catalog."""
+    GameClient("key", catalog=local).fetch(1)
+
+    assert len(catalog.calls) == 1
+    assert local.misses == 0
+
+
+def test_sync_bypasses_catalog(
+    catalog: FakeCatalog, store: SyncStore, local: LocalCatalog, clock: FakeClock
+) -> None:
+    """Test syncing with a client using the catalog still calls the GB API."""
+    client = GamesClient("key", catalog=local)
+    catalog.add(10, "2020-02-01 00:00:00")
+
+    result = SyncEngine(store, clock=clock).sync(client)
+
+    assert result.fetched == 1
+    assert store.get("games", 10) is not None
+    assert len(catalog.calls) == 1
+
+
+def test_stored_fields(tmp_path: Path, catalog: FakeCatalog, clock: FakeClock) -> None:
+    """Test searches using fields not stored by the sync are sent."""
+    store = SyncStore(str(tmp_path / "names.db"))
+    SyncEngine(store, clock=clock).sync(GamesClient("key"), ["name"])
+    catalog.calls.clear()
+    client = GamesClient("key", catalog=LocalCatalog(store, clock=clock))
+
+    client.search({"name": "mario"}, ["name"], sort_by="date_last_updated")
+    client.search({"name": "mario"})
+    client.search({"platforms": 1}, ["name"])
+    store.close()
+
+    assert len(catalog.calls) == 2
+
+
+def test_factory(local: LocalCatalog) -> None:
+    """Test a catalog is shared by the clients built by a factory."""
+    factory = ClientFactory("key", catalog=local)
+
+    assert factory.build("games")._catalog is local
+    assert factory.build("game")._catalog is local
@@ -0,0 +1,49 @@
+"""Tests for the PyBomb plan module."""
+from typing import Dict, Optional, Union
+
+import pytest
+
+from pybomb.cache import Cache
+from pybomb.exceptions import InvalidFilterFieldException
+from pybomb.plan import SearchPlan
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"limit": 10},
+        {"field_list": "id,name", "sort": "name:asc", "limit": 100},
+        {"sort": "id:desc"},
+    ],
+)
+@pytest.mark.parametrize("offset", [None, 0, 200])
+def test_cache_key(params: Dict[str, Union[str, int]], offset: Optional[int]) -> None:
+    """Test plans create the same cache keys as the cache would."""
+    plan = SearchPlan.compile("games", params, "platforms:146", ("name",), "json")
+
+    bound_params = plan.bind({"name": "mario"}, offset)
+
+    assert plan.cache_key(bound_params) == Cache.make_key(
+        "games", {**bound_params, "api_key": "key", "format": "json"}
+    )
+
+
+def test_bind() -> None:
+    """Test only the bound values with a value are added to the filter."""
+    plan = SearchPlan.compile("games", {"limit": 10}, "", ("name", "platforms"), "json")
+
+    assert plan.bind({"platforms": 146}) == {"limit": 10, "filter": "platforms:146"}
+    assert plan.bind({"name": "a", "platforms": None}, 5) == {
+        "limit": 10,
+        "filter": "name:a",
+        "offset": 5,
+    }
+
+
+def test_bind_unknown_field() -> None:
+    """Test values can only be given for bound fields."""
+    plan = SearchPlan.compile("games", {}, "", ("name",), "json")
+
+    with pytest.raises(InvalidFilterFieldException):
+        plan.bind({"platforms": 146})
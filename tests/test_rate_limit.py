@@ -0,0 +1,72 @@
+"""Tests for the PyBomb rate_limit module."""
+import asyncio
+
+from pybomb.rate_limit import RateLimiter
+from .conftest import FakeClock
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter."""
+
+    def test_paces_calls_evenly(self, clock: FakeClock) -> None:
+        """Test calls to a resource are spread evenly over the hour."""
+        limiter = RateLimiter(requests_per_hour=360, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire("games")
+
+        assert clock.sleeps == [10.0, 10.0, 10.0]
+        assert limiter.wait_time == 30.0
+
+    def test_never_exceeds_quota(self, clock: FakeClock) -> None:
+        """Test no more than the quota of calls are made in any hour."""
+        limiter = RateLimiter(requests_per_hour=200, clock=clock, sleep=clock.sleep)
+
+        call_times = []
+        for _ in range(1000):
+            limiter.acquire("games")
+            call_times.append(clock.now)
+
+        for index, call_time in enumerate(call_times[200:], 200):
+            assert call_time - call_times[index - 200] >= 3600
+
+    def test_resources_are_limited_separately(self, clock: FakeClock) -> None:
+        """Test each resource has its own quota."""
+        limiter = RateLimiter(
+            requests_per_hour=360,
+            resource_limits={"game": 3600},
+            clock=clock,
+            sleep=clock.sleep,
+        )
+
+        assert limiter.reserve("games") == 0
+        assert limiter.reserve("game") == 0
+        assert limiter.reserve("game") == 1
+        assert limiter.reserve("games") == 10
+
+    def test_idle_time_is_not_banked(self, clock: FakeClock) -> None:
+        """Test an idle resource does not build up a burst of calls."""
+        limiter = RateLimiter(requests_per_hour=360, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire("games")
+        clock.now = 100
+        limiter.acquire("games")
+        limiter.acquire("games")
+
+        assert clock.sleeps == [10.0]
+
+    def test_acquire_async(self) -> None:
+        """Test the async acquire waits for the reserved slot."""
+        limiter = RateLimiter(requests_per_hour=360000)
+
+        async def acquire() -> None:
+            await limiter.acquire_async("games")
+            await limiter.acquire_async("games")
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(acquire())
+        finally:
+            loop.close()
+
+        assert limiter.wait_time > 0
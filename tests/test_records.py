@@ -0,0 +1,136 @@
+"""Tests for the PyBomb records module."""
+import pickle  # noqa: S403
+import sys
+from typing import Any, Iterable
+
+import pytest
+
+from pybomb.records import record_type, to_records
+from pybomb.response import Response
+
+FIELDS = ("id", "name", "platforms", "image")
+
+
+@pytest.fixture
+def result() -> dict:
+    """A result of a games search."""
+    return {
+        "id": 1,
+        "name": "Game 1",
+        "platforms": [{"id": 146, "name": "PlayStation 4"}],
+        "image": {"original_url": "https://giantbomb.com/1.jpg"},
+    }
+
+
+def container_size(value: Any) -> int:
+    """Get the size of a value and the lists and dicts nested in it."""
+    nested: Iterable[Any]
+    if isinstance(value, dict):
+        nested = value.values()
+    elif isinstance(value, list):
+        nested = value
+    else:
+        return 0
+
+    return sys.getsizeof(value) + sum(container_size(item) for item in nested)
+
+
+class TestRecord:
+    """Tests for the generated records."""
+
+    def test_record_type_is_cached(self) -> None:
+        """Test one class is generated per resource and fields."""
+        record_class = record_type("games", FIELDS)
+
+        assert record_class is record_type("games", FIELDS)
+        assert record_class is not record_type("games", ("id",))
+        assert record_class.__name__ == "GamesRecord"
+        assert record_class.FIELDS == FIELDS
+        for field in FIELDS:
+            assert getattr(record_class, field) is record_class.__dict__[field]
+
+    def test_fields(self, result: dict) -> None:
+        """Test fields can be read as attributes and keys."""
+        record = record_type("games", FIELDS)(result)
+
+        assert record.id == 1
+        assert record["name"] == "Game 1"
+        assert record.platforms == [{"id": 146, "name": "PlayStation 4"}]
+        assert record.image["original_url"] == "https://giantbomb.com/1.jpg"
+        assert record == result
+        assert record.to_dict() == result
+        assert list(record) == list(FIELDS)
+        assert len(record) == 4
+
+    def test_no_instance_dict(self, result: dict) -> None:
+        """Test records hold their fields in slots, not a dict."""
+        record = record_type("games", FIELDS)(result)
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.missing = 1  # type: ignore
+
+    def test_nested_values_decoded_on_access(self, result: dict) -> None:
+        """Test nested values are held encoded until first accessed."""
+        record = record_type("games", FIELDS)(result)
+
+        assert isinstance(record._platforms, bytes)
+        platforms = record.platforms
+        assert not isinstance(record._platforms, bytes)
+        assert record.platforms is platforms
+        assert isinstance(record._image, bytes)
+
+    def test_smaller_than_dict(self, result: dict) -> None:
+        """Test a record is smaller than the result dict it replaces."""
+        record = record_type("games", FIELDS)(result)
+        record_size = (
+            sys.getsizeof(record)
+            + sys.getsizeof(record._platforms)
+            + sys.getsizeof(record._image)
+        )
+
+        assert record_size < container_size(result) / 2
+
+    def test_missing_and_extra_fields(self) -> None:
+        """Test missing fields are None, and unknown fields are kept."""
+        record = record_type("games", FIELDS)({"id": 1, "guid": "3030-1"})
+
+        assert record.name is None
+        assert record.extra == {"guid": "3030-1"}
+        assert record["guid"] == "3030-1"
+        assert "guid" in record
+        assert len(record) == 5
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_repr(self) -> None:
+        """Test records are represented with their fields."""
+        record = record_type("games", ("id", "name"))({"id": 1, "name": "Game"})
+
+        assert repr(record) == "GamesRecord(id=1, name='Game')"
+
+    def test_pickle(self, result: dict) -> None:
+        """Test records can be pickled, keeping nested values encoded."""
+        result["guid"] = "3030-1"
+        record = record_type("games", FIELDS)(result)
+
+        unpickled = pickle.loads(pickle.dumps(record))  # noqa: S301
+
+        assert type(unpickled) is type(record)
+        assert isinstance(unpickled._platforms, bytes)
+        assert unpickled == record
+
+
+def test_to_records(result: dict) -> None:
+    """Test the results of a response are converted to records."""
+    record_class = record_type("game", FIELDS)
+    search_response = Response("uri", 1, 1, [result], None)
+    fetch_response = Response("uri", 1, 1, [result], result)
+
+    search_records = to_records(search_response, record_class)
+    fetch_records = to_records(fetch_response, record_class)
+
+    assert isinstance(search_records.results[0], record_class)
+    assert search_records.result is None
+    assert fetch_records.result is fetch_records.results[0]
+    assert fetch_records.uri == "uri"
@@ -0,0 +1,108 @@
+"""Tests for the PyBomb retry module."""
+import pytest
+
+from pybomb.exceptions import CircuitOpenException
+from pybomb.retry import CircuitBreaker, RetryPolicy
+from .conftest import FakeClock
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy."""
+
+    def test_retryable_statuses(self) -> None:
+        """Test only throttled and server errors are retried by default."""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable_status(429)
+        assert policy.is_retryable_status(503)
+        assert not policy.is_retryable_status(200)
+        assert not policy.is_retryable_status(404)
+
+    def test_backoff_doubles_and_is_capped(self) -> None:
+        """Test the backoff doubles with each retry, up to the max."""
+        policy = RetryPolicy(
+            max_retries=5, backoff_factor=1, max_backoff=5, rand=lambda: 1.0
+        )
+
+        delays = [policy.delay_for(attempt) for attempt in range(5)]
+
+        assert delays == [1, 2, 4, 5, 5]
+        assert policy.retries == 5
+        assert policy.wait_time == 17
+
+    def test_full_jitter(self) -> None:
+        """Test the backoff is scaled by the random jitter."""
+        policy = RetryPolicy(backoff_factor=2, rand=lambda: 0.25)
+
+        assert policy.delay_for(1) == 1
+
+    def test_max_retries(self) -> None:
+        """Test calls are not retried once the max retries are made."""
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.delay_for(2) is None
+        assert policy.retries == 0
+
+    def test_retry_after(self) -> None:
+        """Test a Retry-After in seconds sets the min delay, up to the max."""
+        policy = RetryPolicy(max_backoff=10, rand=lambda: 0.0)
+
+        assert policy.delay_for(0, "3") == 3
+        assert policy.delay_for(0, "60") == 10
+        assert policy.delay_for(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Test the circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure("games")
+        breaker.before_call("games")
+        breaker.record_failure("games")
+
+        assert breaker.is_open("games")
+        assert breaker.trips == 1
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call("games")
+
+    def test_success_resets_failures(self) -> None:
+        """Test a success resets the count of consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure("games")
+        breaker.record_success("games")
+        breaker.record_failure("games")
+
+        assert not breaker.is_open("games")
+
+    def test_resources_are_separate(self) -> None:
+        """Test each resource has its own circuit."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        breaker.record_failure("games")
+
+        assert breaker.is_open("games")
+        breaker.before_call("game")
+
+    def test_trial_call_after_timeout(self, clock: FakeClock) -> None:
+        """Test a single trial call is let through after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure("games")
+
+        clock.now = 30
+        breaker.before_call("games")
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call("games")
+
+        breaker.record_failure("games")
+        assert breaker.is_open("games")
+        assert breaker.trips == 1
+
+        clock.now = 60
+        breaker.before_call("games")
+        breaker.record_success("games")
+        assert not breaker.is_open("games")
+        breaker.before_call("games")
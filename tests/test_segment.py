@@ -0,0 +1,136 @@
+"""Tests for the PyBomb segment module."""
+import json
+from pathlib import Path
+from typing import Any, Dict, Generator
+from unittest.mock import patch
+
+import pytest
+from requests import Session
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.records import record_type
+from pybomb.segment import archive_search, SegmentStore
+from .catalog import FakeCatalog
+
+
+def game(id_: int, **fields: Any) -> Dict[str, Any]:
+    """Create a game."""
+    return {"id": id_, "name": f"Pokémon {id_}", "platforms": [{"id": 146}], **fields}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SegmentStore, None, None]:
+    """A store in a temporary directory."""
+    with SegmentStore(tmp_path / "archive") as store:
+        yield store
+
+
+def test_append_page(store: SegmentStore) -> None:
+    """Test appended results are looked up by ID."""
+    appended = store.append_page("games", [game(1), game(2), game(3)])
+
+    assert appended == 3
+    assert store.get("games", 2) == game(2)
+    assert store.get("games", 4) is None
+    assert store.get("platforms", 2) is None
+    assert store.get_many("games", [3, 4, 1]) == {3: game(3), 1: game(1)}
+    assert store.count("games") == 3
+    assert store.ids("games") == [1, 2, 3]
+
+
+def test_get_raw(store: SegmentStore) -> None:
+    """Test the JSON of a result is viewed in place."""
+    store.append_page("games", [game(1)])
+
+    raw = store.get_raw("games", 1)
+
+    assert isinstance(raw, memoryview)
+    assert json.loads(raw.tobytes()) == game(1)
+    assert store.get_raw("games", 2) is None
+    raw.release()
+
+
+def test_records(store: SegmentStore) -> None:
+    """Test records are stored as dicts."""
+    record_class = record_type("games", ("id", "name", "platforms"))
+
+    store.append_page("games", [record_class(game(1))])
+
+    assert store.get("games", 1) == game(1)
+
+
+def test_supersede(store: SegmentStore) -> None:
+    """Test appending a result again supersedes it."""
+    store.append_page("games", [game(1), game(2)])
+    assert store.get("games", 1) == game(1)
+
+    store.append_page("games", [game(1, deck="New")])
+
+    assert store.get("games", 1) == game(1, deck="New")
+    assert list(store.iter_results("games")) == [game(2), game(1, deck="New")]
+    assert store.count("games") == 2
+
+
+def test_iter_results_empty(store: SegmentStore) -> None:
+    """Test a resource without results has none to iterate over."""
+    assert list(store.iter_results("games")) == []
+    assert store.count("games") == 0
+
+
+def test_reopen(tmp_path: Path) -> None:
+    """Test results are kept between opens, and appended to."""
+    with SegmentStore(tmp_path) as store:
+        store.append_page("games", [game(1)])
+        store.get("games", 1)
+
+    with SegmentStore(tmp_path) as store:
+        store.append_page("games", [game(2)])
+
+        assert list(store.iter_results("games")) == [game(1), game(2)]
+
+
+def test_partial_write(tmp_path: Path) -> None:
+    """Test results only partly written are dropped on opening the store."""
+    with SegmentStore(tmp_path) as store:
+        store.append_page("games", [game(1), game(2)])
+    segment, index = tmp_path / "games.seg", tmp_path / "games.idx"
+    complete = index.read_bytes()
+    with segment.open("ab") as file:
+        file.write(b'\x03\x00\x00\x00\x00\x00\x00\x00{"id"')
+    with index.open("ab") as file:
+        file.write(complete[-20:-6])
+
+    with SegmentStore(tmp_path) as store:
+        assert list(store.iter_results("games")) == [game(1), game(2)]
+        store.append_page("games", [game(3)])
+
+    with SegmentStore(tmp_path) as store:
+        assert list(store.iter_results("games")) == [game(1), game(2), game(3)]
+
+
+def test_index_past_segment(tmp_path: Path) -> None:
+    """Test index entries past the end of the segment are dropped."""
+    with SegmentStore(tmp_path) as store:
+        store.append_page("games", [game(1), game(2)])
+    segment = tmp_path / "games.seg"
+    segment.write_bytes(segment.read_bytes()[:-1])
+
+    with SegmentStore(tmp_path) as store:
+        assert store.ids("games") == [1]
+        assert (tmp_path / "games.idx").stat().st_size == 20
+
+
+def test_archive_search(store: SegmentStore) -> None:
+    """Test every page of a search is appended."""
+    catalog = FakeCatalog()
+    for id_ in range(1, 6):
+        catalog.add(id_, "2020-01-01 00:00:00", deck=f"Deck {id_}")
+
+    with patch.object(Session, "get", side_effect=catalog):
+        appended = archive_search(GamesClient("key"), store, {}, ["deck"], page_size=2)
+        archive_search(GamesClient("key"), store, {"id": 1})
+
+    assert appended == 5
+    assert store.get("games", 3) == {"id": 3, "deck": "Deck 3"}
+    assert store.get("games", 1) == catalog.results[0]
+    assert catalog.calls[0]["field_list"] == "id,deck"
@@ -0,0 +1,32 @@
+"""Tests for the PyBomb session module."""
+from requests.adapters import HTTPAdapter
+
+from pybomb.session import create_session
+
+
+class TestCreateSession:
+    """Tests for create_session."""
+
+    def test_pool_size(self) -> None:
+        """Test the connection pool is configured for both schemes."""
+        session = create_session(pool_connections=2, pool_maxsize=20)
+
+        for scheme in ("http://", "https://"):
+            adapter = session.get_adapter(f"{scheme}www.giantbomb.com")
+            assert isinstance(adapter, HTTPAdapter)
+            assert vars(adapter)["_pool_connections"] == 2
+            assert vars(adapter)["_pool_maxsize"] == 20
+
+    def test_defaults(self) -> None:
+        """Test connections are kept alive and gzip is requested by default."""
+        session = create_session()
+
+        assert session.headers["Connection"] == "keep-alive"
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_disable_keep_alive_and_gzip(self) -> None:
+        """Test keep-alive and compression can be turned off."""
+        session = create_session(keep_alive=False, gzip=False)
+
+        assert session.headers["Connection"] == "close"
+        assert session.headers["Accept-Encoding"] == "identity"
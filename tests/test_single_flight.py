@@ -0,0 +1,143 @@
+"""Tests for the PyBomb single_flight module."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, List, Tuple
+
+import pytest
+
+from pybomb.single_flight import SingleFlight
+
+
+def run(coroutine: Coroutine) -> Any:
+    """Run a coroutine to completion on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestThreads:
+    """Tests for coalescing calls made by threads."""
+
+    def test_coalesces_calls_in_flight(self) -> None:
+        """Test callers arriving during a call wait for its result."""
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def call() -> List[int]:
+            calls.append(1)
+            release.wait(5)
+            return calls
+
+        with ThreadPoolExecutor(3) as executor:
+            futures = [executor.submit(single_flight.do, "key", call) for _ in range(3)]
+            while single_flight.saved < 2:
+                pass
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert calls == [1]
+        assert all(result is calls for result, _ in results)
+        assert sorted(shared for _, shared in results) == [False, True, True]
+
+    def test_shares_errors(self) -> None:
+        """Test callers waiting for a failed call are raised its error."""
+        single_flight = SingleFlight()
+        release = threading.Event()
+        error = ValueError("bad")
+
+        def call() -> None:
+            release.wait(5)
+            raise error
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(single_flight.do, "key", call) for _ in range(2)]
+            while single_flight.saved < 1:
+                pass
+            release.set()
+
+        assert all(future.exception() is error for future in futures)
+
+    def test_calls_after_end(self) -> None:
+        """Test calls made after a call ends, or with other keys, are made."""
+        single_flight = SingleFlight()
+
+        assert single_flight.do("key", lambda: 1) == (1, False)
+        assert single_flight.do("key", lambda: 2) == (2, False)
+        assert single_flight.do("other", lambda: 3) == (3, False)
+        assert single_flight.saved == 0
+
+
+class TestAsyncio:
+    """Tests for coalescing calls made by asyncio tasks."""
+
+    def test_coalesces_calls_in_flight(self) -> None:
+        """Test tasks arriving during a call wait for its result."""
+        single_flight = SingleFlight()
+        calls: List[int] = []
+
+        async def call() -> List[int]:
+            calls.append(1)
+            await asyncio.sleep(0)
+            return calls
+
+        async def gather() -> List[Tuple[List[int], bool]]:
+            return await asyncio.gather(
+                *(single_flight.do_async("key", call) for _ in range(3))
+            )
+
+        results = run(gather())
+
+        assert calls == [1]
+        assert all(result is calls for result, _ in results)
+        assert [shared for _, shared in results] == [False, True, True]
+        assert single_flight.saved == 2
+        assert run(single_flight.do_async("key", call)) == ([1, 1], False)
+
+    def test_shares_errors(self) -> None:
+        """Test tasks waiting for a failed call are raised its error."""
+        single_flight = SingleFlight()
+        error = ValueError("bad")
+
+        async def call() -> None:
+            await asyncio.sleep(0)
+            raise error
+
+        async def gather() -> List[Any]:
+            return await asyncio.gather(
+                *(single_flight.do_async("key", call) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        assert run(gather()) == [error, error]
+
+    def test_cancelled_call(self) -> None:
+        """Test tasks waiting for a cancelled call are cancelled."""
+        single_flight = SingleFlight()
+
+        async def call() -> None:
+            await asyncio.sleep(5)
+
+        async def cancel() -> List[Any]:
+            leader = asyncio.ensure_future(single_flight.do_async("key", call))
+            waiter = asyncio.ensure_future(single_flight.do_async("key", call))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return list(await asyncio.gather(leader, waiter, return_exceptions=True))
+
+        results = run(cancel())
+
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+    def test_error_without_waiters(self) -> None:
+        """Test a failed call without waiters raises its error."""
+        single_flight = SingleFlight()
+
+        async def call() -> None:
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            run(single_flight.do_async("key", call))
@@ -0,0 +1,235 @@
+"""Tests for the PyBomb store module."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+
+import pytest
+
+from pybomb.store import SyncCursor, SyncStatus, SyncStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SyncStore, None, None]:
+    """An empty store."""
+    store = SyncStore(str(tmp_path / "mirror.db"))
+    yield store
+    store.close()
+
+
+class TestSyncCursor:
+    """Tests for the SyncCursor class."""
+
+    def test_advance(self) -> None:
+        """Test the cursor holds the IDs of the results at the watermark."""
+        cursor = SyncCursor("2020-01-01", frozenset({1}))
+
+        assert cursor.advance(
+            [{"id": 2, "date_last_updated": "2020-01-01"}]
+        ) == SyncCursor("2020-01-01", frozenset({1, 2}))
+        assert cursor.advance(
+            [
+                {"id": 2, "date_last_updated": "2020-01-02"},
+                {"id": 3, "date_last_updated": "2020-01-02"},
+            ]
+        ) == SyncCursor("2020-01-02", frozenset({2, 3}))
+        assert cursor.advance([]) == cursor
+
+    def test_is_stored(self) -> None:
+        """Test results at the watermark are stored, unless updated since."""
+        cursor = SyncCursor("2020-01-01", frozenset({1}))
+
+        assert cursor.is_stored({"id": 1, "date_last_updated": "2020-01-01"})
+        assert not cursor.is_stored({"id": 1, "date_last_updated": "2020-01-02"})
+        assert not cursor.is_stored({"id": 2, "date_last_updated": "2020-01-01"})
+
+
+class TestSyncStore:
+    """Tests for the SyncStore class."""
+
+    def test_upserts_results(self, store: SyncStore) -> None:
+        """Test results are upserted along with the cursor."""
+        store.save_page(
+            "games", [{"id": 2}, {"id": 1}], SyncCursor("a", frozenset({2}))
+        )
+        store.save_page(
+            "games", [{"id": 1, "name": "New"}], SyncCursor("b", frozenset({1}))
+        )
+
+        assert store.count("games") == 2
+        assert store.get("games", 1) == {"id": 1, "name": "New"}
+        assert store.get("games", 3) is None
+        assert list(store.iter_results("games")) == [
+            {"id": 1, "name": "New"},
+            {"id": 2},
+        ]
+        assert store.cursor("games") == SyncCursor("b", frozenset({1}))
+        assert store.cursor("platforms") == SyncCursor()
+
+    def test_reset(self, store: SyncStore) -> None:
+        """Test a reset removes the results and cursor of the resource only."""
+        store.save_page("games", [{"id": 1}], SyncCursor("a", frozenset({1})))
+        store.save_page("platforms", [{"id": 1}], SyncCursor("a", frozenset({1})))
+
+        store.reset("games")
+
+        assert store.count("games") == 0
+        assert store.cursor("games") == SyncCursor()
+        assert store.count("platforms") == 1
+
+    def test_shared_file(self, store: SyncStore) -> None:
+        """Test stores opened on the same file share results."""
+        store.save_page("games", [{"id": 1}], SyncCursor("a", frozenset({1})))
+
+        other = SyncStore(store.path)
+        assert other.count("games") == 1
+        other.close()
+
+    def test_close(self, store: SyncStore) -> None:
+        """Test each thread has a connection, reopened after it is closed."""
+        store.save_page("games", [{"id": 1}], SyncCursor("a", frozenset({1})))
+        store.close()
+        store.close()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(store.count, "games").result() == 1
+            executor.submit(store.close).result()
+
+        assert store.count("games") == 1
+
+    def test_status(self, store: SyncStore) -> None:
+        """Test the last complete sync is recorded with the stored fields."""
+        store.save_page("games", [{"id": 1}], SyncCursor("a", frozenset({1})))
+        assert store.status("games") is None
+
+        store.mark_synced("games", ["id", "name"], 100.0)
+        store.mark_synced("platforms", None, 200.0)
+        store.save_page("games", [{"id": 2}], SyncCursor("b", frozenset({2})))
+
+        assert store.status("games") == SyncStatus(100.0, ("id", "name"))
+        assert store.status("platforms") == SyncStatus(200.0, None)
+
+
+class TestSearch:
+    """Tests for searching the stored results."""
+
+    @pytest.fixture
+    def store(self, store: SyncStore) -> SyncStore:
+        """A store of games and platforms."""
+        store.save_page(
+            "games",
+            [
+                {
+                    "id": 1,
+                    "name": "Super Mario",
+                    "date_added": "2020-01-03 00:00:00",
+                    "date_last_updated": "2020-01-01 00:00:00",
+                    "platforms": [{"id": 1}, {"id": 2}],
+                },
+                {
+                    "id": 2,
+                    "name": "Mario Kart",
+                    "date_added": "2020-01-02 00:00:00",
+                    "date_last_updated": "2020-01-02 00:00:00",
+                    "platforms": [{"id": 2}],
+                },
+                {
+                    "id": 3,
+                    "name": "100% Zelda",
+                    "date_added": "2020-01-01 00:00:00",
+                    "date_last_updated": "2020-01-03 00:00:00",
+                    "platforms": [],
+                },
+            ],
+            SyncCursor("2020-01-03 00:00:00", frozenset({3})),
+        )
+        store.save_page(
+            "platforms",
+            [{"id": 1, "company": {"id": 5}}],
+            SyncCursor("a", frozenset({1})),
+        )
+
+        return store
+
+    def ids(self, results: List[Dict[str, Any]]) -> List[int]:
+        """Get the IDs of the results."""
+        return [result["id"] for result in results]
+
+    @pytest.mark.parametrize(
+        "field, value, ids",
+        (
+            ("name", "MARIO", [1, 2]),
+            ("name", "0%", [3]),
+            ("name", "%", [3]),
+            ("name", "_", []),
+            ("id", "1|3", [1, 3]),
+            ("platforms", "2", [1, 2]),
+            ("platforms", "1|3", [1]),
+            ("date_last_updated", "2020-01-02 00:00:00|2020-01-03 00:00:00", [2, 3]),
+            ("date_last_updated", "2020-01-01 00:00:00", [1]),
+            ("date_added", "2020-01-02 00:00:00|2020-01-05 00:00:00", [1, 2]),
+        ),
+    )
+    def test_filters(
+        self, store: SyncStore, field: str, value: str, ids: List[int]
+    ) -> None:
+        """Test each kind of filter matches as the GB API does."""
+        total, results = store.search("games", [(field, value)])
+
+        assert total == len(ids)
+        assert self.ids(results) == ids
+
+    def test_filters_combined(self, store: SyncStore) -> None:
+        """Test results must match every filter."""
+        total, results = store.search("games", [("name", "mario"), ("platforms", "1")])
+
+        assert self.ids(results) == [1]
+
+    def test_single_reference(self, store: SyncStore) -> None:
+        """Test results can be filtered by a single reference."""
+        assert store.search("platforms", [("company", "5")])[0] == 1
+        assert store.search("platforms", [("company", "6")])[0] == 0
+
+    def test_sort_and_page(self, store: SyncStore) -> None:
+        """Test results are sorted, then paged, counting every result found."""
+        total, results = store.search("games", [], ("date_added", False), 1, 1)
+
+        assert total == 3
+        assert self.ids(results) == [2]
+        assert self.ids(store.search("games", [], ("name", True))[1]) == [1, 2, 3]
+        assert self.ids(store.search("games", [], ("id", True))[1]) == [3, 2, 1]
+        assert self.ids(store.search("games", [])[1]) == [1, 2, 3]
+
+    def test_updated_references(self, store: SyncStore) -> None:
+        """Test the references of an upserted result replace its old ones."""
+        store.save_page(
+            "games",
+            [{"id": 1, "platforms": [{"id": 3}]}],
+            SyncCursor("b", frozenset({1})),
+        )
+
+        assert self.ids(store.search("games", [("platforms", "1|3")])[1]) == [1]
+        assert self.ids(store.search("games", [("platforms", "2")])[1]) == [2]
+
+    def test_reset_references(self, store: SyncStore) -> None:
+        """Test a reset removes the references of the resource."""
+        store.reset("games")
+        store.save_page(
+            "games", [{"id": 4, "platforms": []}], SyncCursor("b", frozenset({4}))
+        )
+
+        assert store.search("games", [("platforms", "2")])[0] == 0
+
+    @pytest.mark.parametrize(
+        "field, supported",
+        (
+            ("id", True),
+            ("name", True),
+            ("platforms", True),
+            ("date_added", True),
+            ("original_release_date", True),
+            ("aliases", False),
+        ),
+    )
+    def test_can_filter(self, field: str, supported: bool) -> None:
+        """Test the fields the store can filter by."""
+        assert SyncStore.can_filter(field) is supported
@@ -0,0 +1,248 @@
+"""Tests for the PyBomb stream module."""
+import json
+from typing import Any, cast, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+from requests.models import Response as RequestsResponse
+
+from pybomb.cache import MemoryCache
+from pybomb.clients.game_client import GameClient
+from pybomb.clients.games_client import GamesClient
+from pybomb.events import CallEvent, EventHooks
+from pybomb.exceptions import InvalidResponseException
+from pybomb.records import Record
+from pybomb.stream import ResultStream
+from .catalog import FakeCatalog
+
+BODY = {
+    "error": "OK",
+    "number_of_total_results": 12345,
+    "status_code": 1,
+    "results": [{"id": id_, "name": "Pokémon" * id_} for id_ in range(10)],
+    "version": "1.0",
+}
+
+
+def chunked(body: Any, size: int) -> List[bytes]:
+    """Encode a body as JSON, split into chunks of the given size."""
+    encoded = body if isinstance(body, bytes) else json.dumps(body).encode()
+
+    return [encoded[start : start + size] for start in range(0, len(encoded), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 4096])
+def test_chunks(size: int) -> None:
+    """Test results and envelope are decoded whatever the chunks of the body."""
+    stream = ResultStream(chunked(BODY, size), lambda envelope: None)
+
+    assert list(stream) == BODY["results"]
+    assert stream.envelope == {
+        "error": "OK",
+        "number_of_total_results": 12345,
+        "status_code": 1,
+        "version": "1.0",
+    }
+    assert stream.bytes_received == len(json.dumps(BODY))
+
+
+def test_results_as_decoded() -> None:
+    """Test results are yielded before the rest of the body is received."""
+    chunks = iter(chunked(BODY, 8))
+    log = []
+    stream = iter(ResultStream(chunks, lambda envelope: log.append("validated")))
+
+    assert next(stream) == {"id": 0, "name": ""}
+    assert log == ["validated"]
+    assert len(list(chunks)) > 10
+
+
+def test_invalid_envelope() -> None:
+    """Test no results are yielded if the envelope is invalid."""
+
+    def validate(envelope: Dict[str, Any]) -> None:
+        raise InvalidResponseException(envelope["error"])
+
+    with pytest.raises(InvalidResponseException):
+        next(iter(ResultStream(chunked(BODY, 8), validate)))
+
+
+def test_envelope_after_results() -> None:
+    """Test results are held until an envelope sent after them is validated."""
+    body = {"results": [{"id": 1}, {"id": 2}], "status_code": 1}
+    log: List[Any] = []
+    stream = ResultStream(chunked(body, 4), lambda envelope: log.append(envelope))
+
+    for result in stream:
+        log.append(result)
+
+    assert log == [{"status_code": 1}, {"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize(
+    "body, results",
+    [
+        (b'{"results": {"id": 1}, "status_code": 1}', [{"id": 1}]),
+        (b' { "status_code" : 1 , "results" : [ ] } ', []),
+        (b"{}", []),
+    ],
+)
+def test_bodies(body: bytes, results: List[Any]) -> None:
+    """Test single results, whitespace and bodies without results."""
+    assert list(ResultStream(chunked(body, 2), lambda envelope: None)) == results
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"[]",
+        b'{"status_code" 1}',
+        b'{"status_code": 1 "results": []}',
+        b'{"results": [{"id": 1} {"id": 2}]}',
+        b'{1: "status_code"}',
+        b'{"results": [{"id": 1}',
+        b'{"results": [{"id": 1',
+        b'{"status_code": nul}',
+        b"",
+        b'{"results": ["\xff"]}',
+        b'{"results": ["\xc3',
+    ],
+)
+def test_invalid_json(body: bytes) -> None:
+    """Test bodies that are not valid JSON raise an error."""
+    with pytest.raises(json.JSONDecodeError):
+        list(ResultStream(chunked(body, 3), lambda envelope: None))
+
+
+@pytest.fixture
+def catalog() -> Generator[FakeCatalog, None, None]:
+    """A catalog of 5 games."""
+    catalog = FakeCatalog()
+    for id_ in range(1, 6):
+        catalog.add(id_, "2020-01-01 00:00:00", description="<p>Long</p>" * id_)
+
+    with patch.object(Session, "get", side_effect=catalog):
+        yield catalog
+
+
+@pytest.fixture
+def client() -> GamesClient:
+    """A games client streaming bodies in small chunks."""
+    client = GamesClient("key")
+    client.STREAM_CHUNK_SIZE = 16
+
+    return client
+
+
+def test_stream_search(catalog: FakeCatalog, client: GamesClient) -> None:
+    """Test every page of a search is streamed, in order."""
+    results = list(client.stream_search({}, sort_by="id", desc=False, page_size=2))
+
+    assert results == catalog.results
+    assert [call["offset"] for call in catalog.calls] == [0, 2, 4]
+
+
+def test_stream_search_records(catalog: FakeCatalog) -> None:
+    """Test streamed results are records, if the client uses them."""
+    client = GamesClient("key", records=True)
+
+    result = next(client.stream_search({}, ["name"]))
+
+    assert isinstance(result, Record)
+    assert result.name == "Result 1"
+
+
+def test_stream_search_cached(catalog: FakeCatalog) -> None:
+    """Test pages already cached are not streamed, and streamed pages not cached."""
+    client = GamesClient("key", cache=MemoryCache())
+    list(client.iter_search({}, page_size=2))
+    list(client.stream_search({}, page_size=3))
+
+    assert list(client.stream_search({}, page_size=2)) == list(
+        client.stream_search({}, page_size=3)
+    )
+    assert len(catalog.calls) == 7
+
+
+def test_stream_search_events(catalog: FakeCatalog, client: GamesClient) -> None:
+    """Test the bytes of each page are counted as they are received."""
+    events: List[CallEvent] = []
+    client._events = EventHooks([events.append])
+
+    list(client.stream_search({}))
+
+    assert events[0].bytes_received == len(catalog(client.URI_BASE, {}).content)
+    assert [phase.name for phase in events[0].phases] == [
+        "prepare",
+        "request",
+        "decode",
+    ]
+
+
+def test_stream_search_closes(catalog: FakeCatalog, client: GamesClient) -> None:
+    """Test the connection is released when the iteration is stopped early."""
+    responses: List[MagicMock] = []
+
+    def get(*args: Any, **kwargs: Any) -> MagicMock:
+        responses.append(catalog(*args, **kwargs))
+        return responses[-1]
+
+    with patch.object(Session, "get", side_effect=get):
+        results = cast(Generator, client.stream_search({}))
+        next(results)
+        results.close()
+
+    responses[0].__exit__.assert_called_once()
+
+
+def test_stream_search_closed_event(catalog: FakeCatalog, client: GamesClient) -> None:
+    """Test a stream stopped early is emitted as a call without an error."""
+    events: List[CallEvent] = []
+    client._events = EventHooks([events.append])
+
+    results = cast(Generator, client.stream_search({}))
+    next(results)
+    results.close()
+
+    assert len(events) == 1
+    assert events[0].error is None
+
+
+def test_stream_fetch(catalog: FakeCatalog) -> None:
+    """Test the details of an item are streamed, and cached details read."""
+    client = GameClient("key", cache=MemoryCache())
+    client.STREAM_CHUNK_SIZE = 16
+
+    assert client.stream_fetch(3) == catalog.results[2]
+    assert client.stream_fetch(2, ["description"]) == {"description": "<p>Long</p>" * 2}
+    client.fetch(1)
+    assert client.stream_fetch(1) == catalog.results[0]
+    assert len(catalog.calls) == 3
+
+
+def test_stream_fetch_records(catalog: FakeCatalog) -> None:
+    """Test streamed details are a record, if the client uses them."""
+    result = GameClient("key", records=True).stream_fetch(1, ["name"])
+
+    assert isinstance(result, Record)
+    assert result.name == "Result 1"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"status_code": 100, "error": "Invalid API Key", "results": []},
+        {"status_code": 1, "error": "OK", "results": []},
+    ],
+)
+def test_stream_search_invalid(body: Dict[str, Any], client: GamesClient) -> None:
+    """Test an error, or an envelope without a total, is raised."""
+    response = MagicMock(RequestsResponse)
+    response.status_code = 200
+    response.__enter__.return_value = response
+    response.iter_content.return_value = chunked(body, 16)
+
+    with patch.object(Session, "get", return_value=response):
+        with pytest.raises(InvalidResponseException):
+            list(client.stream_search({}))
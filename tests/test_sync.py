@@ -0,0 +1,158 @@
+"""Tests for the PyBomb sync module."""
+from pathlib import Path
+from typing import Any, Dict, Generator
+from unittest.mock import patch
+
+import pytest
+from requests import Session
+
+from pybomb.cache import MemoryCache
+from pybomb.clients.games_client import GamesClient
+from pybomb.clients.platforms_client import PlatformsClient
+from pybomb.store import SyncCursor, SyncStatus, SyncStore
+from pybomb.sync import SyncEngine
+from .catalog import FakeCatalog
+
+
+@pytest.fixture
+def catalog() -> Generator[FakeCatalog, None, None]:
+    """A catalog of 7 results, 3 of them updated at the same time."""
+    catalog = FakeCatalog()
+    for id_, day in enumerate((1, 2, 2, 2, 3, 4, 5)):
+        catalog.add(id_, f"2020-01-0{day} 00:00:00")
+
+    with patch.object(Session, "get", side_effect=catalog):
+        yield catalog
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SyncStore, None, None]:
+    """An empty store."""
+    store = SyncStore(str(tmp_path / "mirror.db"))
+    yield store
+    store.close()
+
+
+def stored_game(store: SyncStore, id_: int) -> Dict[str, Any]:
+    """Get a stored game, failing if it is not stored."""
+    game = store.get("games", id_)
+    assert game is not None
+
+    return game
+
+
+class TestSyncEngine:
+    """Tests for the SyncEngine class."""
+
+    def test_full_load(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test the first sync loads every result, page by page."""
+        result = SyncEngine(store, page_size=3).sync(GamesClient("key"))
+
+        assert result.resource == "games"
+        assert result.fetched == 7
+        assert result.pages == 5
+        assert result.complete
+        assert result.cursor == SyncCursor("2020-01-05 00:00:00", frozenset({6}))
+        assert store.count("games") == 7
+        assert catalog.calls[0]["sort"] == "date_last_updated:asc"
+        assert not catalog.calls[0]["filter"]
+        assert catalog.calls[1]["filter"] == (
+            "date_last_updated:2020-01-02 00:00:00|9999-12-31 23:59:59"
+        )
+        assert catalog.calls[1]["offset"] == 0
+        assert catalog.calls[3]["offset"] == 3
+
+    def test_delta(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test later syncs fetch only the results changed since the last."""
+        engine = SyncEngine(store, page_size=3)
+        engine.sync(GamesClient("key"))
+        catalog.add(1, "2020-02-01 00:00:00")
+        catalog.add(10, "2020-02-02 00:00:00")
+        catalog.calls.clear()
+
+        result = engine.sync(GamesClient("key"))
+
+        assert result.fetched == 2
+        assert result.pages == 2
+        assert store.count("games") == 8
+        assert stored_game(store, 1)["date_last_updated"] == "2020-02-01 00:00:00"
+        assert catalog.calls[0]["offset"] == 0
+
+    def test_delta_updated_at_watermark(self, store: SyncStore) -> None:
+        """Test results stored at the watermark and since updated are not skipped."""
+        catalog = FakeCatalog()
+        for id_, day in enumerate((1, 2, 3, 5, 5)):
+            catalog.add(id_, f"2020-01-0{day} 00:00:00")
+        engine = SyncEngine(store, page_size=3)
+
+        with patch.object(Session, "get", side_effect=catalog):
+            engine.sync(GamesClient("key"))
+            catalog.add(3, "2020-01-06 00:00:00")
+            catalog.add(10, "2020-01-07 00:00:00")
+            result = engine.sync(GamesClient("key"))
+
+        assert result.fetched == 2
+        assert stored_game(store, 3)["date_last_updated"] == "2020-01-06 00:00:00"
+        assert store.get("games", 10) is not None
+
+    def test_bypasses_cache(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test every page is fetched from the GB API, even with a cache."""
+        client = GamesClient("key", cache=MemoryCache())
+        engine = SyncEngine(store, page_size=10)
+        engine.sync(client)
+        engine.sync(client)
+        catalog.add(10, "2020-02-01 00:00:00")
+
+        result = engine.sync(client)
+
+        assert result.fetched == 1
+        assert len(catalog.calls) == 3
+
+    def test_no_changes(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test a sync without changes makes a single call."""
+        engine = SyncEngine(store, page_size=3)
+        engine.sync(PlatformsClient("key"))
+        catalog.calls.clear()
+
+        result = engine.sync(PlatformsClient("key"))
+
+        assert result.fetched == 0
+        assert len(catalog.calls) == 1
+        assert store.count("platforms") == 7
+
+    def test_resumes(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test a sync stopped part way carries on from the last page."""
+        engine = SyncEngine(store, page_size=2, clock=lambda: 100.0)
+
+        first = engine.sync(GamesClient("key"), max_pages=2)
+        status = store.status("games")
+        second = engine.sync(GamesClient("key"))
+
+        assert not first.complete
+        assert first.fetched == 3
+        assert first.cursor == SyncCursor("2020-01-02 00:00:00", frozenset({1, 2}))
+        assert status is None
+        assert second.complete
+        assert second.fetched == 4
+        assert store.status("games") == SyncStatus(100.0, None)
+        assert store.count("games") == 7
+
+    def test_return_fields(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test the ID and update date are always stored."""
+        SyncEngine(store, page_size=10).sync(GamesClient("key"), ["name"])
+
+        assert catalog.calls[0]["field_list"] == "id,date_last_updated,name"
+        status = store.status("games")
+        assert status is not None
+        assert status.fields == ("id", "date_last_updated", "name")
+        assert store.get("games", 0) == {
+            "id": 0,
+            "date_last_updated": "2020-01-01 00:00:00",
+            "name": "Result 0",
+        }
+
+    def test_records(self, catalog: FakeCatalog, store: SyncStore) -> None:
+        """Test results of clients returning records are stored as dicts."""
+        SyncEngine(store).sync(GamesClient("key", records=True), ["name"])
+
+        assert stored_game(store, 6)["name"] == "Result 6"
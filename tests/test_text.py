@@ -0,0 +1,107 @@
+"""Tests for the PyBomb text module."""
+from typing import Any, cast, Dict, Generator, Iterator, List
+from unittest.mock import patch
+
+from requests import Session
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.text import _extract_batch, extract_text, ExtractedText, TextExtractor
+from .catalog import FakeCatalog
+
+DESCRIPTION = (
+    "<h2>Overview</h2><p>Catch &amp; trade   <a href='/pokemon/3005-1/'>Pokémon</a>"
+    " with <a href='https://example.com/link'>friends</a>.</p>"
+    "<script>var x = 1;</script><p>See <a href='/pokemon/3005-1/'>them</a>"
+    " <a href='#top'>again</a>.<br>Twice</p>"
+)
+
+
+def test_extract_text() -> None:
+    """Test HTML is converted to text, with a line per block, and links extracted."""
+    assert extract_text(DESCRIPTION) == ExtractedText(
+        "Overview\nCatch & trade Pokémon with friends.\nSee them again.\nTwice",
+        [
+            "overview",
+            "catch",
+            "trade",
+            "pokémon",
+            "with",
+            "friends",
+            "see",
+            "them",
+            "again",
+            "twice",
+        ],
+        ["https://www.giantbomb.com/pokemon/3005-1/", "https://example.com/link"],
+    )
+
+
+def test_extract_text_relative_links() -> None:
+    """Test links are kept as they are without a base URL."""
+    extracted = extract_text(DESCRIPTION, base_url=None)
+
+    assert extracted.links == ["/pokemon/3005-1/", "https://example.com/link"]
+
+
+def test_extract_batch() -> None:
+    """Test the fields of a batch are extracted, skipping those without HTML."""
+    assert _extract_batch(["<p>One</p>", None, ""], None) == [
+        ExtractedText("One", ["one"], []),
+        None,
+        None,
+    ]
+
+
+def game(id_: int, **fields: Any) -> Dict[str, Any]:
+    """Create a game with a description."""
+    return {"id": id_, "description": f"<p>Game {id_}</p>", **fields}
+
+
+def test_extract() -> None:
+    """Test the fields of each result are extracted, in order."""
+    results = [game(id_) for id_ in range(7)]
+    results[3] = {"id": 3, "deck": "<p>Deck</p>"}
+
+    extractor = TextExtractor(["description", "deck"], workers=2, batch_size=2)
+    extracted = list(extractor.extract(results))
+
+    assert [item.result for item in extracted] == results
+    assert extracted[0].fields == {
+        "description": ExtractedText("Game 0", ["game", "0"], [])
+    }
+    assert extracted[3].fields == {"deck": ExtractedText("Deck", ["deck"], [])}
+    assert list(TextExtractor().extract([])) == []
+
+
+def test_backpressure() -> None:
+    """Test results are only read from the stream as batches finish."""
+    read: List[int] = []
+
+    def results() -> Iterator[Dict[str, Any]]:
+        for id_ in range(100):
+            read.append(id_)
+            yield game(id_)
+
+    extractor = TextExtractor(workers=1, batch_size=2, max_pending=2)
+    extracted = cast(Generator, extractor.extract(results()))
+    next(extracted)
+    extracted.close()
+
+    assert len(read) == 6
+
+
+def test_extract_search() -> None:
+    """Test the results of a search are extracted as they are found."""
+    catalog = FakeCatalog()
+    for id_ in range(1, 6):
+        catalog.add(id_, "2020-01-01 00:00:00", description="<p>Long</p>" * id_)
+
+    with patch.object(Session, "get", side_effect=catalog):
+        results = GamesClient("key").iter_search(
+            {}, sort_by="id", desc=False, page_size=2
+        )
+        extracted = list(TextExtractor(workers=2).extract(results))
+
+    assert [item.fields["description"].text for item in extracted] == [
+        "\n".join(["Long"] * id_) for id_ in range(1, 6)
+    ]
@@ -0,0 +1,79 @@
+"""Tests for the PyBomb tracing module."""
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+
+from pybomb.events import CallEvent, Phase
+from pybomb.tracing import OpenTelemetryListener
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    """An exporter holding the finished spans."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def listener(exporter: InMemorySpanExporter) -> OpenTelemetryListener:
+    """A listener recording spans to the exporter."""
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    return OpenTelemetryListener(provider.get_tracer("tests"))
+
+
+def test_spans(listener: OpenTelemetryListener, exporter: InMemorySpanExporter) -> None:
+    """Test a call is recorded as a span, with a child span per phase."""
+    listener(
+        CallEvent(
+            "games",
+            1000.0,
+            0.5,
+            (Phase("prepare", 1000.0, 0.1), Phase("request", 1000.1, 0.4)),
+            200,
+            512,
+            False,
+            1,
+            None,
+        )
+    )
+
+    prepare, request, call = exporter.get_finished_spans()
+    assert call.name == "pybomb games"
+    assert call.kind == SpanKind.CLIENT
+    assert call.start_time == 1_000_000_000_000
+    assert call.end_time == 1_000_500_000_000
+    assert call.attributes == {
+        "pybomb.resource": "games",
+        "pybomb.bytes_received": 512,
+        "pybomb.cache_hit": False,
+        "pybomb.retries": 1,
+        "pybomb.coalesced": False,
+        "http.status_code": 200,
+    }
+    assert prepare.name == "prepare"
+    assert prepare.parent is not None
+    assert prepare.parent.span_id == call.context.span_id
+    assert request.end_time == 1_000_500_000_000
+
+
+def test_error_spans(
+    listener: OpenTelemetryListener, exporter: InMemorySpanExporter
+) -> None:
+    """Test failed calls are recorded as errors, without a status code."""
+    listener(CallEvent("game", 1000.0, 0.1, (), None, 0, False, 0, ValueError("bad")))
+
+    (call,) = exporter.get_finished_spans()
+    assert call.status.status_code == StatusCode.ERROR
+    assert call.attributes is not None
+    assert "http.status_code" not in call.attributes
+    assert call.events[0].name == "exception"
+
+
+def test_global_tracer() -> None:
+    """Test the global tracer is used by default."""
+    assert OpenTelemetryListener()._tracer is not None
@@ -0,0 +1,17 @@
+"""Tests for the PyBomb version module."""
+from unittest.mock import patch
+
+from pybomb.clients.games_client import GamesClient
+from pybomb.version import get_version
+
+
+def test_version_is_resolved_once() -> None:
+    """Test the version metadata is not read again as clients are created."""
+    version = get_version()
+
+    with patch("pybomb.version.version") as read_version:
+        clients = [GamesClient("key") for _ in range(3)]
+
+    read_version.assert_not_called()
+    for client in clients:
+        assert client._headers["User-Agent"] == f"Pybomb {version}"